@@ -37,7 +37,7 @@ from core.artifacts import ARTIFACT_CSP, NOT_FOUND_HTML, resolve, serving_base,
 from core.compaction import effective_window
 from core.config import CompactionConfig
 from core.config_store import ConfigStore
-from core.goal_decomposition import classify_complexity, decompose_goal
+from core.goal_decomposition import plan_if_complex
 from core.llm import LLMClient, get_sent_payload
 from core.log_streams import current_stream, current_subagent
 from core.prompt_builder import (
@@ -384,6 +384,10 @@ class AgentState:
     def __init__(self, agent: AgentCore | None = None, status: str = "STOPPED"):
         self.agent: AgentCore | None = agent
         self.status: str = status
+        # In-flight start (warmup or /agent/start); concurrent starts share it.
+        self.start_task: asyncio.Task | None = None
+        # In-flight restart; holds the lifecycle restart lock while it runs.
+        self.restart_task: asyncio.Task | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -1719,7 +1723,11 @@ def create_admin_app(
             # even when no agent is running to have migrated it on startup.
             from core.memory import MemoryStore
 
-            await MemoryStore(db_path=memory_db)._ensure_schema()
+            memory = MemoryStore(db_path=memory_db)
+            try:
+                await memory._ensure_schema()
+            finally:
+                await memory.close()
             cols = (
                 "id, category, subject, content, source, confidence, created_at, updated_at, scope"
             )
@@ -1798,9 +1806,7 @@ def create_admin_app(
         agent = agent_state.agent
         if agent and agent.job_store:
             return agent.job_store
-        from core.job_store import JobStore
-
-        return JobStore(db_path="data/jobs.db")
+        return _admin_job_store()
 
     def _get_jobs_list(include_done: bool = False) -> list[dict]:
         """Build a list of job dicts from the JobStore + APScheduler next_run times.
@@ -2151,10 +2157,12 @@ def create_admin_app(
                 agent._default_accounts = agent._build_default_accounts(new_config)
                 agent.llm = LLMClient.from_agent_config(new_config.agent)
                 agent.llm.temperature = new_config.agent.temperature  # #12: live temp update
+                agent._plan_cache.clear()  # cached plans were built against the old config
                 agent.executor.tool_env = tool_env(new_config)
                 agent.history_mode = new_config.history.mode
                 mem_cfg = new_config.memory
                 agent.memory.long_term_limit = mem_cfg.long_term_limit
+                agent.memory.short_term_limit = mem_cfg.short_term_limit
                 # Rebuild the embedder (lazy — no model load here) and refresh the
                 # Tier 3/4 lifecycle knobs so memory config changes apply live.
                 agent.memory.embedder = agent._build_embedder()
@@ -2226,10 +2234,15 @@ def create_admin_app(
             else:
                 from core.memory import MemoryStore
 
-                memories = await MemoryStore(
+                memory = MemoryStore(
                     db_path=config.memory.db_path,
                     long_term_limit=config.memory.long_term_limit,
-                ).format_for_prompt(query=query)
+                    short_term_limit=config.memory.short_term_limit,
+                )
+                try:
+                    memories = await memory.format_for_prompt(query=query)
+                finally:
+                    await memory.close()
 
         reflections = ""
         if body.include_reflections and config.task_reflection.enabled:
@@ -2260,9 +2273,7 @@ def create_admin_app(
                         ),
                     )
                 gd_model = config.goal_decomposition.model
-                is_complex = await classify_complexity(llm, gd_model, message)
-                if is_complex:
-                    decomposed_goal = await decompose_goal(llm, gd_model, message)
+                decomposed_goal = await plan_if_complex(llm, gd_model, message)
             except Exception:
                 log.exception("Prompt preview decomposition failed")
 
@@ -3010,7 +3021,11 @@ def create_admin_app(
         from core.memory import MemoryStore
 
         memory_db = await config_store.get("memory.db_path") or "data/memory.db"
-        await MemoryStore(db_path=memory_db).rename_scope(old, new)
+        memory = MemoryStore(db_path=memory_db)
+        try:
+            await memory.rename_scope(old, new)
+        finally:
+            await memory.close()
         await _get_job_store().rename_agent(old, new)
         await store.rename(old, new)
         # Re-register live scheduler jobs so a renamed agent's cron/once jobs fire
@@ -3018,6 +3033,9 @@ def create_admin_app(
         # channels still need a restart (they are created at startup).
         agent = agent_state.agent
         if agent is not None:
+            # The rename went through another store; drop the running agent's
+            # cached prompt sections so they stop showing the old scope.
+            agent.memory.invalidate_prompt_cache()
             await agent.scheduler.load_jobs()
         return await _agents_partial()
 
@@ -3214,6 +3232,8 @@ def create_admin_app(
             await db.commit()
             if cursor.rowcount == 0:
                 raise HTTPException(404, f"Memory {memory_id} not found in {tier}")
+        # Deleted behind the store's back; don't keep injecting it from the cache.
+        agent.memory.invalidate_prompt_cache()
 
         # Return refreshed memory partial (full config + tables)
         return await _render_memory_partial()
@@ -3999,11 +4019,52 @@ async def _agent_store_from_config(config_store: ConfigStore):
     return AgentStore(db_path=db_path, seed_dir=seed_dir, default_identity=default_identity)
 
 
+# The ConversationHistory for the configured db path: it holds a long-lived
+# connection, so admin requests reuse it instead of opening one per request.
+# Keyed by path so a changed ``history.db_path`` swaps (and closes) it.
+_HISTORY_STORES: dict[str, Any] = {}
+
+
 async def _history_from_config(config_store: ConfigStore):
     from core.history import ConversationHistory
 
     db_path = await config_store.get("history.db_path") or "data/history.db"
-    return ConversationHistory(db_path=db_path)
+    history = _HISTORY_STORES.get(db_path)
+    if history is None:
+        await close_history_stores()
+        history = _HISTORY_STORES[db_path] = ConversationHistory(db_path=db_path)
+    return history
+
+
+async def close_history_stores() -> None:
+    """Close the admin app's cached history connection (on path change / shutdown)."""
+    while _HISTORY_STORES:
+        _path, history = _HISTORY_STORES.popitem()
+        await history.close()
+
+
+# The JobStore the admin app uses while no agent is running. It opens a writer
+# and a reader pool, so it is kept for reuse and closed at shutdown.
+_JOB_STORES: dict[str, Any] = {}
+
+
+def _admin_job_store(db_path: str = "data/jobs.db"):
+    from core.job_store import JobStore
+
+    # Resolved now, so the cached store keeps pointing at the same file.
+    path = str(Path(db_path).resolve())
+    store = _JOB_STORES.get(path)
+    if store is None:
+        store = _JOB_STORES[path] = JobStore(db_path=path)
+    return store
+
+
+async def close_admin_stores() -> None:
+    """Close the admin app's cached history and job stores (app shutdown)."""
+    await close_history_stores()
+    while _JOB_STORES:
+        _path, store = _JOB_STORES.popitem()
+        await store.close()
 
 
 # Config keys the running agent only reads at startup, so a change to them via
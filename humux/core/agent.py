@@ -12,9 +12,10 @@ import shlex
 import time
 import uuid
 from collections import OrderedDict, deque
+from collections.abc import Coroutine
 from datetime import datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from zoneinfo import ZoneInfo
 
 from tavily import TavilyClient
@@ -25,7 +26,7 @@ from core.compaction import compact_messages, should_compact
 from core.config import Config
 from core.embeddings import LOCAL_PROVIDERS, EmbeddingClient, LocalEmbeddingClient
 from core.executor import ToolExecutor
-from core.goal_decomposition import DecomposedGoal, classify_complexity, decompose_goal
+from core.goal_decomposition import DecomposedGoal, plan_if_complex
 from core.history import ConversationHistory
 from core.imagegen import ImageBudget
 from core.job_store import JobStore
@@ -60,7 +61,11 @@ from core.subagents import (
 )
 from core.task_reflection import ReflectionStore
 from core.tools import _gh_app_configured, effective_tool_env, github_repo_violation, tool_env
-from voice.pipeline import VoicePipeline
+
+if TYPE_CHECKING:
+    # Annotation only: importing it loads faster-whisper and edge-tts, which
+    # main.py defers until voice is actually enabled.
+    from voice.pipeline import VoicePipeline
 
 log = logging.getLogger(__name__)
 
@@ -89,6 +94,14 @@ def _narrow_gh_repos(parent: Agent | None, requested_tc: dict) -> dict:
 # hash so repeated identical images don't re-hit the vision model.
 _VISION_CACHE_MAX = 256
 
+# Goal-decomposition plan cache cap (per process). Plans are keyed by the
+# normalized user message so a repeated planning request ("plan my standup")
+# skips both the classifier and the decomposition LLM calls. Entries expire
+# after _PLAN_CACHE_TTL seconds, since tools, skills and config change at
+# runtime and a plan built against the old set would otherwise never refresh.
+_PLAN_CACHE_MAX = 512
+_PLAN_CACHE_TTL = 600.0
+
 # Max characters a single folded run of silent group turns (#30) may reach
 # before a fresh turn is started, so a busy never-addressed room can't grow one
 # history row without bound. ponytail: generous char cap; raise if one
@@ -1019,6 +1032,7 @@ class AgentCore:
         self.memory = MemoryStore(
             db_path=mem_cfg.db_path,
             long_term_limit=mem_cfg.long_term_limit,
+            short_term_limit=mem_cfg.short_term_limit,
             embedder=self._build_embedder(),
             injection_top_k=mem_cfg.embedding.injection_top_k,
             recall_top_k=mem_cfg.embedding.recall_top_k,
@@ -1034,6 +1048,9 @@ class AgentCore:
             max_reflections=config.task_reflection.max_reflections,
         )
         self.channels: dict = {}
+        # Set by core.main while Telegram bots connect in the background; each
+        # bot is added to ``channels`` once it is polling.
+        self.channel_startup: asyncio.Future | None = None
         self.voice: VoicePipeline | None = None
         self.job_store = JobStore(db_path="data/jobs.db")
         self.scheduler = AgentScheduler(self, self.job_store)
@@ -1044,12 +1061,22 @@ class AgentCore:
         self.prompt_capture: deque[dict[str, str]] = deque(maxlen=20)
         # Vision fallback caption cache (image hash -> "[Image: ...]"), LRU-bounded.
         self._vision_cache: OrderedDict[str, str] = OrderedDict()
+        # Goal-decomposition plans (normalized message hash -> (cached at, plan)),
+        # LRU-bounded and expiring after _PLAN_CACHE_TTL.
+        self._plan_cache: OrderedDict[str, tuple[float, DecomposedGoal]] = OrderedDict()
         # Reply-decision rate-limit backstop (#36): recent auto-reply timestamps
         # per (channel, chat_id). In-memory, resets on restart — a runaway loop
         # is transient, so persistence would be over-engineering.
         # ponytail: unbounded keys if you have thousands of distinct chats;
         # prune oldest keys if that ever shows up in memory.
         self._reply_times: dict[tuple[str, str], list[float]] = {}
+        # Fire-and-forget post-turn work (memory extraction, task reflection).
+        # The event loop only holds weak references to tasks, so keep them here
+        # until they finish; otherwise one can be garbage-collected mid-run.
+        self._background_tasks: set[asyncio.Task] = set()
+        # SDK client per background provider other than the main one, with the
+        # (api_key, base_url) it was built from; see _background_llm.
+        self._background_clients: dict[str, tuple[tuple[str, str | None], LLMClient]] = {}
 
         # Web search (Tavily)
         if config.search.enabled and config.search.api_key:
@@ -1917,20 +1944,21 @@ class AgentCore:
         # store an empty assistant turn: some providers reject empty content on the
         # next replay, and the coalescer folds the resulting adjacent user turns (#70).
         history_message = self._history_message_text(message, attachments)
-        await self.history.add_turn(channel, user_id, "user", history_message, chat_id)
+        turns = [("user", history_message)]
         if final_text:
-            await self.history.add_turn(channel, user_id, "assistant", final_text, chat_id)
+            turns.append(("assistant", final_text))
+        await self.history.add_turns(channel, user_id, turns, chat_id)
 
         # Automatic memory extraction
         if channel != "system":
-            asyncio.create_task(
+            self._spawn_background(
                 self._extract_memories(message, final_text, agent),
                 name=f"memory-extract-{user_id}",
             )
 
         # Automatic task reflection (when tools were used)
         if channel != "system" and self.config.task_reflection.enabled and tool_log:
-            asyncio.create_task(
+            self._spawn_background(
                 self._reflect_on_task(message, final_text, tool_log),
                 name=f"task-reflect-{user_id}",
             )
@@ -2082,14 +2110,14 @@ class AgentCore:
 
         # Automatic memory extraction
         if channel != "system":
-            asyncio.create_task(
+            self._spawn_background(
                 self._extract_memories(message, final_text, agent),
                 name=f"memory-extract-{user_id}",
             )
 
         # Automatic task reflection (when tools were used)
         if channel != "system" and self.config.task_reflection.enabled and tool_log:
-            asyncio.create_task(
+            self._spawn_background(
                 self._reflect_on_task(message, final_text, tool_log),
                 name=f"task-reflect-{user_id}",
             )
@@ -2749,6 +2777,24 @@ class AgentCore:
 
         return await self.executor.run_command_trusted(command)
 
+    async def get_channel(self, name: str):
+        """Return the named channel (or None) for an outbound send.
+
+        While bots are still connecting after a start, a channel that isn't
+        registered yet is waited for instead of reported missing.
+        """
+        startup = self.channel_startup
+        if name not in self.channels and startup is not None and not startup.done():
+            try:
+                await asyncio.shield(startup)
+            except asyncio.CancelledError:
+                # The startup itself was cancelled (a stop gave up on a stuck
+                # bot); only our own cancellation propagates.
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+        return self.channels.get(name)
+
     async def _tool_send_message(self, params: dict) -> dict:
         """Send a message via a registered channel."""
         channel_name = params["channel"]
@@ -2756,7 +2802,7 @@ class AgentCore:
         text = params["text"]
         log.info("Tool call: send_message — channel=%s to=%s", channel_name, to)
 
-        channel = self.channels.get(channel_name)
+        channel = await self.get_channel(channel_name)
         if not channel:
             return {"error": f"Channel '{channel_name}' is not enabled."}
 
@@ -2784,7 +2830,7 @@ class AgentCore:
             return {"error": "Missing 'emoji'."}
         if not (chat_id and message_id):
             return {"error": "No message to react to in this context."}
-        channel = self.channels.get(channel_name)
+        channel = await self.get_channel(channel_name)
         react = getattr(channel, "react", None) if channel else None
         if not callable(react):
             return {"error": f"Channel '{channel_name}' does not support reactions."}
@@ -2927,7 +2973,7 @@ class AgentCore:
             + ".\nAdd it securely via this link (no value over chat):\n"
             + link
         )
-        ch = self.channels.get(channel)
+        ch = await self.get_channel(channel)
         if ch is None:
             return
         try:
@@ -3595,7 +3641,7 @@ class AgentCore:
         if digest and digest.strip() and digest.strip() != notification.strip():
             framed = f"{notification}\n\n<subagent_digest>\n{digest}\n</subagent_digest>"
         await self._record_subagent_context(channel, user_id, chat_id, framed)
-        ch = self.channels.get(channel)
+        ch = await self.get_channel(channel)
         if ch and chat_id and notification:
             try:
                 await ch.send(chat_id, notification)
@@ -3909,8 +3955,13 @@ class AgentCore:
         Creates a pending approval future, sends the prompt, and waits.
         Returns one of ``"approved"``, ``"denied"``, or ``"skipped"``.
         """
-        ch = self.channels.get(channel)
+        ch = await self.get_channel(channel)
         if not ch:
+            if channel == "telegram" or channel.startswith("telegram:"):
+                # A bot that should be there but never connected: fail closed
+                # rather than run the action without asking (#79).
+                log.warning("Channel %r not connected; skipping action (fail-closed)", channel)
+                return "skipped"
             # No channel available to ask — auto-approve (e.g. admin API)
             log.warning("No channel %r for approval, auto-approving", channel)
             return "approved"
@@ -3955,6 +4006,34 @@ class AgentCore:
             self.permissions._pending.pop(request_id, None)
             return "skipped"
 
+    def _spawn_background(self, coro: Coroutine[Any, Any, None], name: str) -> asyncio.Task:
+        """Start *coro* as a tracked fire-and-forget task.
+
+        The task is held in ``_background_tasks`` until it completes. The
+        coroutines spawned here log and swallow their own errors.
+        """
+        task = asyncio.create_task(coro, name=name)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def drain_background(self, timeout: float = 10.0) -> None:
+        """Wait for in-flight post-turn tasks on shutdown.
+
+        Whatever is still running after *timeout* seconds is cancelled, so a
+        slow extraction LLM call can't hold up a stop or restart. The cancelled
+        tasks are awaited before returning; a store write already handed to a
+        worker thread still completes, and the stores' ``close()`` waits for it.
+        """
+        if not self._background_tasks:
+            return
+        _done, pending = await asyncio.wait(list(self._background_tasks), timeout=timeout)
+        if pending:
+            log.warning("Cancelling %d background task(s) still running at stop", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
     async def _extract_memories(
         self, user_msg: str, agent_msg: str, agent: Agent | None = None
     ) -> None:
@@ -3999,21 +4078,50 @@ class AgentCore:
         """Return an LLM client for background tasks (memory, reflection, etc.).
 
         Background tasks carry their own thinking level, independent of the
-        main inference one. When the provider matches the main client we clone
-        it (sharing the underlying SDK connection) and override only the level;
-        otherwise a fresh client is built from the stored credentials.
+        main inference one. The returned client is a clone that shares the
+        underlying SDK connection pool and overrides only the level. When the
+        provider matches the main client that pool is the main one; otherwise
+        one client built from the stored credentials is kept per provider, so
+        per-turn extraction reuses its keep-alive connections. A credential
+        change replaces it and closes the old client's pool.
         """
         if provider == self.llm.provider:
-            clone = copy.copy(self.llm)
-            clone.thinking_level = (thinking_level or "").strip().lower()
-            return clone
-        cfg = self.config.agent
-        return LLMClient(
-            provider=provider,
-            api_key=getattr(cfg, f"{provider}_api_key", ""),
-            base_url=getattr(cfg, f"{provider}_base_url", None),
-            thinking_level=thinking_level,
-        )
+            base = self.llm
+        else:
+            cfg = self.config.agent
+            creds = (
+                getattr(cfg, f"{provider}_api_key", ""),
+                getattr(cfg, f"{provider}_base_url", None),
+            )
+            cached = self._background_clients.get(provider)
+            if cached is not None and cached[0] == creds:
+                base = cached[1]
+            else:
+                base = LLMClient(provider=provider, api_key=creds[0], base_url=creds[1])
+                self._background_clients[provider] = (creds, base)
+                if cached is not None:
+                    # Tasks already running may hold a clone of the old client.
+                    in_flight = set(self._background_tasks)
+                    self._spawn_background(
+                        self._close_llm_client(cached[1], in_flight),
+                        name=f"close-{provider}-client",
+                    )
+        clone = copy.copy(base)
+        clone.thinking_level = (thinking_level or "").strip().lower()
+        return clone
+
+    @staticmethod
+    async def _close_llm_client(client: LLMClient, in_flight: set[asyncio.Task]) -> None:
+        """Close a replaced SDK client's HTTP pool (runs as a background task)
+        once the background tasks that were running at the swap have finished."""
+        try:
+            if in_flight:
+                await asyncio.wait(in_flight)
+        finally:
+            try:
+                await client._client.close()
+            except Exception:
+                log.exception("Failed to close replaced %s client", client.provider)
 
     def _build_embedder(self):
         """Construct the embedding client for semantic memory, if enabled.
@@ -4102,24 +4210,30 @@ class AgentCore:
         Returns None if the message is simple or decomposition fails/is disabled.
         """
         gd_cfg = self.config.goal_decomposition
-        llm = self._background_llm(gd_cfg.provider, gd_cfg.thinking_level)
-
-        try:
-            is_complex = await classify_complexity(llm, gd_cfg.model, message)
-        except Exception:
-            log.exception("Goal complexity classification failed")
-            return None
-
-        if not is_complex:
-            log.debug("Message classified as SIMPLE, skipping decomposition")
-            return None
+        normalized = " ".join(message.lower().split())
+        key = hashlib.blake2b(f"{gd_cfg.model}\0{normalized}".encode(), digest_size=16).hexdigest()
+        now = time.monotonic()
+        cached = self._plan_cache.get(key)
+        if cached is not None:
+            if now - cached[0] < _PLAN_CACHE_TTL:
+                self._plan_cache.move_to_end(key)
+                log.debug("Reusing cached decomposition for repeated request")
+                return cached[1]
+            del self._plan_cache[key]
 
-        log.info("Message classified as COMPLEX, decomposing...")
+        llm = self._background_llm(gd_cfg.provider, gd_cfg.thinking_level)
         try:
-            return await decompose_goal(llm, gd_cfg.model, message)
+            plan = await plan_if_complex(llm, gd_cfg.model, message)
         except Exception:
             log.exception("Goal decomposition failed")
             return None
+        # Only real plans are cached: None also covers transient LLM failures,
+        # which must not pin a message to "simple" for the life of the process.
+        if plan is not None:
+            self._plan_cache[key] = (now, plan)
+            if len(self._plan_cache) > _PLAN_CACHE_MAX:
+                self._plan_cache.popitem(last=False)
+        return plan
 
     async def _reflect_on_task(self, user_msg: str, agent_msg: str, tool_log: list[dict]) -> None:
         """Run task reflection in the background after tool-use.
@@ -243,6 +243,7 @@ class EmbeddingConfig(BaseModel):
 class MemoryConfig(BaseModel):
     db_path: str = "data/memory.db"
     long_term_limit: int = 50
+    short_term_limit: int = 100  # max active short-term memories injected into prompt
     extraction_provider: str = "deepseek"
     extraction_model: str = "deepseek-v4-flash"
     consolidation_provider: str = "deepseek"
@@ -196,6 +196,9 @@ class ConfigStore:
         # Optional infra-vault resolver (name -> str | None), attached at boot so
         # Himalaya materialisation can expand ${vault:NAME} email passwords (#110).
         self.vault_resolve = None
+        # Bumped on every write through this store, so callers can tell whether
+        # an exported Config is still current without re-reading the table.
+        self.data_version = 0
 
     async def _ensure_schema(self) -> None:
         if self._ready:
@@ -264,6 +267,7 @@ class ConfigStore:
                 (key, value),
             )
             await db.commit()
+        self.data_version += 1
         if _email_keys_changed([key]):
             await materialize_himalaya_config(self)
 
@@ -278,6 +282,7 @@ class ConfigStore:
                     (key, str(value)),
                 )
             await db.commit()
+        self.data_version += 1
         if _email_keys_changed(list(values.keys())):
             await materialize_himalaya_config(self)
 
@@ -288,6 +293,8 @@ class ConfigStore:
             cursor = await db.execute("DELETE FROM config WHERE key = ?", (key,))
             await db.commit()
             deleted = cursor.rowcount > 0
+        if deleted:
+            self.data_version += 1
         if deleted and _email_keys_changed([key]):
             await materialize_himalaya_config(self)
         return deleted
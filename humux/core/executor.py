@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
+import re
 import shlex
 import shutil
 import sys
@@ -13,8 +15,13 @@ from pathlib import Path
 from core.email_config import himalaya_env
 
 
+@functools.cache
 def _find_wacli_bin() -> str:
-    """Locate the wacli binary — works in Docker and local dev."""
+    """Locate the wacli binary — works in Docker and local dev.
+
+    Resolved once per process: ``run_command`` consults it on every wacli call
+    and the lookup (env, ``shutil.which``, ``~/go/bin``) only changes on restart.
+    """
     env = os.getenv("WACLI_BIN")
     if env and Path(env).exists():
         return env
@@ -28,6 +35,22 @@ def _find_wacli_bin() -> str:
     return "wacli"  # fallback — let the shell try PATH
 
 
+@functools.cache
+def _local_tools_dir() -> str | None:
+    """Directory to rewrite ``/app/tools/`` to, or None to leave paths alone.
+
+    None in Docker (``/app/tools`` exists) or when the checkout has no tools
+    dir; otherwise the repo's ``tools/``. Cached so the per-command rewrite is
+    pure string work with no stat calls.
+    """
+    if Path("/app/tools").exists():
+        return None
+    local_tools_dir = Path(__file__).resolve().parents[1] / "tools"
+    if not local_tools_dir.exists():
+        return None
+    return f"{local_tools_dir}/"
+
+
 class ToolExecutor:
     """Executes CLI commands on behalf of the LLM."""
 
@@ -35,6 +58,9 @@ class ToolExecutor:
         # Extra environment for optional tools (e.g. GH_TOKEN for `gh`).
         # Injected into every spawned subprocess; updated on config reload.
         self.tool_env: dict[str, str] = dict(tool_env or {})
+        # Process env merged with himalaya's config paths, built on the first
+        # himalaya command and handed to every later one as-is (never mutated).
+        self._himalaya_env: dict[str, str] | None = None
 
     ALLOWED_PREFIXES = [
         "curl",
@@ -54,6 +80,16 @@ class ToolExecutor:
         "yt-dlp",
         "cal",
     ]
+    # One anchored alternation over every prefix, compiled once: the segment
+    # check below runs per pipeline segment of every LLM-issued command. Plain
+    # prefix semantics, same as ``str.startswith`` (no word boundary).
+    _ALLOWED_PREFIX_RE = re.compile("|".join(map(re.escape, ALLOWED_PREFIXES)))
+    # Rejection text, rendered once rather than on every refused command.
+    _NOT_ALLOWED_ERROR = (
+        "Command not allowed. Every piped/chained segment must start with one "
+        f"of: {ALLOWED_PREFIXES}. Subshells, command substitution and "
+        "backticks are rejected."
+    )
 
     def _resolve_command(self, command: str) -> str:
         """Rewrite tool paths for local dev when needed."""
@@ -71,12 +107,10 @@ class ToolExecutor:
         # Resolve /app/tools/ python script paths for local dev
         if "/app/tools/" not in command:
             return command
-        if Path("/app/tools").exists():
+        local_tools_dir = _local_tools_dir()
+        if local_tools_dir is None:
             return command
-        local_tools_dir = Path(__file__).resolve().parents[1] / "tools"
-        if not local_tools_dir.exists():
-            return command
-        return command.replace("/app/tools/", f"{local_tools_dir}/")
+        return command.replace("/app/tools/", local_tools_dir)
 
     # Shell operators that separate one command from the next. A run_command
     # string may legitimately pipe between allowlisted tools (`himalaya … | jq …`),
@@ -84,6 +118,23 @@ class ToolExecutor:
     # start with an allowlisted prefix.
     _SEGMENT_OPS = frozenset({"|", "||", "&&", ";", "&", "\n"})
 
+    # Characters that need /bin/sh to interpret: operators, redirects, globs,
+    # expansions, escapes and comments. Commands free of them are split with
+    # shlex and spawned directly, without the intermediate shell process.
+    _SHELL_META_RE = re.compile(r"[|&;<>()$`\\*?\[\]{}~!#\n]")
+
+    def _plain_argv(self, command: str) -> list[str] | None:
+        """Split ``command`` into argv when no shell is needed to run it, else None."""
+        if self._SHELL_META_RE.search(command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None  # unbalanced quotes — leave the error to the shell
+        if not argv or "=" in argv[0]:
+            return None  # empty, or a leading VAR=value assignment
+        return argv
+
     def _command_allowed(self, command: str) -> bool:
         """True if EVERY pipeline/sequence segment starts with an allowlisted prefix.
 
@@ -117,8 +168,7 @@ class ToolExecutor:
         for segment in segments:
             if not segment:
                 continue
-            joined = " ".join(segment)
-            if not any(joined.startswith(p) for p in self.ALLOWED_PREFIXES):
+            if not self._ALLOWED_PREFIX_RE.match(" ".join(segment)):
                 return False
         return True
 
@@ -133,13 +183,7 @@ class ToolExecutor:
         """
         # Security: validate against whitelist
         if not self._command_allowed(command):
-            return {
-                "error": (
-                    "Command not allowed. Every piped/chained segment must start with one "
-                    f"of: {self.ALLOWED_PREFIXES}. Subshells, command substitution and "
-                    "backticks are rejected."
-                )
-            }
+            return {"error": self._NOT_ALLOWED_ERROR}
         # `browser.py explore` runs an inner LLM loop (many page steps) and needs
         # minutes, not the 30s default — otherwise it's always killed mid-booking.
         if "browser.py explore" in command:
@@ -169,16 +213,22 @@ class ToolExecutor:
         cwd: str | None = None,
         tool_env: dict[str, str] | None = None,
     ) -> dict:
-        """Run a shell command and capture output."""
+        """Run a command and capture output.
+
+        Commands without shell syntax are exec'd directly; anything else (pipes,
+        redirects, globs, ``$`` expansion) still goes through ``/bin/sh -c``.
+        """
         # Per-call override (active agent's identity) wins over the shared default.
         agent_scoped = tool_env is not None
         effective_tool_env = self.tool_env if tool_env is None else tool_env
         env = None
         wants_wacli_label = "wacli" in command and "WACLI_DEVICE_LABEL" not in os.environ
-        if "himalaya" in command or effective_tool_env or wants_wacli_label or agent_scoped:
-            env = os.environ.copy()
-            if "himalaya" in command:
-                env.update(himalaya_env())
+        if "himalaya" in command:
+            if self._himalaya_env is None:
+                self._himalaya_env = {**os.environ, **himalaya_env()}
+            env = self._himalaya_env
+        if effective_tool_env or wants_wacli_label or agent_scoped:
+            env = os.environ.copy() if env is None else dict(env)
             # wacli: identify the linked device as humux (matches the Docker ENV).
             if wants_wacli_label:
                 env.setdefault("WACLI_DEVICE_LABEL", "humux")
@@ -192,13 +242,28 @@ class ToolExecutor:
                     env.pop(key, None)
             # Tool auth (e.g. GH_TOKEN) — only set when a tool is enabled.
             env.update(effective_tool_env)
-        proc = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-            cwd=cwd,
-        )
+        proc = None
+        argv = self._plain_argv(command)
+        if argv is not None:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    cwd=cwd,
+                )
+            except OSError:
+                # e.g. binary not on PATH — the shell reports it (exit 127) as before.
+                proc = None
+        if proc is None:
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                cwd=cwd,
+            )
         try:
             stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
             return {
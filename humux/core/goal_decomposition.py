@@ -12,6 +12,7 @@ The decomposition is optional and gated by a classifier: simple requests
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -79,6 +80,27 @@ Respond with ONLY the JSON object, no other text."""
 # Regex to match a JSON object in the response
 _JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
 _FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+# Tokens for the outermost-object scan: a whole string literal (escapes and
+# braces inside it included) or a bare brace. String bodies are skipped by the
+# regex engine in one match, so the Python loop only ever sees braces.
+_JSON_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|[{}]', re.DOTALL)
+# Salvage pieces for a plan cut off mid-output (max_tokens hit mid-array).
+_GOAL_FIELD_RE = re.compile(r'"goal"\s*:\s*("(?:\\.|[^"\\])*")')
+_STEPS_FIELD_RE = re.compile(r'"steps"\s*:\s*\[')
+_STEP_SEP_RE = re.compile(r"[\s,]*")
+_DECODER = json.JSONDecoder()
+
+# Messages shorter than this are almost never complex — no LLM call at all.
+_MIN_COMPLEX_CHARS = 20
+
+# Obviously-SIMPLE shapes, answered locally without the classifier call: one
+# short sentence opening with a greeting, a "what is" question or a single
+# read/send/show command, with no "and"/"then" chaining a second action.
+_SIMPLE_RE = re.compile(
+    r"(?:hi|hello|hey|thanks|thank you|what(?:['’]s| is)|send|read|show)\b"
+    r"(?!.*\b(?:and|then|also)\b)[^.?!\n]{0,80}[.?!]?",
+    re.IGNORECASE,
+)
 
 
 @dataclass
@@ -93,19 +115,25 @@ class SubGoal:
 class DecomposedGoal:
     goal: str
     steps: list[SubGoal]
+    # Rendered prompt block, filled on first use: a cached plan is re-injected
+    # into the system prompt on every turn it applies to.
+    _formatted: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def format_for_prompt(self) -> str:
         """Format the decomposed goal as a block for the system prompt."""
+        if self._formatted is not None:
+            return self._formatted
         lines = [f"Overall goal: {self.goal}", ""]
         for step in self.steps:
             deps = ""
             if step.depends_on:
                 plural = "s" if len(step.depends_on) > 1 else ""
-                ids = ", ".join(str(d) for d in step.depends_on)
+                ids = ", ".join(map(str, step.depends_on))
                 deps = f" (after step{plural} {ids})"
             lines.append(f"  {step.id}. {step.title}{deps}")
             lines.append(f"     {step.description}")
-        return "\n".join(lines)
+        self._formatted = "\n".join(lines)
+        return self._formatted
 
 
 def _extract_json_object(raw: str) -> dict | None:
@@ -136,28 +164,15 @@ def _extract_json_object(raw: str) -> dict | None:
     start = raw.find("{")
     if start != -1:
         depth = 0
-        in_string = False
-        escape = False
         end = -1
-        for i in range(start, len(raw)):
-            ch = raw[i]
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if ch == "{":
+        for m in _JSON_TOKEN_RE.finditer(raw, start):
+            tok = m.group()
+            if tok == "{":
                 depth += 1
-            elif ch == "}":
+            elif tok == "}":
                 depth -= 1
                 if depth == 0:
-                    end = i
+                    end = m.start()
                     break
         if end != -1:
             try:
@@ -170,6 +185,37 @@ def _extract_json_object(raw: str) -> dict | None:
     return None
 
 
+def _recover_truncated_plan(raw: str) -> dict | None:
+    """Salvage the goal and every *complete* step from a truncated plan.
+
+    When the model runs out of tokens mid-``steps`` array the reply is not
+    valid JSON, but the steps emitted before the cut usually are. Decode them
+    one at a time with ``raw_decode`` and stop at the first incomplete one,
+    so a long plan degrades to a shorter one instead of being discarded.
+    """
+    steps_match = _STEPS_FIELD_RE.search(raw)
+    if not steps_match:
+        return None
+    steps: list = []
+    pos = steps_match.end()
+    while True:
+        pos = _STEP_SEP_RE.match(raw, pos).end()
+        if not raw.startswith("{", pos):
+            break
+        try:
+            step, pos = _DECODER.raw_decode(raw, pos)
+        except json.JSONDecodeError:
+            break
+        steps.append(step)
+    if not steps:
+        return None
+    goal = ""
+    goal_match = _GOAL_FIELD_RE.search(raw, 0, steps_match.start())
+    if goal_match:
+        goal = json.loads(goal_match.group(1))
+    return {"goal": goal, "steps": steps}
+
+
 async def classify_complexity(
     llm: LLMClient,
     model: str,
@@ -180,8 +226,10 @@ async def classify_complexity(
     Uses a fast LLM call to classify the message. Returns False (simple)
     on any error — decomposition is always optional.
     """
-    # Quick heuristic: very short messages are almost never complex
-    if len(user_msg.strip()) < 20:
+    # Quick heuristics: very short messages are almost never complex, and the
+    # common single-action shapes are recognised without an LLM round-trip.
+    stripped = user_msg.strip()
+    if len(stripped) < _MIN_COMPLEX_CHARS or _SIMPLE_RE.fullmatch(stripped):
         return False
 
     prompt = _CLASSIFY_PROMPT.format(user_msg=user_msg)
@@ -211,8 +259,11 @@ async def decompose_goal(
 
     parsed = _extract_json_object(raw)
     if not parsed:
-        log.warning("Goal decomposition returned non-JSON: %s", raw[:200])
-        return None
+        parsed = _recover_truncated_plan(raw)
+        if not parsed:
+            log.warning("Goal decomposition returned non-JSON: %s", raw[:200])
+            return None
+        log.info("Recovered %d steps from truncated decomposition", len(parsed["steps"]))
 
     goal = parsed.get("goal", "")
     steps_raw = parsed.get("steps", [])
@@ -243,3 +294,35 @@ async def decompose_goal(
         goal[:80],
     )
     return result
+
+
+async def plan_if_complex(
+    llm: LLMClient,
+    model: str,
+    user_msg: str,
+) -> DecomposedGoal | None:
+    """Classify *user_msg* and, when COMPLEX, return its decomposition.
+
+    The decomposition call is started speculatively alongside the classifier,
+    so a complex request costs one LLM round-trip of wall time instead of two.
+    It is cancelled as soon as the classifier answers SIMPLE; the tokens it
+    already spent are the price of the saved latency.
+    """
+    stripped = user_msg.strip()
+    if len(stripped) < _MIN_COMPLEX_CHARS or _SIMPLE_RE.fullmatch(stripped):
+        return None
+
+    decompose_task = asyncio.create_task(decompose_goal(llm, model, user_msg))
+    try:
+        is_complex = await classify_complexity(llm, model, user_msg)
+    except BaseException:
+        decompose_task.cancel()
+        raise
+
+    if not is_complex:
+        decompose_task.cancel()
+        log.debug("Message classified as SIMPLE, skipping decomposition")
+        return None
+
+    log.info("Message classified as COMPLEX, awaiting decomposition...")
+    return await decompose_task
@@ -11,18 +11,25 @@ talking in different chats (e.g. private vs. group) gets separate histories.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import aiosqlite
-
 log = logging.getLogger(__name__)
 
+# Plain ``INTEGER PRIMARY KEY`` (the rowid) rather than AUTOINCREMENT: new ids
+# are always above every existing row, which is all the id-ordered reads need,
+# and inserts skip the extra ``sqlite_sequence`` write. Databases created with
+# the old AUTOINCREMENT schema keep it and behave the same.
 _SCHEMA = """\
 CREATE TABLE IF NOT EXISTS conversation_turns (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     channel TEXT NOT NULL,
     user_id TEXT NOT NULL,
     chat_id TEXT NOT NULL DEFAULT '',
@@ -33,7 +40,7 @@ CREATE TABLE IF NOT EXISTS conversation_turns (
 CREATE INDEX IF NOT EXISTS idx_turns_lookup
     ON conversation_turns(channel, user_id, chat_id, created_at);
 CREATE TABLE IF NOT EXISTS session_messages (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    id INTEGER PRIMARY KEY,
     channel TEXT NOT NULL,
     user_id TEXT NOT NULL,
     chat_id TEXT NOT NULL DEFAULT '',
@@ -84,24 +91,116 @@ _MIGRATIONS = [
     ),
 ]
 
+# Per-turn statements, kept as module constants so every call passes the exact
+# same SQL text and hits sqlite3's per-connection statement cache.
+
+# We select the N most-recent *user* rows by id and then grab every row whose
+# id >= the smallest of those.  Because the assistant reply is always inserted
+# right after the user message, this guarantees we never slice in the middle
+# of a pair.
+_SQL_GET_MESSAGES = """
+SELECT role, content, created_at FROM conversation_turns
+WHERE channel = ? AND user_id = ? AND chat_id = ?
+  AND id >= (
+      SELECT MIN(id) FROM (
+          SELECT id
+          FROM conversation_turns
+          WHERE channel = ? AND user_id = ? AND chat_id = ? AND role = 'user'
+          ORDER BY id DESC
+          LIMIT ?
+      )
+  )
+ORDER BY id ASC
+"""
+_SQL_INSERT_TURN = (
+    "INSERT INTO conversation_turns (channel, user_id, chat_id, role, content) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_LAST_TURN = (
+    "SELECT id, role, content FROM conversation_turns "
+    "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id DESC LIMIT 1"
+)
+_SQL_UPDATE_TURN = "UPDATE conversation_turns SET content = ? WHERE id = ?"
+_SQL_LOAD_SESSION = (
+    "SELECT message FROM session_messages "
+    "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id ASC"
+)
+_SQL_INSERT_SESSION_MESSAGE = (
+    "INSERT INTO session_messages (channel, user_id, chat_id, message) VALUES (?, ?, ?, ?)"
+)
+_SQL_LAST_SESSION_MESSAGE_ID = (
+    "SELECT id FROM session_messages "
+    "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id DESC LIMIT 1"
+)
+_SQL_UPDATE_SESSION_MESSAGE = "UPDATE session_messages SET message = ? WHERE id = ?"
+_SQL_GET_SESSION_SYSTEM = (
+    "SELECT system FROM session_system WHERE channel = ? AND user_id = ? AND chat_id = ?"
+)
+_SQL_GET_CHAT_AGENT = (
+    "SELECT agent FROM chat_agent WHERE channel = ? AND user_id = ? AND chat_id = ?"
+)
+
+# Page cache for the shared connection, in KiB (negative = size, not pages).
+_CACHE_SIZE_KIB = 20000
+
+# Sticky sessions kept in memory at once; least recently used ones are dropped
+# and reloaded from SQLite on their next access.
+_MAX_SESSIONS = 256
+
 
 class ConversationHistory:
-    """Stores and retrieves conversation turns per user+channel+chat."""
+    """Stores and retrieves conversation turns per user+channel+chat.
 
-    def __init__(self, db_path: str = "data/history.db", max_turns: int = 20):
+    All SQL runs on one ``sqlite3`` connection per instance, opened on first
+    use and driven through :func:`asyncio.to_thread`. A thread lock serializes
+    the calls, so each method's statements and commit run as one unit and a
+    cancelled caller can never leave another call sharing a half-done
+    transaction.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/history.db",
+        max_turns: int = 20,
+        max_sessions: int = _MAX_SESSIONS,
+    ):
         self.db_path = db_path
         self.max_turns = max_turns
+        self.max_sessions = max_sessions
         self._ready = False
-        # In-memory cache for sticky sessions: {(channel, user_id, chat_id): [message_dicts]}
-        self._sessions: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        # LRU cache for sticky sessions: {(channel, user_id, chat_id): [message_dicts]}.
+        # SQLite stays the source of truth, so an evicted session just reloads.
+        self._sessions: OrderedDict[tuple[str, str, str], list[dict[str, Any]]] = OrderedDict()
         # In-memory cache for the static system prompt snapshot per session.
         self._session_system: dict[tuple[str, str, str], str] = {}
+        # Per-key load locks so concurrent cold reads of one session issue a
+        # single SELECT; dropped again once the session is cached.
+        self._load_locks: dict[tuple[str, str, str], asyncio.Lock] = {}
 
-    async def _ensure_schema(self) -> None:
-        if self._ready:
-            return
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        async with aiosqlite.connect(self.db_path) as db:
+    def _touch_session(self, key: tuple[str, str, str]) -> list[dict[str, Any]] | None:
+        """Mark a cached session most recently used, evicting past ``max_sessions``.
+
+        Returns None when *key* is not cached (e.g. evicted by a concurrent load).
+        """
+        session = self._sessions.get(key)
+        if session is None:
+            return None
+        self._sessions.move_to_end(key)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return session
+
+    def _open(self) -> None:
+        """Open the shared connection and bring the schema up to date (worker thread)."""
+        with self._db_lock:
+            if self._conn is not None:
+                return
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
             # #115: rename the legacy per-chat binding table + column (persona →
             # agent) in place BEFORE the CREATE IF NOT EXISTS, so an upgraded DB
             # keeps its bindings instead of orphaning them under a fresh table.
@@ -110,20 +209,51 @@ class ConversationHistory:
                 "ALTER TABLE chat_agent RENAME COLUMN persona TO agent",
             ):
                 try:
-                    await db.execute(sql)
-                    await db.commit()
+                    db.execute(sql)
+                    db.commit()
                 except Exception:
                     pass  # fresh DB or already renamed
-            await db.executescript(_SCHEMA)
+            db.executescript(_SCHEMA)
             # Run migrations for existing databases that lack the chat_id column.
             for desc, sql in _MIGRATIONS:
                 try:
-                    await db.execute(sql)
-                    await db.commit()
+                    db.execute(sql)
+                    db.commit()
                 except Exception:
                     pass  # Column/index already exists
+            self._conn = db
+
+    async def _ensure_schema(self) -> None:
+        if self._ready:
+            return
+        await asyncio.to_thread(self._open)
         self._ready = True
 
+    def _locked[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._db_lock:
+            if self._conn is None:
+                # close() ran after this call's _ensure_schema (a late drained write).
+                raise RuntimeError("history store closed")
+            return fn(self._conn)
+
+    async def _run[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn(conn)`` on the shared connection in a worker thread."""
+        await self._ensure_schema()
+        return await asyncio.to_thread(self._locked, fn)
+
+    def _close_locked(self) -> None:
+        # Under the lock, so a worker thread still running a cancelled call
+        # finishes before the connection is closed.
+        with self._db_lock:
+            conn, self._conn = self._conn, None
+            if conn is not None:
+                conn.close()
+
+    async def close(self) -> None:
+        """Close the shared connection; the next call transparently reopens it."""
+        self._ready = False
+        await asyncio.to_thread(self._close_locked)
+
     # -------------------------------------------------------------------
     # Injection mode — windowed history as native messages
     # -------------------------------------------------------------------
@@ -135,30 +265,12 @@ class ConversationHistory:
         The limit is applied to *pairs* (not individual rows) so the history
         never starts with an orphaned assistant reply.
         """
-        await self._ensure_schema()
-        # We select the N most-recent *user* rows by id and then grab every
-        # row whose id >= the smallest of those.  Because the assistant reply
-        # is always inserted right after the user message, this guarantees we
-        # never slice in the middle of a pair.
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                SELECT role, content, created_at FROM conversation_turns
-                WHERE channel = ? AND user_id = ? AND chat_id = ?
-                  AND id >= (
-                      SELECT MIN(id) FROM (
-                          SELECT id
-                          FROM conversation_turns
-                          WHERE channel = ? AND user_id = ? AND chat_id = ? AND role = 'user'
-                          ORDER BY id DESC
-                          LIMIT ?
-                      )
-                  )
-                ORDER BY id ASC
-                """,
+        rows = await self._run(
+            lambda db: db.execute(
+                _SQL_GET_MESSAGES,
                 (channel, user_id, chat_id, channel, user_id, chat_id, self.max_turns),
-            )
-            rows = await cursor.fetchall()
+            ).fetchall()
+        )
 
         return [
             {"role": role, "content": json.loads(content), "created_at": created_at}
@@ -169,35 +281,44 @@ class ConversationHistory:
         self, channel: str, user_id: str, role: str, content: str, chat_id: str = ""
     ) -> None:
         """Store a single message (user or assistant text)."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO conversation_turns (channel, user_id, chat_id, role, content) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (channel, user_id, chat_id, role, json.dumps(content)),
-            )
-            await db.commit()
+        await self.add_turns(channel, user_id, [(role, content)], chat_id)
+
+    async def add_turns(
+        self, channel: str, user_id: str, turns: list[tuple[str, str]], chat_id: str = ""
+    ) -> None:
+        """Store several ``(role, content)`` turns in one transaction.
+
+        Used for the user/assistant pair persisted at the end of every turn, so
+        the pair costs one commit instead of two. Rows keep list order (and so
+        id order, which :meth:`get_messages` relies on).
+        """
+        if not turns:
+            return
+        rows = [(channel, user_id, chat_id, role, json.dumps(content)) for role, content in turns]
+
+        def _insert(db: sqlite3.Connection) -> None:
+            with db:
+                db.executemany(_SQL_INSERT_TURN, rows)
+
+        await self._run(_insert)
 
     async def clear(self, channel: str, user_id: str, chat_id: str = "") -> None:
         """Clear conversation history for a user+channel+chat triple (both modes)."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM conversation_turns WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.execute(
-                "DELETE FROM session_messages WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.execute(
-                "DELETE FROM session_system WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.commit()
+        key = (channel, user_id, chat_id)
+
+        def _delete(db: sqlite3.Connection) -> None:
+            with db:
+                for table in ("conversation_turns", "session_messages", "session_system"):
+                    db.execute(
+                        f"DELETE FROM {table} "  # noqa: S608
+                        "WHERE channel = ? AND user_id = ? AND chat_id = ?",
+                        key,
+                    )
+
+        await self._run(_delete)
         # Clear in-memory session cache
-        self._sessions.pop((channel, user_id, chat_id), None)
-        self._session_system.pop((channel, user_id, chat_id), None)
+        self._sessions.pop(key, None)
+        self._session_system.pop(key, None)
 
     # -------------------------------------------------------------------
     # Session mode — sticky session per (channel, user_id, chat_id)
@@ -209,39 +330,28 @@ class ConversationHistory:
         """Return the full session message array for a (channel, user_id, chat_id) triple.
 
         Loads from SQLite on first access, then serves from in-memory cache.
+        Concurrent first accesses share one load: the rest wait on a per-key
+        lock instead of each re-reading (and overwriting) the cached list.
+        Only the ``max_sessions`` most recently used sessions stay cached.
         """
         await self._ensure_schema()
         key = (channel, user_id, chat_id)
-        if key not in self._sessions:
-            # Load from DB
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    "SELECT message FROM session_messages "
-                    "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id ASC",
-                    (channel, user_id, chat_id),
-                )
-                rows = await cursor.fetchall()
-            self._sessions[key] = [json.loads(row[0]) for row in rows]
-        return self._sessions[key]
+        # Loops only if another load evicted this session while we waited.
+        while (session := self._touch_session(key)) is None:
+            lock = self._load_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                if key not in self._sessions:
+                    rows = await self._run(lambda db: db.execute(_SQL_LOAD_SESSION, key).fetchall())
+                    self._sessions[key] = [json.loads(row[0]) for row in rows]
+            if self._load_locks.get(key) is lock:
+                del self._load_locks[key]
+        return session
 
     async def append_session_message(
         self, channel: str, user_id: str, message: dict[str, Any], chat_id: str = ""
     ) -> None:
         """Append a message to the sticky session and persist it."""
-        await self._ensure_schema()
-        key = (channel, user_id, chat_id)
-        # Ensure the in-memory cache is loaded
-        if key not in self._sessions:
-            await self.get_session(channel, user_id, chat_id)
-        self._sessions[key].append(message)
-        # Persist
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO session_messages (channel, user_id, chat_id, message) "
-                "VALUES (?, ?, ?, ?)",
-                (channel, user_id, chat_id, json.dumps(message)),
-            )
-            await db.commit()
+        await self.append_session_messages(channel, user_id, [message], chat_id)
 
     async def append_session_messages(
         self,
@@ -253,18 +363,15 @@ class ConversationHistory:
         """Append multiple messages to the sticky session and persist them."""
         if not messages:
             return
-        await self._ensure_schema()
-        key = (channel, user_id, chat_id)
-        if key not in self._sessions:
-            await self.get_session(channel, user_id, chat_id)
-        self._sessions[key].extend(messages)
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executemany(
-                "INSERT INTO session_messages (channel, user_id, chat_id, message) "
-                "VALUES (?, ?, ?, ?)",
-                [(channel, user_id, chat_id, json.dumps(m)) for m in messages],
-            )
-            await db.commit()
+        # Loads the in-memory cache if needed; nothing awaits between it and the extend.
+        (await self.get_session(channel, user_id, chat_id)).extend(messages)
+        rows = [(channel, user_id, chat_id, json.dumps(m)) for m in messages]
+
+        def _insert(db: sqlite3.Connection) -> None:
+            with db:
+                db.executemany(_SQL_INSERT_SESSION_MESSAGE, rows)
+
+        await self._run(_insert)
 
     async def replace_session(
         self,
@@ -278,20 +385,21 @@ class ConversationHistory:
         Rewrites both the in-memory cache and the persisted ``session_messages``
         rows. The system-prompt snapshot is left untouched.
         """
-        await self._ensure_schema()
         key = (channel, user_id, chat_id)
         self._sessions[key] = list(messages)
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM session_messages WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.executemany(
-                "INSERT INTO session_messages (channel, user_id, chat_id, message) "
-                "VALUES (?, ?, ?, ?)",
-                [(channel, user_id, chat_id, json.dumps(m)) for m in messages],
-            )
-            await db.commit()
+        self._touch_session(key)
+        rows = [(channel, user_id, chat_id, json.dumps(m)) for m in messages]
+
+        def _replace(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "DELETE FROM session_messages "
+                    "WHERE channel = ? AND user_id = ? AND chat_id = ?",
+                    key,
+                )
+                db.executemany(_SQL_INSERT_SESSION_MESSAGE, rows)
+
+        await self._run(_replace)
 
     async def append_to_last_turn(
         self,
@@ -313,28 +421,21 @@ class ConversationHistory:
         that many characters, so a long run of folded turns can't grow one row
         without bound — the caller then starts a fresh turn (#30).
         """
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, role, content FROM conversation_turns "
-                "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id DESC LIMIT 1",
-                (channel, user_id, chat_id),
-            )
-            row = await cursor.fetchone()
-            if not row or row["role"] != role:
+
+        def _fold(db: sqlite3.Connection) -> bool:
+            row = db.execute(_SQL_LAST_TURN, (channel, user_id, chat_id)).fetchone()
+            if not row or row[1] != role:
                 return False
-            content = json.loads(row["content"])
+            content = json.loads(row[2])
             if not isinstance(content, str):
                 return False
             if max_len is not None and len(content) + len(suffix) > max_len:
                 return False
-            await db.execute(
-                "UPDATE conversation_turns SET content = ? WHERE id = ?",
-                (json.dumps(content + suffix), row["id"]),
-            )
-            await db.commit()
-        return True
+            with db:
+                db.execute(_SQL_UPDATE_TURN, (json.dumps(content + suffix), row[0]))
+            return True
+
+        return await self._run(_fold)
 
     async def append_to_last_session_message(
         self,
@@ -354,11 +455,7 @@ class ConversationHistory:
         as an in-flight Anthropic ``tool_result`` turn (#30). ``max_len`` bounds
         the folded turn's growth like :meth:`append_to_last_turn`.
         """
-        await self._ensure_schema()
-        key = (channel, user_id, chat_id)
-        if key not in self._sessions:
-            await self.get_session(channel, user_id, chat_id)
-        session = self._sessions[key]
+        session = await self.get_session(channel, user_id, chat_id)
         if not session or session[-1].get("role") != role:
             return False
         msg = session[-1]
@@ -373,36 +470,33 @@ class ConversationHistory:
             content.append({"type": "text", "text": suffix})
         else:
             return False
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT id FROM session_messages "
-                "WHERE channel = ? AND user_id = ? AND chat_id = ? ORDER BY id DESC LIMIT 1",
-                (channel, user_id, chat_id),
-            )
-            row = await cursor.fetchone()
+        payload = json.dumps(msg)
+
+        def _update(db: sqlite3.Connection) -> None:
+            row = db.execute(_SQL_LAST_SESSION_MESSAGE_ID, (channel, user_id, chat_id)).fetchone()
             if row:
-                await db.execute(
-                    "UPDATE session_messages SET message = ? WHERE id = ?",
-                    (json.dumps(msg), row[0]),
-                )
-                await db.commit()
+                with db:
+                    db.execute(_SQL_UPDATE_SESSION_MESSAGE, (payload, row[0]))
+
+        await self._run(_update)
         return True
 
     async def clear_session(self, channel: str, user_id: str, chat_id: str = "") -> None:
         """Clear just the sticky session for a (channel, user_id, chat_id) triple."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM session_messages WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.execute(
-                "DELETE FROM session_system WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.commit()
-        self._sessions.pop((channel, user_id, chat_id), None)
-        self._session_system.pop((channel, user_id, chat_id), None)
+        key = (channel, user_id, chat_id)
+
+        def _delete(db: sqlite3.Connection) -> None:
+            with db:
+                for table in ("session_messages", "session_system"):
+                    db.execute(
+                        f"DELETE FROM {table} "  # noqa: S608
+                        "WHERE channel = ? AND user_id = ? AND chat_id = ?",
+                        key,
+                    )
+
+        await self._run(_delete)
+        self._sessions.pop(key, None)
+        self._session_system.pop(key, None)
 
     # -------------------------------------------------------------------
     # Session mode — static system prompt snapshot
@@ -415,17 +509,10 @@ class ConversationHistory:
         ``/new``) and reused for every subsequent turn, so the static content is
         only built/sent once instead of being rebuilt each turn.
         """
-        await self._ensure_schema()
         key = (channel, user_id, chat_id)
         if key in self._session_system:
             return self._session_system[key]
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT system FROM session_system "
-                "WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            row = await cursor.fetchone()
+        row = await self._run(lambda db: db.execute(_SQL_GET_SESSION_SYSTEM, key).fetchone())
         if row is None:
             return None
         self._session_system[key] = row[0]
@@ -435,16 +522,18 @@ class ConversationHistory:
         self, channel: str, user_id: str, system: str, chat_id: str = ""
     ) -> None:
         """Persist the static system prompt snapshot for a session."""
-        await self._ensure_schema()
         self._session_system[(channel, user_id, chat_id)] = system
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO session_system (channel, user_id, chat_id, system) "
-                "VALUES (?, ?, ?, ?) "
-                "ON CONFLICT(channel, user_id, chat_id) DO UPDATE SET system = excluded.system",
-                (channel, user_id, chat_id, system),
-            )
-            await db.commit()
+
+        def _upsert(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "INSERT INTO session_system (channel, user_id, chat_id, system) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(channel, user_id, chat_id) DO UPDATE SET system = excluded.system",
+                    (channel, user_id, chat_id, system),
+                )
+
+        await self._run(_upsert)
 
     async def clear_session_system(self, channel: str, user_id: str, chat_id: str = "") -> None:
         """Drop just the snapshotted system prompt for a session (keep messages).
@@ -452,14 +541,17 @@ class ConversationHistory:
         Used when the bound agent changes mid-session so the next turn rebuilds
         the static prompt with the new identity without wiping the conversation.
         """
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM session_system WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.commit()
-        self._session_system.pop((channel, user_id, chat_id), None)
+        key = (channel, user_id, chat_id)
+
+        def _delete(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "DELETE FROM session_system WHERE channel = ? AND user_id = ? AND chat_id = ?",
+                    key,
+                )
+
+        await self._run(_delete)
+        self._session_system.pop(key, None)
 
     # -------------------------------------------------------------------
     # Per-chat agent binding — (channel, user_id, chat_id) -> agent name
@@ -472,39 +564,39 @@ class ConversationHistory:
         cache avoids staleness when the binding is changed from the admin UI on
         a different store instance.
         """
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT agent FROM chat_agent WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            row = await cursor.fetchone()
+        row = await self._run(
+            lambda db: db.execute(_SQL_GET_CHAT_AGENT, (channel, user_id, chat_id)).fetchone()
+        )
         return row[0] if row else None
 
     async def set_chat_agent(
         self, channel: str, user_id: str, agent: str, chat_id: str = ""
     ) -> None:
         """Bind a (channel, user_id, chat_id) triple to an agent name (upsert)."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO chat_agent (channel, user_id, chat_id, agent) "
-                "VALUES (?, ?, ?, ?) "
-                "ON CONFLICT(channel, user_id, chat_id) DO UPDATE SET "
-                "agent = excluded.agent, updated_at = datetime('now')",
-                (channel, user_id, chat_id, agent),
-            )
-            await db.commit()
+
+        def _upsert(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "INSERT INTO chat_agent (channel, user_id, chat_id, agent) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(channel, user_id, chat_id) DO UPDATE SET "
+                    "agent = excluded.agent, updated_at = datetime('now')",
+                    (channel, user_id, chat_id, agent),
+                )
+
+        await self._run(_upsert)
 
     async def clear_chat_agent(self, channel: str, user_id: str, chat_id: str = "") -> None:
         """Remove a per-chat agent binding (revert to global/default identity)."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "DELETE FROM chat_agent WHERE channel = ? AND user_id = ? AND chat_id = ?",
-                (channel, user_id, chat_id),
-            )
-            await db.commit()
+
+        def _delete(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "DELETE FROM chat_agent WHERE channel = ? AND user_id = ? AND chat_id = ?",
+                    (channel, user_id, chat_id),
+                )
+
+        await self._run(_delete)
 
     async def bind_chat_agent(self, channel: str, user_id: str, chat_id: str, agent: str) -> None:
         """Bind (or, with an empty name, unbind) a chat to an agent.
@@ -529,17 +621,19 @@ class ConversationHistory:
         and the ``telegram:<slug>`` channel that a per-agent bot's turns,
         session, and binding rows are stored under (#29).
         """
-        await self._ensure_schema()
         old_ch, new_ch = f"telegram:{old}", f"telegram:{new}"
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("UPDATE chat_agent SET agent = ? WHERE agent = ?", (new, old))
-            tables = ("conversation_turns", "session_messages", "session_system", "chat_agent")
-            for table in tables:
-                await db.execute(
-                    f"UPDATE {table} SET channel = ? WHERE channel = ?",  # noqa: S608
-                    (new_ch, old_ch),
-                )
-            await db.commit()
+
+        def _rename(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute("UPDATE chat_agent SET agent = ? WHERE agent = ?", (new, old))
+                tables = ("conversation_turns", "session_messages", "session_system", "chat_agent")
+                for table in tables:
+                    db.execute(
+                        f"UPDATE {table} SET channel = ? WHERE channel = ?",  # noqa: S608
+                        (new_ch, old_ch),
+                    )
+
+        await self._run(_rename)
         # The per-agent bot channel only carries traffic after a restart, so the
         # in-memory _session_system cache (keyed by the old channel) is moot here.
 
@@ -554,9 +648,8 @@ class ConversationHistory:
         is the bound agent ("" when unbound). Ordered newest-active first so the
         chat you just messaged floats to the top.
         """
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
+        rows = await self._run(
+            lambda db: db.execute(
                 """
                 SELECT c.channel, c.user_id, c.chat_id, p.agent, a.last_active
                 FROM (
@@ -583,8 +676,8 @@ class ConversationHistory:
                 ORDER BY a.last_active IS NULL, a.last_active DESC,
                          c.channel, c.user_id, c.chat_id
                 """
-            )
-            rows = await cursor.fetchall()
+            ).fetchall()
+        )
         return [
             {
                 "channel": ch,
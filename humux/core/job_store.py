@@ -8,14 +8,17 @@ tool, and agent tool all write here.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import queue
 import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import aiosqlite
-
 log = logging.getLogger(__name__)
 
 _SCHEMA = """\
@@ -38,12 +41,35 @@ CREATE TABLE IF NOT EXISTS jobs (
 );
 """
 
+# Created after _MIGRATIONS so a legacy table has created_at by then.
+_SQL_INDEX = "CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC)"
+
+# WAL lets the admin UI's reads run alongside scheduler writes, and NORMAL sync
+# commits to the log without an fsync per transaction. journal_mode is stored in
+# the database file; the rest are per-connection settings.
+_CONN_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "busy_timeout=5000",
+    "cache_size=-64000",
+)
+_PRAGMAS = ("journal_mode=WAL", *_CONN_PRAGMAS)
+
+# Read-only connections kept per store. Listings and lookups run on these, so
+# admin-UI polling never queues behind the writer lock.
+_READERS = 4
+
 # Additive migrations for DBs created before a column existed. Each is a column
-# name → ALTER statement; applied only when the column is missing.
+# name → ALTER statement; applied only when the column is missing. ALTER TABLE
+# can't add a datetime('now') default, so backfilled timestamps are ''.
 _MIGRATIONS = {
+    "cron": "ALTER TABLE jobs ADD COLUMN cron TEXT",
+    "run_at": "ALTER TABLE jobs ADD COLUMN run_at TEXT",
     "agent": "ALTER TABLE jobs ADD COLUMN agent TEXT NOT NULL DEFAULT ''",
     "origin_user_id": "ALTER TABLE jobs ADD COLUMN origin_user_id TEXT NOT NULL DEFAULT ''",
     "origin_chat_id": "ALTER TABLE jobs ADD COLUMN origin_chat_id TEXT NOT NULL DEFAULT ''",
+    "created_at": "ALTER TABLE jobs ADD COLUMN created_at TEXT NOT NULL DEFAULT ''",
+    "updated_at": "ALTER TABLE jobs ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''",
 }
 
 # Valid values. "subagent" runs the spawn_subagent primitive under ``agent``.
@@ -52,84 +78,253 @@ VALID_SCHEDULES = ("cron", "once")
 VALID_STATUSES = ("active", "paused", "done", "cancelled")
 
 
-def _row_to_dict(row: aiosqlite.Row | sqlite3.Row) -> dict[str, Any]:
-    """Convert a Row to a plain dict."""
-    return dict(row)
+# Columns of every job read, in a fixed order. Listed explicitly rather than
+# ``SELECT *`` so results don't depend on the physical column order, which
+# differs on databases that gained columns through _MIGRATIONS.
+_JOB_COLUMNS = (
+    "id",
+    "type",
+    "schedule",
+    "cron",
+    "run_at",
+    "task",
+    "channel",
+    "status",
+    "created_by",
+    "description",
+    "agent",
+    "origin_user_id",
+    "origin_chat_id",
+    "created_at",
+    "updated_at",
+)
+_COLUMN_LIST = ", ".join(_JOB_COLUMNS)
+
+# Hot statements, kept as module constants so every call passes the exact same
+# SQL text and hits each connection's statement cache.
+_SQL_LIST_BY_STATUS = f"SELECT {_COLUMN_LIST} FROM jobs WHERE status = ? ORDER BY created_at DESC"
+_SQL_LIST_ALL = f"SELECT {_COLUMN_LIST} FROM jobs ORDER BY created_at DESC"
+_SQL_LIST_LIVE = (
+    f"SELECT {_COLUMN_LIST} FROM jobs WHERE status IN ('active', 'paused') ORDER BY created_at DESC"
+)
+_SQL_GET_BY_ID = f"SELECT {_COLUMN_LIST} FROM jobs WHERE id = ?"
+# What the scheduler needs to register a job; description, created_by and the
+# timestamps are UI concerns it never reads.
+_SCHEDULER_COLUMNS = (
+    "id",
+    "type",
+    "schedule",
+    "cron",
+    "run_at",
+    "task",
+    "channel",
+    "status",
+    "agent",
+    "origin_user_id",
+    "origin_chat_id",
+)
+_SQL_LIST_ACTIVE_FOR_SCHEDULER = (
+    f"SELECT {', '.join(_SCHEDULER_COLUMNS)} FROM jobs "
+    "WHERE status = 'active' ORDER BY created_at DESC"
+)
+_SQL_UPDATE_STATUS = "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?"
+_SQL_DELETE = "DELETE FROM jobs WHERE id = ?"
+_SQL_SEED = """
+INSERT OR IGNORE INTO jobs (id, type, schedule, cron, task, channel,
+                            status, created_by, description, agent,
+                            created_at, updated_at)
+VALUES (?, ?, 'cron', ?, ?, ?, 'active', 'config', '', ?, ?, ?)
+"""
+
+# UPSERT ... RETURNING (SQLite 3.35+) hands back the stored row in the same
+# statement; older libraries re-select it.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_UPSERT = """
+INSERT INTO jobs (id, type, schedule, cron, run_at, task, channel,
+                  status, created_by, description, agent,
+                  origin_user_id, origin_chat_id, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    type = excluded.type,
+    schedule = excluded.schedule,
+    cron = excluded.cron,
+    run_at = excluded.run_at,
+    task = excluded.task,
+    channel = excluded.channel,
+    status = excluded.status,
+    description = excluded.description,
+    -- Identity/origin are sticky (#71): a re-upsert that omits them (admin
+    -- "edit", CLI edit/cancel) must not wipe what job creation captured.
+    -- A non-empty new value still wins.
+    agent = COALESCE(NULLIF(excluded.agent, ''), agent),
+    origin_user_id = COALESCE(NULLIF(excluded.origin_user_id, ''), origin_user_id),
+    origin_chat_id = COALESCE(NULLIF(excluded.origin_chat_id, ''), origin_chat_id),
+    updated_at = excluded.updated_at
+"""
+_SQL_UPSERT_RETURNING = f"{_SQL_UPSERT} RETURNING {_COLUMN_LIST}"
+
+# Per-connection prepared-statement cache; comfortably holds every query above.
+_CACHED_STATEMENTS = 128
+
+
+def _now() -> str:
+    """Current UTC time in the ``datetime('now')`` text format the table already holds.
+
+    Bound as a parameter on writes rather than evaluated in SQL; the format has
+    to match existing rows since listings sort on these columns as text.
+    """
+    return datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _row_to_dict(row: tuple, keys: tuple[str, ...] = _JOB_COLUMNS) -> dict[str, Any]:
+    """Convert a plain-tuple row to a dict keyed by its statement's column list.
+
+    Connections return tuples (no ``row_factory``); zipping them against the
+    fixed column order builds the dict in C, without a ``sqlite3.Row`` per row.
+    """
+    return dict(zip(keys, row, strict=True))
+
+
+def _list_jobs(db: sqlite3.Connection, status: str | None, include_done: bool) -> list[dict]:
+    if status:
+        rows = db.execute(_SQL_LIST_BY_STATUS, (status,)).fetchall()
+    elif include_done:
+        rows = db.execute(_SQL_LIST_ALL).fetchall()
+    else:
+        rows = db.execute(_SQL_LIST_LIVE).fetchall()
+    return [_row_to_dict(r) for r in rows]
+
+
+def _get_job(db: sqlite3.Connection, job_id: str) -> dict | None:
+    row = db.execute(_SQL_GET_BY_ID, (job_id,)).fetchone()
+    return _row_to_dict(row) if row else None
+
+
+def _upsert_job(db: sqlite3.Connection, params: tuple) -> dict:
+    now = _now()
+    params = (*params, now, now)  # created_at (first insert only), updated_at
+    with db:
+        if _HAS_RETURNING:
+            row = db.execute(_SQL_UPSERT_RETURNING, params).fetchone()
+            return _row_to_dict(row) if row else {}
+        db.execute(_SQL_UPSERT, params)
+    return _get_job(db, params[0]) or {}
+
+
+def _delete_job(db: sqlite3.Connection, job_id: str) -> bool:
+    with db:
+        return db.execute(_SQL_DELETE, (job_id,)).rowcount > 0
 
 
 class JobStore:
-    """Async SQLite-backed job store."""
+    """SQLite-backed job store with async and sync (CLI) APIs.
+
+    Both sides share one read-write ``sqlite3`` connection per instance, opened
+    on first use and kept for the store's lifetime, so SQLite's page cache
+    survives between calls. A thread lock serializes writes so each method's
+    statements and commit run as one unit. Reads go to a small pool of
+    read-only connections instead, which WAL lets run alongside the writer.
+    Async methods drive either side through :func:`asyncio.to_thread`.
+    """
 
     def __init__(self, db_path: str = "data/jobs.db"):
         self.db_path = db_path
-        self._ready = False
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._reader_count = 0
 
-    async def _ensure_schema(self) -> None:
-        if self._ready:
-            return
+    def _open(self) -> sqlite3.Connection:
+        """Open the shared connection and bring the schema up to date (lock held)."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript(_SCHEMA)
-            cursor = await db.execute("PRAGMA table_info(jobs)")
-            cols = {row[1] for row in await cursor.fetchall()}
-            # #115: rename the legacy `persona` column to `agent` in place (keeps
-            # each job's identity) instead of adding a fresh empty `agent` column.
-            if "persona" in cols and "agent" not in cols:
-                await db.execute("ALTER TABLE jobs RENAME COLUMN persona TO agent")
-                cols.discard("persona")
-                cols.add("agent")
-            for col, stmt in _MIGRATIONS.items():
-                if col not in cols:
-                    await db.execute(stmt)
-            await db.commit()
-        self._ready = True
+        db = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+        )
+        for pragma in _PRAGMAS:
+            db.execute(f"PRAGMA {pragma}")
+        db.executescript(_SCHEMA)
+        cols = {row[1] for row in db.execute("PRAGMA table_info(jobs)").fetchall()}
+        # #115: rename the legacy `persona` column to `agent` in place (keeps
+        # each job's identity) instead of adding a fresh empty `agent` column.
+        if "persona" in cols and "agent" not in cols:
+            db.execute("ALTER TABLE jobs RENAME COLUMN persona TO agent")
+            cols.discard("persona")
+            cols.add("agent")
+        for col, stmt in _MIGRATIONS.items():
+            if col not in cols:
+                db.execute(stmt)
+        db.execute(_SQL_INDEX)
+        db.commit()
+        return db
+
+    def _run_sync[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn(conn)`` on the shared connection, opening it on first use."""
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = self._open()
+            return fn(self._conn)
+
+    async def _run[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Async counterpart of :meth:`_run_sync`, run in a worker thread."""
+        return await asyncio.to_thread(self._run_sync, fn)
+
+    def _open_reader(self) -> sqlite3.Connection | None:
+        """Open another pooled reader, or None once the pool is full."""
+        with self._db_lock:
+            if self._conn is None:
+                self._conn = self._open()  # the schema must exist before mode=ro
+            if self._reader_count >= _READERS:
+                return None
+            self._reader_count += 1
+        uri = Path(self.db_path).absolute().as_uri() + "?mode=ro"
+        db = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+        )
+        for pragma in (*_CONN_PRAGMAS, "query_only=1"):
+            db.execute(f"PRAGMA {pragma}")
+        return db
+
+    def _read_sync[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run read-only ``fn(conn)`` on a pooled reader, outside the writer lock."""
+        try:
+            db = self._readers.get_nowait()
+        except queue.Empty:
+            db = self._open_reader() or self._readers.get()
+        try:
+            return fn(db)
+        finally:
+            self._readers.put(db)
+
+    async def _read[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Async counterpart of :meth:`_read_sync`, run in a worker thread."""
+        return await asyncio.to_thread(self._read_sync, fn)
+
+    async def close(self) -> None:
+        """Close all connections; the next call transparently reopens them."""
+
+        def _close() -> None:
+            with self._db_lock:
+                conn, self._conn = self._conn, None
+                if conn is not None:
+                    conn.close()
+                while True:
+                    try:
+                        self._readers.get_nowait().close()
+                    except queue.Empty:
+                        break
+                self._reader_count = 0
+
+        await asyncio.to_thread(_close)
 
     # -- Sync helpers (for use from non-async contexts like CLI) --
 
-    def _ensure_schema_sync(self) -> None:
-        if self._ready:
-            return
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.db_path) as db:
-            db.executescript(_SCHEMA)
-            cols = {row[1] for row in db.execute("PRAGMA table_info(jobs)").fetchall()}
-            # #115: rename the legacy `persona` column to `agent` in place.
-            if "persona" in cols and "agent" not in cols:
-                db.execute("ALTER TABLE jobs RENAME COLUMN persona TO agent")
-                cols.discard("persona")
-                cols.add("agent")
-            for col, stmt in _MIGRATIONS.items():
-                if col not in cols:
-                    db.execute(stmt)
-            db.commit()
-        self._ready = True
-
     def list_jobs_sync(self, status: str | None = None, include_done: bool = False) -> list[dict]:
         """Synchronous version of list_jobs for CLI/admin use."""
-        self._ensure_schema_sync()
-        with sqlite3.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
-            if status:
-                rows = db.execute(
-                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC",
-                    (status,),
-                ).fetchall()
-            elif include_done:
-                rows = db.execute("SELECT * FROM jobs ORDER BY created_at DESC").fetchall()
-            else:
-                rows = db.execute(
-                    "SELECT * FROM jobs WHERE status IN ('active', 'paused') "
-                    "ORDER BY created_at DESC"
-                ).fetchall()
-        return [dict(r) for r in rows]
+        return self._read_sync(lambda db: _list_jobs(db, status, include_done))
 
     def get_job_sync(self, job_id: str) -> dict | None:
         """Synchronous version of get_job."""
-        self._ensure_schema_sync()
-        with sqlite3.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
-            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-        return dict(row) if row else None
+        return self._read_sync(lambda db: _get_job(db, job_id))
 
     def upsert_job_sync(
         self,
@@ -149,91 +344,41 @@ class JobStore:
         origin_chat_id: str = "",
     ) -> dict:
         """Synchronous upsert for CLI/admin use."""
-        self._ensure_schema_sync()
-        with sqlite3.connect(self.db_path) as db:
-            db.row_factory = sqlite3.Row
-            db.execute(
-                """INSERT INTO jobs (id, type, schedule, cron, run_at, task, channel,
-                                     status, created_by, description, agent,
-                                     origin_user_id, origin_chat_id, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                   ON CONFLICT(id) DO UPDATE SET
-                       type = excluded.type,
-                       schedule = excluded.schedule,
-                       cron = excluded.cron,
-                       run_at = excluded.run_at,
-                       task = excluded.task,
-                       channel = excluded.channel,
-                       status = excluded.status,
-                       description = excluded.description,
-                       -- Identity/origin are sticky (#71): a re-upsert that omits
-                       -- them (admin "edit", CLI edit/cancel) must not wipe what
-                       -- job creation captured. A non-empty new value still wins.
-                       agent = COALESCE(NULLIF(excluded.agent, ''), agent),
-                       origin_user_id =
-                           COALESCE(NULLIF(excluded.origin_user_id, ''), origin_user_id),
-                       origin_chat_id =
-                           COALESCE(NULLIF(excluded.origin_chat_id, ''), origin_chat_id),
-                       updated_at = datetime('now')
-                """,
-                (
-                    job_id,
-                    type,
-                    schedule,
-                    cron,
-                    run_at,
-                    task,
-                    channel,
-                    status,
-                    created_by,
-                    description,
-                    agent,
-                    origin_user_id,
-                    origin_chat_id,
-                ),
-            )
-            db.commit()
-            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-        return dict(row) if row else {}
+        params = (
+            job_id,
+            type,
+            schedule,
+            cron,
+            run_at,
+            task,
+            channel,
+            status,
+            created_by,
+            description,
+            agent,
+            origin_user_id,
+            origin_chat_id,
+        )
+        return self._run_sync(lambda db: _upsert_job(db, params))
 
     def delete_job_sync(self, job_id: str) -> bool:
         """Synchronous delete for CLI use."""
-        self._ensure_schema_sync()
-        with sqlite3.connect(self.db_path) as db:
-            cursor = db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-            db.commit()
-            return cursor.rowcount > 0
+        return self._run_sync(lambda db: _delete_job(db, job_id))
 
     # -- Async CRUD --
 
     async def list_jobs(self, status: str | None = None, include_done: bool = False) -> list[dict]:
         """List jobs, optionally filtered by status."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if status:
-                cursor = await db.execute(
-                    "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC",
-                    (status,),
-                )
-            elif include_done:
-                cursor = await db.execute("SELECT * FROM jobs ORDER BY created_at DESC")
-            else:
-                cursor = await db.execute(
-                    "SELECT * FROM jobs WHERE status IN ('active', 'paused') "
-                    "ORDER BY created_at DESC"
-                )
-            rows = await cursor.fetchall()
-        return [dict(r) for r in rows]
+        return await self._read(lambda db: _list_jobs(db, status, include_done))
+
+    async def list_active_for_scheduler(self) -> list[dict]:
+        """List active jobs with only the columns the scheduler registers from."""
+        rows = await self._read(lambda db: db.execute(_SQL_LIST_ACTIVE_FOR_SCHEDULER).fetchall())
+        return [_row_to_dict(r, _SCHEDULER_COLUMNS) for r in rows]
 
     async def get_job(self, job_id: str) -> dict | None:
         """Get a single job by ID."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-            row = await cursor.fetchone()
-        return dict(row) if row else None
+        return await self._read(lambda db: _get_job(db, job_id))
 
     async def upsert_job(
         self,
@@ -253,102 +398,93 @@ class JobStore:
         origin_chat_id: str = "",
     ) -> dict:
         """Insert or update a job. Returns the job dict."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            await db.execute(
-                """INSERT INTO jobs (id, type, schedule, cron, run_at, task, channel,
-                                     status, created_by, description, agent,
-                                     origin_user_id, origin_chat_id, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                   ON CONFLICT(id) DO UPDATE SET
-                       type = excluded.type,
-                       schedule = excluded.schedule,
-                       cron = excluded.cron,
-                       run_at = excluded.run_at,
-                       task = excluded.task,
-                       channel = excluded.channel,
-                       status = excluded.status,
-                       description = excluded.description,
-                       -- Identity/origin are sticky (#71): a re-upsert that omits
-                       -- them (admin "edit", CLI edit/cancel) must not wipe what
-                       -- job creation captured. A non-empty new value still wins.
-                       agent = COALESCE(NULLIF(excluded.agent, ''), agent),
-                       origin_user_id =
-                           COALESCE(NULLIF(excluded.origin_user_id, ''), origin_user_id),
-                       origin_chat_id =
-                           COALESCE(NULLIF(excluded.origin_chat_id, ''), origin_chat_id),
-                       updated_at = datetime('now')
-                """,
-                (
-                    job_id,
-                    type,
-                    schedule,
-                    cron,
-                    run_at,
-                    task,
-                    channel,
-                    status,
-                    created_by,
-                    description,
-                    agent,
-                    origin_user_id,
-                    origin_chat_id,
-                ),
-            )
-            await db.commit()
-            cursor = await db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-            row = await cursor.fetchone()
-        return dict(row) if row else {}
+        params = (
+            job_id,
+            type,
+            schedule,
+            cron,
+            run_at,
+            task,
+            channel,
+            status,
+            created_by,
+            description,
+            agent,
+            origin_user_id,
+            origin_chat_id,
+        )
+        return await self._run(lambda db: _upsert_job(db, params))
 
     async def update_status(self, job_id: str, status: str) -> bool:
         """Update only the status of a job."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "UPDATE jobs SET status = ?, updated_at = datetime('now') WHERE id = ?",
-                (status, job_id),
-            )
-            await db.commit()
+
+        def _update(db: sqlite3.Connection) -> bool:
+            with db:
+                cursor = db.execute(_SQL_UPDATE_STATUS, (status, _now(), job_id))
             return cursor.rowcount > 0
 
+        return await self._run(_update)
+
+    async def update_statuses(self, updates: list[tuple[str, str]]) -> int:
+        """Set several jobs' statuses in one statement. Returns rows changed.
+
+        ``updates`` is ``(job_id, status)`` pairs, applied through a single
+        ``CASE id WHEN ...`` UPDATE in one transaction — one commit for a
+        scheduler pass that retires many jobs, rather than one per job.
+        """
+        if not updates:
+            return 0
+        whens = " ".join("WHEN ? THEN ?" for _ in updates)
+        marks = ", ".join("?" * len(updates))
+        sql = (
+            f"UPDATE jobs SET status = CASE id {whens} END, updated_at = ? "  # noqa: S608
+            f"WHERE id IN ({marks})"
+        )
+        params = [v for pair in updates for v in pair]
+        params.append(_now())
+        params.extend(job_id for job_id, _ in updates)
+
+        def _update(db: sqlite3.Connection) -> int:
+            with db:
+                return db.execute(sql, params).rowcount
+
+        return await self._run(_update)
+
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job by ID."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-            await db.commit()
-            return cursor.rowcount > 0
+        return await self._run(lambda db: _delete_job(db, job_id))
 
     async def rename_agent(self, old: str, new: str) -> None:
         """Repoint jobs from a renamed agent slug (#69): the ``agent`` column
         and the ``telegram:<slug>`` channel a per-agent-bot job delivers to."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("UPDATE jobs SET agent = ? WHERE agent = ?", (new, old))
-            await db.execute(
-                "UPDATE jobs SET channel = ? WHERE channel = ?",
-                (f"telegram:{new}", f"telegram:{old}"),
-            )
-            await db.commit()
+
+        def _rename(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute("UPDATE jobs SET agent = ? WHERE agent = ?", (new, old))
+                db.execute(
+                    "UPDATE jobs SET channel = ? WHERE channel = ?",
+                    (f"telegram:{new}", f"telegram:{old}"),
+                )
+
+        await self._run(_rename)
 
     async def seed_from_config(self, jobs: list[dict]) -> int:
         """Seed jobs from config (on first boot). Only inserts, never overwrites.
 
         Returns count of newly inserted jobs.
         """
-        await self._ensure_schema()
-        inserted = 0
-        async with aiosqlite.connect(self.db_path) as db:
+        now = _now()
+
+        def _seed(db: sqlite3.Connection) -> int:
+            # Rows are built only for ids not stored yet, so an existing job's
+            # config entry is never read (it may lack fields, e.g. ``cron``).
+            seen = {row[0] for row in db.execute("SELECT id FROM jobs")}
+            rows = []
             for job in jobs:
-                cursor = await db.execute("SELECT 1 FROM jobs WHERE id = ?", (job["id"],))
-                if await cursor.fetchone():
+                if job["id"] in seen:
                     continue
-                await db.execute(
-                    """INSERT INTO jobs (id, type, schedule, cron, task, channel,
-                                         status, created_by, description, agent)
-                       VALUES (?, ?, 'cron', ?, ?, ?, 'active', 'config', '', ?)
-                    """,
+                seen.add(job["id"])
+                rows.append(
                     (
                         job["id"],
                         job.get("type", "agent"),
@@ -356,10 +492,17 @@ class JobStore:
                         job.get("task", ""),
                         job.get("channel", "telegram"),
                         job.get("agent", ""),
-                    ),
+                        now,
+                        now,
+                    )
                 )
-                inserted += 1
-            await db.commit()
+            # One statement for the whole batch.
+            before = db.total_changes
+            with db:
+                db.executemany(_SQL_SEED, rows)
+            return db.total_changes - before
+
+        inserted = await self._run(_seed)
         if inserted:
             log.info("Seeded %d jobs from config", inserted)
         return inserted
@@ -374,7 +517,8 @@ class JobStore:
         if not raw:
             return 0
         try:
-            jobs = json.loads(raw)
+            # Decoded off the event loop: this runs during boot, alongside bot start-up.
+            jobs = await asyncio.to_thread(json.loads, raw)
         except json.JSONDecodeError, TypeError:
             return 0
         if not isinstance(jobs, list):
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import contextvars
+import functools
 import importlib
 import json
 import logging
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, cast
 
 from anthropic import AsyncAnthropic
@@ -69,6 +70,22 @@ _DEFAULT_BASE_URLS = {
     "openrouter": "https://openrouter.ai/api/v1",  # #128: OpenAI-compatible gateway
 }
 
+# provider -> (api key attr, base URL attr) on AgentConfig; an unknown
+# provider falls back to anthropic. OpenRouter (#128) is OpenAI-compatible.
+_PROVIDER_CONFIG_ATTRS: dict[str, tuple[str, str | None]] = {
+    "anthropic": ("anthropic_api_key", None),
+    "openai": ("openai_api_key", "openai_base_url"),
+    "google": ("google_api_key", "google_base_url"),
+    "grok": ("grok_api_key", "grok_base_url"),
+    "deepseek": ("deepseek_api_key", "deepseek_base_url"),
+    "openrouter": ("openrouter_api_key", "openrouter_base_url"),
+}
+
+# Converted OpenAI tool lists kept per client, keyed by the identity of the
+# source list: the agent builds one tools list per turn and passes it on every
+# tool-call round, so only the first round of a turn converts.
+_OPENAI_TOOLS_CACHE_MAX = 8
+
 _ANTHROPIC_MODEL_ALIASES = {
     "claude-4-5-haiku": "claude-haiku-4-5",
 }
@@ -132,6 +149,10 @@ class LLMResponse:
     # response — including any tool-call arguments — was cut off mid-stream. The
     # agent loop surfaces this instead of running a half-built tool call.
     truncated: bool = False
+    # OpenAI-style SDK message, kept undumped: ``raw`` is filled from it only
+    # when assistant_message() needs it (tool-call rounds), so text-only turns
+    # skip the pydantic model_dump.
+    raw_message: Any = field(default=None, repr=False, compare=False)
 
 
 def _anthropic_usage(response: Any) -> dict[str, int] | None:
@@ -168,6 +189,24 @@ def _openai_usage(response: Any) -> dict[str, int] | None:
     }
 
 
+# Bound once: ``json.loads`` re-checks its keyword arguments on every call.
+_decode_json = json.JSONDecoder().decode
+
+
+def _openai_tool_arguments(raw: str | None) -> dict[str, Any]:
+    """Decode a tool call's JSON arguments; ``{}`` when absent or malformed.
+
+    Argument-less calls arrive as ``""`` or ``"{}"`` and skip the decoder.
+    """
+    if not raw or raw == "{}":
+        return {}
+    try:
+        args = _decode_json(raw)
+    except json.JSONDecodeError:
+        return {}
+    return args if isinstance(args, dict) else {}
+
+
 def _openai_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
     converted = []
     for tool in tools:
@@ -203,6 +242,9 @@ def _coalesce_user_messages(messages: list[dict[str, Any]]) -> list[dict[str, An
     multimodal falls back to concatenated content-part blocks (valid for both
     Anthropic and the OpenAI-compatible providers). Assistant/tool messages are
     left untouched — only plain user turns are ever produced back-to-back.
+
+    Returns a new list holding the caller's message dicts by reference; a merge
+    builds a fresh dict, so neither the input list nor its messages are mutated.
     """
     out: list[dict[str, Any]] = []
     for msg in messages:
@@ -214,7 +256,7 @@ def _coalesce_user_messages(messages: list[dict[str, Any]]) -> list[dict[str, An
                 merged = _as_content_blocks(prev) + _as_content_blocks(cur)
             out[-1] = {**out[-1], "content": merged}
         else:
-            out.append(dict(msg))
+            out.append(msg)
     return out
 
 
@@ -230,6 +272,17 @@ def _normalize_model(provider: str, model: str) -> str:
     return value
 
 
+@functools.cache
+def _openai_client_class() -> Any:
+    """``openai.AsyncOpenAI``, looked up once per process.
+
+    Clients are built per agent and per background call; caching the class
+    keeps ``import_module`` (and its import lock) off that path. A failed
+    import is not cached, so installing the package later still works.
+    """
+    return getattr(importlib.import_module("openai"), "AsyncOpenAI")
+
+
 class LLMClient:
     def __init__(
         self,
@@ -244,14 +297,17 @@ class LLMClient:
         # Sampling temperature (#12). None = use the provider default. Set by the
         # caller on the main agent client; applied via _sampling_kwargs().
         self.temperature: float | None = None
+        # id(tools) -> (tools, converted); holding ``tools`` keeps its id unique.
+        self._openai_tools_cache: OrderedDict[
+            int, tuple[list[dict[str, Any]], list[dict[str, Any]]]
+        ] = OrderedDict()
         self._client: Any
         if self.provider == "anthropic":
             self._client = AsyncAnthropic(api_key=api_key, timeout=60)
         else:
             resolved_base = base_url or _DEFAULT_BASE_URLS.get(self.provider)
             try:
-                module = importlib.import_module("openai")
-                client_class = cast(Any, getattr(module, "AsyncOpenAI"))
+                client_class = _openai_client_class()
             except Exception as exc:
                 raise RuntimeError("openai package is required for this provider") from exc
             client_kwargs: dict[str, Any] = {
@@ -284,49 +340,29 @@ class LLMClient:
             kwargs["temperature"] = self.temperature
         return kwargs
 
+    def _converted_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """``_openai_tools(tools)``, reused while the same list is passed again."""
+        key = id(tools)
+        hit = self._openai_tools_cache.get(key)
+        if hit is not None and hit[0] is tools:
+            self._openai_tools_cache.move_to_end(key)
+            return hit[1]
+        converted = _openai_tools(tools)
+        self._openai_tools_cache[key] = (tools, converted)
+        while len(self._openai_tools_cache) > _OPENAI_TOOLS_CACHE_MAX:
+            self._openai_tools_cache.popitem(last=False)
+        return converted
+
     @classmethod
     def from_agent_config(cls, config) -> LLMClient:
         provider = _normalize_provider(getattr(config, "llm_provider", "anthropic"))
         thinking = getattr(config, "thinking_level", "")
-        if provider == "anthropic":
-            return cls(provider, getattr(config, "anthropic_api_key", ""), thinking_level=thinking)
-        if provider == "openai":
-            return cls(
-                provider,
-                getattr(config, "openai_api_key", ""),
-                getattr(config, "openai_base_url", ""),
-                thinking_level=thinking,
-            )
-        if provider == "google":
-            return cls(
-                provider,
-                getattr(config, "google_api_key", ""),
-                getattr(config, "google_base_url", ""),
-                thinking_level=thinking,
-            )
-        if provider == "grok":
-            return cls(
-                provider,
-                getattr(config, "grok_api_key", ""),
-                getattr(config, "grok_base_url", ""),
-                thinking_level=thinking,
-            )
-        if provider == "deepseek":
-            return cls(
-                provider,
-                getattr(config, "deepseek_api_key", ""),
-                getattr(config, "deepseek_base_url", ""),
-                thinking_level=thinking,
-            )
-        if provider == "openrouter":
-            # OpenAI-compatible; empty base_url falls back to _DEFAULT_BASE_URLS.
-            return cls(
-                provider,
-                getattr(config, "openrouter_api_key", ""),
-                getattr(config, "openrouter_base_url", ""),
-                thinking_level=thinking,
-            )
-        return cls("anthropic", getattr(config, "anthropic_api_key", ""), thinking_level=thinking)
+        if provider not in _PROVIDER_CONFIG_ATTRS:
+            provider = "anthropic"
+        key_attr, base_url_attr = _PROVIDER_CONFIG_ATTRS[provider]
+        # An empty base_url falls back to _DEFAULT_BASE_URLS in __init__.
+        base_url = getattr(config, base_url_attr, "") if base_url_attr else None
+        return cls(provider, getattr(config, key_attr, ""), base_url, thinking_level=thinking)
 
     async def generate(
         self,
@@ -341,9 +377,10 @@ class LLMClient:
         # Collapse any run of consecutive user turns (group rooms record silent
         # turns between replies, #30) so the array honours strict alternation.
         messages = _coalesce_user_messages(messages)
-        # Snapshot the exact request for the Inspect tab (#99). Shallow-copy the
-        # lists so the caller's later mutations (tool-result ping-pong) don't edit
-        # what we stored; each generate() overwrites, so the slot holds last-sent.
+        # Snapshot the exact request for the Inspect tab (#99). ``messages`` is
+        # already our own list (built by the coalesce above), so the caller's later
+        # mutations (tool-result ping-pong) can't edit what we stored; only the
+        # caller's tools list needs a copy. Each generate() overwrites the slot.
         # We keep a reference so the real token usage from the response can be
         # backfilled below (#116) — the Inspect tab shows context size + % window.
         payload = {
@@ -352,7 +389,7 @@ class LLMClient:
             "model": resolved_model,
             "max_tokens": max_tokens,
             "system": system,
-            "messages": list(messages),
+            "messages": messages,
             "tools": list(tools),
         }
         record_sent_payload(_capture_ctx.get(), payload)
@@ -383,7 +420,8 @@ class LLMClient:
             reasoning_parts = []
             for block in response.content:
                 block_any = cast(Any, block)
-                if getattr(block_any, "type", None) == "tool_use":
+                block_type = getattr(block_any, "type", None)
+                if block_type == "tool_use":
                     tool_calls.append(
                         LLMToolCall(
                             id=getattr(block_any, "id", ""),
@@ -391,17 +429,23 @@ class LLMClient:
                             arguments=getattr(block_any, "input", {}),
                         )
                     )
-                if getattr(block_any, "type", None) == "text":
-                    text_parts.append(getattr(block_any, "text", ""))
-                if getattr(block_any, "type", None) == "thinking":
-                    reasoning_parts.append(getattr(block_any, "thinking", ""))
-            reasoning = "\n".join(p for p in reasoning_parts if p).strip()
+                elif block_type == "text":
+                    # Stripped per block (empties dropped) so the final join is
+                    # the only copy of the response text.
+                    text = getattr(block_any, "text", "").strip()
+                    if text:
+                        text_parts.append(text)
+                elif block_type == "thinking":
+                    thought = getattr(block_any, "thinking", "").strip()
+                    if thought:
+                        reasoning_parts.append(thought)
+            reasoning = "\n".join(reasoning_parts)
             if reasoning:
                 reasoning_log.info("%s", reasoning)
             usage = _anthropic_usage(response)
             payload["usage"] = usage  # backfill real context size for Inspect (#116)
             return LLMResponse(
-                text="\n".join(text_parts).strip(),
+                text="\n".join(text_parts),
                 tool_calls=tool_calls,
                 reasoning=reasoning,
                 raw=response.content,
@@ -409,7 +453,7 @@ class LLMClient:
                 truncated=getattr(response, "stop_reason", None) == "max_tokens",
             )
 
-        openai_tools = _openai_tools(tools)
+        openai_tools = self._converted_tools(tools)
         client_any = cast(Any, self._client)
         full_messages = [{"role": "system", "content": system}, *messages]
         response = await client_any.chat.completions.create(
@@ -422,11 +466,7 @@ class LLMClient:
         message = response.choices[0].message
         tool_calls = []
         for call in message.tool_calls or []:
-            args = {}
-            try:
-                args = json.loads(call.function.arguments or "{}")
-            except json.JSONDecodeError:
-                args = {}
+            args = _openai_tool_arguments(call.function.arguments)
             tool_calls.append(LLMToolCall(id=call.id, name=call.function.name, arguments=args))
         # DeepSeek/others expose CoT as message.reasoning_content (or .reasoning).
         reasoning = (
@@ -440,7 +480,7 @@ class LLMClient:
             text=(message.content or "").strip(),
             tool_calls=tool_calls,
             reasoning=reasoning,
-            raw=message.model_dump(exclude_none=True),
+            raw_message=message,
             usage=usage,
             truncated=getattr(response.choices[0], "finish_reason", None) == "length",
         )
@@ -448,6 +488,8 @@ class LLMClient:
     def assistant_message(self, response: LLMResponse) -> dict[str, Any]:
         if self.provider == "anthropic":
             return {"role": "assistant", "content": response.raw or response.text}
+        if response.raw is None and response.raw_message is not None:
+            response.raw = response.raw_message.model_dump(exclude_none=True)
         if isinstance(response.raw, dict):
             return response.raw
         return {"role": "assistant", "content": response.text}
@@ -476,15 +518,34 @@ class LLMClient:
             for r in tool_results
         ]
 
-    async def generate_text(self, *, model: str, prompt: str, max_tokens: int = 1024) -> str:
+    async def generate_text(
+        self, *, model: str, prompt: str, max_tokens: int = 1024, cached_prefix: str = ""
+    ) -> str:
+        """One-shot text completion for *prompt*.
+
+        ``cached_prefix`` is static instruction text sent ahead of the prompt.
+        On Anthropic it is its own content block marked as a cache breakpoint,
+        so repeated calls with the same prefix skip reprocessing it; other
+        providers get it prepended (their prefix caching is automatic).
+        """
         resolved_model = _normalize_model(self.provider, model)
         if self.provider == "anthropic":
             client_any = cast(Any, self._client)
             messages_client = cast(Any, getattr(client_any, "messages"))  # type: ignore[attr-defined]
+            content: Any = prompt
+            if cached_prefix:
+                content = [
+                    {
+                        "type": "text",
+                        "text": cached_prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": prompt},
+                ]
             response = await messages_client.create(
                 model=resolved_model,
                 max_tokens=max_tokens,
-                messages=cast(Any, [{"role": "user", "content": prompt}]),
+                messages=cast(Any, [{"role": "user", "content": content}]),
                 **self._sampling_kwargs(),
             )
             for block in response.content:
@@ -493,6 +554,8 @@ class LLMClient:
                     return str(getattr(block_any, "text", "")).strip()
             return ""
 
+        if cached_prefix:
+            prompt = f"{cached_prefix}\n\n{prompt}"
         client_any = cast(Any, self._client)
         response = await client_any.chat.completions.create(
             model=resolved_model,
@@ -14,20 +14,26 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from contextlib import asynccontextmanager
 from os import environ
+from typing import TYPE_CHECKING
 
 import uvicorn
 from fastapi import Depends, Request
 from fastapi.responses import HTMLResponse
 
-from api.admin import AgentState, create_admin_app, install_log_buffer
+from api.admin import AgentState, close_admin_stores, create_admin_app, install_log_buffer
+from core.config import Config, VoiceConfig
 from core.config_store import ConfigStore
 from core.email_config import materialize_himalaya_config
 from core.secret_store import SecretStore
 
+if TYPE_CHECKING:
+    from voice.pipeline import VoicePipeline
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)-8s %(name)s — %(message)s",
@@ -37,22 +43,76 @@ log = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+# How long a stop waits for bots still connecting before giving up on them.
+_CHANNEL_STARTUP_TIMEOUT = 15.0
+
 # Install the in-memory log buffer handler before anything else
 install_log_buffer()
 
 
+# (store, store data_version, infra secrets) -> Config from the last export.
+_exported_config: tuple[tuple, Config] | None = None
+
+
+async def _export_config(config_store: ConfigStore) -> Config:
+    """Export the stored config, reusing the previous export when unchanged.
+
+    A restart with no config or vault edits in between gets the Config object
+    the last start validated instead of rescanning and revalidating the store.
+    """
+    global _exported_config
+    infra = await _secret_store.load_infra_cache()
+    key = (config_store, config_store.data_version, tuple(sorted(infra.items())))
+    if _exported_config is not None and _exported_config[0] == key:
+        return _exported_config[1]
+    config = await config_store.export_to_config(vault_resolve=_secret_store.infra_resolve)
+    _exported_config = (key, config)
+    return config
+
+
+def _load_voice(voice_config: VoiceConfig) -> VoicePipeline:
+    """Import and build the voice pipeline (blocking: loads the STT/TTS models)."""
+    from voice.pipeline import VoicePipeline
+
+    log.info(
+        "Initializing voice pipeline (model=%s, voice=%s, backend=%s)…",
+        voice_config.stt_model,
+        voice_config.tts_voice,
+        voice_config.backend,
+    )
+    return VoicePipeline(
+        stt_model=voice_config.stt_model,
+        tts_voice=voice_config.tts_voice,
+        tts_enabled=voice_config.tts_enabled,
+        backend=voice_config.backend,
+        kokoro_model_path=voice_config.kokoro.model_path,
+        kokoro_voices_path=voice_config.kokoro.voices_path,
+        kokoro_default_voice=voice_config.kokoro.default_voice,
+    )
+
+
 async def _start_agent(config_store: ConfigStore):
-    """Build and start the full agent (channels, scheduler, voice)."""
-    from channels.telegram import TelegramChannel
+    """Build and start the full agent (channels, scheduler, voice).
+
+    The Telegram and voice modules (python-telegram-bot, faster-whisper) are
+    imported only in the branches that use them, so a start without bots or
+    voice doesn't pay for loading them.
+    """
     from core.agent import AgentCore
     from core.config import GroupChatConfig, TelegramConfig
-    from voice.pipeline import VoicePipeline
 
     # Decrypt infra secrets into memory so ${vault:NAME} resolves at config load
     # (with .env fallback). Then build the config and hand the shared secret store
     # to the agent so the executor can resolve {{secret:NAME}} at runtime.
-    await _secret_store.load_infra_cache()
-    config = await config_store.export_to_config(vault_resolve=_secret_store.infra_resolve)
+    config = await _export_config(config_store)
+
+    # Loading the voice models is blocking disk + CPU work: run it in a worker
+    # thread while the agent is built and the migrations below run.
+    voice_load = (
+        asyncio.create_task(asyncio.to_thread(_load_voice, config.voice))
+        if config.voice.tts_enabled
+        else None
+    )
 
     agent = AgentCore(config, secret_store=_secret_store)
 
@@ -103,31 +163,19 @@ async def _start_agent(config_store: ConfigStore):
     # the bare "telegram" channel, so move the staged config onto that agent.
     await _migrate_telegram_to_default_agent(config_store, agent)
 
-    # -- Voice pipeline --
-    voice: VoicePipeline | None = None
-    if config.voice.tts_enabled:
-        log.info(
-            "Initializing voice pipeline (model=%s, voice=%s, backend=%s)…",
-            config.voice.stt_model,
-            config.voice.tts_voice,
-            config.voice.backend,
-        )
-        voice = VoicePipeline(
-            stt_model=config.voice.stt_model,
-            tts_voice=config.voice.tts_voice,
-            tts_enabled=config.voice.tts_enabled,
-            backend=config.voice.backend,
-            kokoro_model_path=config.voice.kokoro.model_path,
-            kokoro_voices_path=config.voice.kokoro.voices_path,
-            kokoro_default_voice=config.voice.kokoro.default_voice,
-        )
-        agent.voice = voice
+    # -- Voice pipeline (loading started above) --
+    voice = None
+    if voice_load is not None:
+        voice = agent.voice = await voice_load
 
     # -- Telegram: each agent runs its own bot from its own token (#29/#133). The
     # default agent's bot is the bare "telegram" channel; every other agent's is
     # "telegram:<agent>". A single bad/revoked token must never abort the others,
     # WhatsApp, or the scheduler — each bot is brought up independently.
     async def _start_tg(conf, channel_name: str) -> None:
+        from channels.telegram import TelegramChannel
+
+        tg = None
         try:
             tg = TelegramChannel(conf, agent, voice=voice, channel_name=channel_name)
             await tg.app.initialize()
@@ -136,45 +184,56 @@ async def _start_agent(config_store: ConfigStore):
                 await tg.app.updater.start_polling()
             agent.channels[channel_name] = tg  # registered only once it is actually polling
             log.info("Telegram bot started (%s)", channel_name)
+        except asyncio.CancelledError:
+            # A stop gave up waiting on this bot: undo whatever part of the start
+            # got through, since an unregistered bot is never stopped otherwise.
+            if tg is not None:
+                await _teardown_telegram_app(tg.app, channel_name)
+            raise
         except Exception:
             log.exception("Failed to start Telegram bot %s — skipping", channel_name)
 
-    try:
-        seen_tokens: set[str] = set()
-        for ag in await agent.agents.list_agents():
-            token = (ag.bot_token or "").strip()
-            if not token:
-                continue  # no own bot
-            if token in seen_tokens:
-                log.warning(
-                    "Agent %s shares a bot token with another bot — skipping its bot "
-                    "(one token can only be polled once)",
-                    ag.name,
-                )
-                continue
-            seen_tokens.add(token)
-            channel_name = "telegram" if ag.is_default else f"telegram:{ag.name}"
-            pconf = TelegramConfig(
-                enabled=True,
-                bot_token=token,
-                allowed_user_ids=ag.allowed_user_ids,
-                group_chat=GroupChatConfig(**ag.group_chat) if ag.group_chat else GroupChatConfig(),
+    bots: list[tuple[TelegramConfig, str]] = []
+    seen_tokens: set[str] = set()
+    for ag in await agent.agents.list_agents():
+        token = (ag.bot_token or "").strip()
+        if not token:
+            continue  # no own bot
+        if token in seen_tokens:
+            log.warning(
+                "Agent %s shares a bot token with another bot — skipping its bot "
+                "(one token can only be polled once)",
+                ag.name,
             )
-            await _start_tg(pconf, channel_name)
-
-        # WhatsApp is a tool now (#97), not a channel: the agent reads/sends via
-        # the `wacli` CLI through run_command. Linking/sync live on the admin app's
-        # WacliManager (api/admin.py); no inbound channel to start here.
-
-        # -- Scheduler --
-        await agent.scheduler.load_jobs()
-        agent.scheduler.start()
-        log.info("Scheduler started with %d jobs", len(agent.scheduler.scheduler.get_jobs()))
-    except Exception:
-        # Bring-up failed after some bots were already polling — stop them so we
-        # don't leak orphaned pollers (which would 409 on the next start).
-        await _stop_telegram_bots(agent)
-        raise
+            continue
+        seen_tokens.add(token)
+        channel_name = "telegram" if ag.is_default else f"telegram:{ag.name}"
+        pconf = TelegramConfig(
+            enabled=True,
+            bot_token=token,
+            allowed_user_ids=ag.allowed_user_ids,
+            group_chat=GroupChatConfig(**ag.group_chat) if ag.group_chat else GroupChatConfig(),
+        )
+        bots.append((pconf, channel_name))
+
+    # WhatsApp is a tool now (#97), not a channel: the agent reads/sends via
+    # the `wacli` CLI through run_command. Linking/sync live on the admin app's
+    # WacliManager (api/admin.py); no inbound channel to start here.
+
+    # -- Scheduler --
+    job_count = await agent.scheduler.load_jobs()
+    agent.scheduler.start()
+    log.info("Scheduler started with %d jobs", job_count)
+
+    # -- Bots connect last, concurrently and in the background: the start (and
+    # boot) returns once the agent can take work instead of after every bot's
+    # initialize/start/start_polling round-trips. Nothing is polling before
+    # this point, so a failure above leaves no orphaned poller behind. Each bot
+    # registers in agent.channels once polling; sends wait via agent.get_channel.
+    if bots:
+        agent.channel_startup = asyncio.gather(
+            *(_start_tg(pconf, channel_name) for pconf, channel_name in bots)
+        )
 
     return agent
 
@@ -266,6 +325,18 @@ async def _migrate_telegram_to_default_agent(config_store, agent) -> None:
             await config_store.delete(key)
 
 
+async def _teardown_telegram_app(app, name: str) -> None:
+    """Best-effort stop of a bot whose start was interrupted part-way."""
+    try:
+        if app.updater is not None and app.updater.running:
+            await app.updater.stop()
+        if app.running:
+            await app.stop()
+        await app.shutdown()
+    except Exception:
+        log.exception("Error tearing down Telegram bot %s", name)
+
+
 async def _stop_telegram_bots(agent) -> None:
     """Stop and deregister the default bot and every per-agent bot (#29).
 
@@ -293,7 +364,28 @@ async def _stop_agent(agent) -> None:
 
     set_agent_context(None)
 
+    if agent.channel_startup is not None:
+        # Let bots still connecting finish first, so none is left polling
+        # unregistered after the stop (it would 409 on the next start). A bot
+        # stuck on the network is cancelled instead, so a stop can't hang.
+        startup = agent.channel_startup
+        try:
+            await asyncio.wait_for(asyncio.shield(startup), _CHANNEL_STARTUP_TIMEOUT)
+        except TimeoutError:
+            log.warning(
+                "Telegram bots still connecting after %.0fs — cancelling", _CHANNEL_STARTUP_TIMEOUT
+            )
+            startup.cancel()
+            # Bounded too: the cancelled bots' teardown talks to the network.
+            await asyncio.wait({startup}, timeout=_CHANNEL_STARTUP_TIMEOUT)
+        agent.channel_startup = None
     await _stop_telegram_bots(agent)
+    # No new turns can start now; let in-flight memory extraction / reflection
+    # finish before their stores are closed under them.
+    await agent.drain_background()
+    await agent.history.close()
+    await agent.job_store.close()
+    await agent.memory.close()
 
 
 # ---------------------------------------------------------------------------
@@ -316,21 +408,28 @@ async def _lifespan(application):  # noqa: ANN001
 
     load_dotenv()
     await _config_store.seed_if_empty()
-    await _config_store.ensure_admin_password()
-    # Initialise the agent vault's wrapped DEK when an admin password is set via
-    # the environment (the only point at boot where plaintext is available). When
-    # the password is set through the wizard/UI instead, the admin routes mint it.
-    seed_pw = environ.get("ADMIN_PASSWORD") or environ.get("ADMIN_API_KEY")
-    if seed_pw:
-        await _secret_store.ensure_wrapped_dek(seed_pw)
-    # Load the infra-vault cache and attach its resolver to the config store so the
-    # Himalaya materialisation below can expand ${vault:NAME} email passwords (#110).
-    # Safe with no master key: the cache is empty and infra_resolve falls back to env.
-    await _secret_store.load_infra_cache()
-    _config_store.vault_resolve = _secret_store.infra_resolve
-    await materialize_himalaya_config(_config_store)
-
-    setup_complete = await _config_store.is_setup_complete()
+
+    async def _prepare_vaults() -> None:
+        # Initialise the agent vault's wrapped DEK when an admin password is set via
+        # the environment (the only point at boot where plaintext is available). When
+        # the password is set through the wizard/UI instead, the admin routes mint it.
+        seed_pw = environ.get("ADMIN_PASSWORD") or environ.get("ADMIN_API_KEY")
+        if seed_pw:
+            await _secret_store.ensure_wrapped_dek(seed_pw)
+        # Load the infra-vault cache and attach its resolver to the config store so
+        # the Himalaya materialisation can expand ${vault:NAME} email passwords (#110).
+        # Safe with no master key: the cache is empty and infra_resolve falls back to env.
+        await _secret_store.load_infra_cache()
+        _config_store.vault_resolve = _secret_store.infra_resolve
+        await materialize_himalaya_config(_config_store)
+
+    # Everything after the seed only needs the seeded store, so the admin-password
+    # check, the vault/Himalaya chain and the setup-state read run side by side.
+    _, _, setup_complete = await asyncio.gather(
+        _config_store.ensure_admin_password(),
+        _prepare_vaults(),
+        _config_store.is_setup_complete(),
+    )
 
     if setup_complete:
         log.info("Setup complete — starting agent")
@@ -349,11 +448,18 @@ async def _lifespan(application):  # noqa: ANN001
 
     # -- shutdown --
     log.info("Shutting down…")
+    # Let an in-flight start (warmup, /agent/start) or restart land so the
+    # agent it builds is stopped too.
+    if _agent_state.start_task is not None:
+        await asyncio.shield(_agent_state.start_task)
+    if _agent_state.restart_task is not None:
+        await asyncio.shield(_agent_state.restart_task)
     if _agent_state.agent:
         _agent_state.status = "STOPPING"
         await _stop_agent(_agent_state.agent)
         _agent_state.agent = None
         _agent_state.status = "STOPPED"
+    await close_admin_stores()
 
 
 # ---------------------------------------------------------------------------
@@ -368,7 +474,7 @@ app, _auth = create_admin_app(
 def _attach_lifecycle_routes(
     application, config_store: ConfigStore, agent_state: AgentState, auth
 ) -> None:
-    """Add /agent/start, /agent/stop, and /agent/restart endpoints.
+    """Add /agent/warmup, /agent/start, /agent/stop, and /agent/restart endpoints.
 
     These share the same ``AgentState`` object used by ``create_admin_app``
     so all endpoints see agent changes immediately.
@@ -378,9 +484,41 @@ def _attach_lifecycle_routes(
     wizard's fetch() call).
     """
 
+    # Single-flight restarts: overlapping clicks would otherwise each build an
+    # AgentCore (duplicate bots and schedulers, and a teardown that misses one).
+    restart_lock = asyncio.Lock()
+
     def _is_htmx(request: Request) -> bool:
         return request.headers.get("HX-Request") == "true"
 
+    async def _run_start() -> Exception | None:
+        try:
+            agent_state.agent = await _start_agent(config_store)
+            log.info("Agent started via API")
+            agent_state.status = "RUNNING"
+            return None
+        except Exception as exc:
+            log.exception("Failed to start agent via API")
+            agent_state.status = "STOPPED"
+            return exc
+        finally:
+            agent_state.start_task = None
+
+    def _begin_start() -> asyncio.Task:
+        """Return the in-flight start task, launching one if none is running."""
+        if agent_state.start_task is None:
+            agent_state.status = "STARTING"
+            agent_state.start_task = asyncio.create_task(_run_start(), name="agent-start")
+        return agent_state.start_task
+
+    @application.post("/agent/warmup", dependencies=[Depends(auth)])
+    async def warmup_agent():
+        """Start a stopped agent in the background (fired on Start-button hover)
+        so the click that follows only waits for whatever is left of the start."""
+        if agent_state.agent is None and agent_state.status == "STOPPED":
+            _begin_start()
+        return {"status": agent_state.status.lower()}
+
     @application.post("/agent/start", dependencies=[Depends(auth)])
     async def start_agent(request: Request):
         if agent_state.agent is not None:
@@ -388,25 +526,25 @@ def _attach_lifecycle_routes(
                 "status": "already_running",
                 "channels": list(agent_state.agent.channels.keys()),
             }
+        elif agent_state.restart_task is not None or restart_lock.locked():
+            # A restart is between its stop and its start; it brings the agent up.
+            result = {"status": "starting"}
         else:
-            try:
-                agent_state.status = "STARTING"
-                agent_state.agent = await _start_agent(config_store)
-                log.info("Agent started via API")
-                agent_state.status = "RUNNING"
+            # Shielded: a client disconnecting mid-start must not cancel a start
+            # that a warmup (or another click) is sharing.
+            exc = await asyncio.shield(_begin_start())
+            if exc is None and agent_state.agent is not None:
                 result = {
                     "status": "started",
                     "channels": list(agent_state.agent.channels.keys()),
                 }
-            except Exception as exc:
-                log.exception("Failed to start agent via API")
-                agent_state.status = "STOPPED"
-                result = {"status": "error", "error": str(exc)}
+            else:
+                result = {"status": "error", "error": str(exc or "agent stopped while starting")}
 
         if _is_htmx(request):
             css = (
                 "alert-success"
-                if result["status"] in ("started", "already_running")
+                if result["status"] in ("started", "already_running", "starting")
                 else "alert-error"
             )
             label = result["status"].replace("_", " ").title()
@@ -417,6 +555,10 @@ def _attach_lifecycle_routes(
 
     @application.post("/agent/stop", dependencies=[Depends(auth)])
     async def stop_agent(request: Request):
+        # A start in flight (warmup or a click) would bring the agent up right
+        # after a "not running" reply; let it land so it is stopped here.
+        if agent_state.start_task is not None:
+            await asyncio.shield(agent_state.start_task)
         if agent_state.agent is None:
             result = {"status": "not_running"}
         else:
@@ -440,40 +582,54 @@ def _attach_lifecycle_routes(
             return resp
         return result
 
-    @application.post("/agent/restart", dependencies=[Depends(auth)])
-    async def restart_agent(request: Request):
-        # Stop
-        if agent_state.agent is not None:
-            try:
-                agent_state.status = "STOPPING"
-                await _stop_agent(agent_state.agent)
-            except Exception:
-                log.exception("Error during agent stop (restart)")
-            agent_state.agent = None
-            agent_state.status = "STOPPED"
-
-        # Start
+    async def _restart() -> None:
+        """Stop then start the agent; runs as ``agent_state.restart_task``."""
         try:
+            async with restart_lock:
+                # Let an in-flight start (warmup or /agent/start) land so it is stopped too.
+                if agent_state.start_task is not None:
+                    await asyncio.shield(agent_state.start_task)
+
+                # Stop
+                if agent_state.agent is not None:
+                    try:
+                        agent_state.status = "STOPPING"
+                        await _stop_agent(agent_state.agent)
+                    except Exception:
+                        log.exception("Error during agent stop (restart)")
+                    agent_state.agent = None
+                    agent_state.status = "STOPPED"
+
+                # Start
+                try:
+                    agent_state.status = "RESTARTING"
+                    agent_state.agent = await _start_agent(config_store)
+                    log.info("Agent restarted via API")
+                    agent_state.status = "RUNNING"
+                except Exception:
+                    log.exception("Failed to restart agent via API")
+                    agent_state.status = "STOPPED"
+        finally:
+            agent_state.restart_task = None
+
+    @application.post("/agent/restart", dependencies=[Depends(auth)], status_code=202)
+    async def restart_agent(request: Request):
+        """Accept a restart and run it as a task that outlives the request.
+
+        Stop + start can take seconds; clients follow progress through
+        ``/agent/status`` (RESTARTING → RUNNING, or STOPPED on failure).
+        """
+        if agent_state.restart_task is None:
+            # Created before any await, so a second click already sees it; the
+            # task owns the lock, so a failed or cancelled response can't leak it.
             agent_state.status = "RESTARTING"
-            agent_state.agent = await _start_agent(config_store)
-            log.info("Agent restarted via API")
-            agent_state.status = "RUNNING"
-            result = {
-                "status": "restarted",
-                "channels": list(agent_state.agent.channels.keys()),
-            }
-        except Exception as exc:
-            log.exception("Failed to restart agent via API")
-            agent_state.status = "STOPPED"
-            result = {"status": "error", "error": str(exc)}
+            agent_state.restart_task = asyncio.create_task(_restart(), name="agent-restart")
 
         if _is_htmx(request):
-            css = "alert-success" if result["status"] == "restarted" else "alert-error"
-            label = result["status"].replace("_", " ").title()
-            resp = HTMLResponse(f'<span class="{css}">{label}</span>')
+            resp = HTMLResponse('<span class="alert-success">Restarting</span>', status_code=202)
             resp.headers["HX-Trigger"] = "refresh-status"
             return resp
-        return result
+        return {"status": "restarting"}
 
 
 _attach_lifecycle_routes(app, _config_store, _agent_state, _auth)
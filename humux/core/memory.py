@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
 import re
+import sqlite3
+import threading
 import time
+from collections.abc import Callable, Set
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
-import aiosqlite
-
 from core.embeddings import (
     EmbeddingClient,
     cosine_similarity,
@@ -22,18 +26,40 @@ from core.llm import LLMClient
 
 log = logging.getLogger(__name__)
 
-_SCHEMA_FILE = Path(__file__).resolve().parent.parent / "schema" / "memory.sql"
+# Read once at import: the schema file is static, so opening a store does no
+# file I/O beyond the connect.
+_SCHEMA_SQL = (Path(__file__).resolve().parent.parent / "schema" / "memory.sql").read_text()
 
-_CONSOLIDATION_PROMPT = """\
+# The two prompt-injection reads; ``{scope}`` takes a _scope_filter() clause.
+_SQL_RECENT_LONG_TERM = (
+    "SELECT category, subject, content FROM long_term "
+    "WHERE archived = 0{scope} ORDER BY updated_at DESC LIMIT ?"
+)
+_SQL_ACTIVE_SHORT_TERM = (
+    "SELECT content, context FROM short_term "
+    "WHERE expires_at > ?{scope} ORDER BY created_at DESC LIMIT ?"
+)
+
+# WAL lets prompt-building reads run alongside extraction writes (and the
+# sqlite3 CLI skill), and NORMAL sync skips the fsync per commit. The one
+# long-lived connection gets a ~20 MB page cache (negative = KiB) so the hot
+# tables stay in memory between turns.
+_PRAGMAS = ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-20000")
+# The read-only connection inherits WAL from the file; it only needs the caches.
+_READER_PRAGMAS = ("temp_store=MEMORY", "cache_size=-20000")
+
+# Per-connection prepared-statement cache. Statements are keyed by their SQL
+# text and each scope filter yields its own variant, so leave ample headroom.
+_CACHED_STATEMENTS = 256
+
+# Extraction and consolidation send their static instructions as a separate
+# ``cached_prefix`` (a prompt-cache breakpoint on Anthropic) ahead of the
+# per-call data, so the instructions must not contain any placeholders.
+_CONSOLIDATION_INSTRUCTIONS = """\
 You are reviewing short-term memories stored by a personal AI assistant.
 Your job is to decide which short-term memories contain facts worth keeping
-permanently, and compact them into long-term memories.
-
-## Existing long-term memories (for deduplication)
-{existing_long_term}
-
-## Short-term memories to review
-{short_term_entries}
+permanently, and compact them into long-term memories. The existing long-term
+memories and the short-term memories to review follow these instructions.
 
 For each short-term memory, decide:
 1. PROMOTE — the fact is durable and worth keeping. Compact it aggressively
@@ -49,8 +75,8 @@ For each short-term memory, decide:
 2. DISCARD — the fact is time-bound, stale, or already captured in long-term memory.
 
 Return a JSON array of objects to promote. Each object:
-  {{"category": "<category>", "subject": "<who/what>", \
-"content": "<compacted fact>"}}
+  {"category": "<category>", "subject": "<who/what>", \
+"content": "<compacted fact>"}
 
 Categories: preference, relationship, fact, routine, work, health, travel
 
@@ -62,7 +88,14 @@ Rules:
 - If a short-term memory refines or updates an existing long-term memory,
   promote it with the updated content (it will replace the old one).
 - Use lowercase for subject (e.g. "matteo", "simge").
-- If nothing is worth promoting, return an empty array: []
+- If nothing is worth promoting, return an empty array: []"""
+
+_CONSOLIDATION_PROMPT = """\
+## Existing long-term memories (for deduplication)
+{existing_long_term}
+
+## Short-term memories to review
+{short_term_entries}
 
 Respond with ONLY the JSON array, no other text."""
 
@@ -123,13 +156,10 @@ Return ONLY a JSON object describing the changes to apply:
 
 Respond with ONLY the JSON object, no other text."""
 
-_EXTRACTION_PROMPT = """\
-Given this conversation exchange, identify any facts worth remembering.
+_EXTRACTION_INSTRUCTIONS = """\
+Identify any facts worth remembering from the conversation exchange that
+follows these instructions.
 
-User: {user_msg}
-Assistant: {agent_msg}
-{recent_turns_block}
-{existing_memories_block}\
 For each fact, classify it into ONE of these tiers:
 
 LONG_TERM — durable facts that remain true indefinitely:
@@ -150,12 +180,12 @@ SHORT_TERM — situational context that expires:
 
 When in doubt between LONG_TERM and SHORT_TERM, choose SHORT_TERM. Only use
 LONG_TERM for facts you are highly confident will still be true months from now.
-{scope_block}
+
 Return a JSON array (max 3 items). Each element must be one of:
-  {{"tier": "LONG_TERM", "category": "<category>", \
-"subject": "<who/what>", "content": "<the fact>"}}
-  {{"tier": "SHORT_TERM", "content": "<the fact>", \
-"context": "<why stored>", "ttl_hours": <int>}}
+  {"tier": "LONG_TERM", "category": "<category>", \
+"subject": "<who/what>", "content": "<the fact>"}
+  {"tier": "SHORT_TERM", "content": "<the fact>", \
+"context": "<why stored>", "ttl_hours": <int>}
 
 Categories: preference, relationship, fact, routine, work, health, travel
 
@@ -164,7 +194,7 @@ Rules:
   acknowledgements, and anything already obvious from the conversation.
 - Most conversation turns contain NOTHING worth remembering. Return [] liberally.
 - Do NOT extract facts that duplicate or overlap with the existing memories
-  listed above.
+  listed below.
 - Use lowercase for subject (e.g. "matteo", "simge").
 - For LONG_TERM, always set category and subject.
 - For SHORT_TERM, you MUST set ttl_hours:
@@ -172,12 +202,36 @@ Rules:
   - 8-12h: day-scoped situations ("working from home today")
   - 24-48h: near-term plans ("dinner with Marco tomorrow")
   - 72-168h: week-scoped context ("Simge visiting parents this week")
-- If nothing is worth remembering, return an empty array: []
+- If nothing is worth remembering, return an empty array: []"""
 
+# The existing-memories list rides in the cached prefix too (see extract_memories).
+_EXTRACTION_PROMPT = """\
+## Conversation exchange
+User: {user_msg}
+Assistant: {agent_msg}
+{recent_turns_block}{scope_block}
 Respond with ONLY the JSON array, no other text."""
 
-# Regex to match a fenced code block: ```json ... ``` (or just ``` ... ```)
-_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+# Regex to match a fenced code block: ```json ... ``` (or just ``` ... ```).
+# ``\s*`` eats the newline, so group 1 starts at the payload itself and the
+# decoder can parse in place from ``match.start(1)`` without slicing the body.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_first[T](raw: str, opener: str, kind: type[T]) -> T | None:
+    """First JSON value of type *kind* that starts at an *opener* in *raw*."""
+    start = raw.find(opener)
+    while start != -1:
+        try:
+            result, _ = _JSON_DECODER.raw_decode(raw, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(result, kind):
+                return result
+        start = raw.find(opener, start + 1)
+    return None
 
 
 def _extract_json_array(raw: str) -> list | None:
@@ -208,49 +262,16 @@ def _extract_json_array(raw: str) -> list | None:
     fence_match = _FENCE_RE.search(raw)
     if fence_match:
         try:
-            result = json.loads(fence_match.group(1).strip())
+            result, _ = _JSON_DECODER.raw_decode(raw, fence_match.start(1))
             if isinstance(result, list):
                 return result
         except json.JSONDecodeError:
             pass
 
-    # 3. Find the outermost [ ... ] bracket pair in the response.
-    start = raw.find("[")
-    if start != -1:
-        # Walk forward to find the matching closing bracket.
-        depth = 0
-        in_string = False
-        escape = False
-        end = -1
-        for i in range(start, len(raw)):
-            ch = raw[i]
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if ch == "[":
-                depth += 1
-            elif ch == "]":
-                depth -= 1
-                if depth == 0:
-                    end = i
-                    break
-        if end != -1:
-            try:
-                result = json.loads(raw[start : end + 1])
-                if isinstance(result, list):
-                    return result
-            except json.JSONDecodeError:
-                pass
-
-    return None
+    # 3. Decode from each "[" in turn: raw_decode parses exactly one value
+    #    (in C) and ignores the prose after it, so a bracket in a preamble
+    #    ("see [below]") just moves on to the next candidate.
+    return _decode_first(raw, "[", list)
 
 
 def _extract_json_object(raw: str) -> dict | None:
@@ -273,47 +294,13 @@ def _extract_json_object(raw: str) -> dict | None:
     fence_match = _FENCE_RE.search(raw)
     if fence_match:
         try:
-            result = json.loads(fence_match.group(1).strip())
+            result, _ = _JSON_DECODER.raw_decode(raw, fence_match.start(1))
             if isinstance(result, dict):
                 return result
         except json.JSONDecodeError:
             pass
 
-    start = raw.find("{")
-    if start != -1:
-        depth = 0
-        in_string = False
-        escape = False
-        end = -1
-        for i in range(start, len(raw)):
-            ch = raw[i]
-            if escape:
-                escape = False
-                continue
-            if ch == "\\":
-                escape = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    end = i
-                    break
-        if end != -1:
-            try:
-                result = json.loads(raw[start : end + 1])
-                if isinstance(result, dict):
-                    return result
-            except json.JSONDecodeError:
-                pass
-
-    return None
+    return _decode_first(raw, "{", dict)
 
 
 # Tokeniser for cheap lexical similarity (no embeddings, no new deps).
@@ -354,6 +341,60 @@ _STOPWORDS = frozenset(
 )
 
 
+# Whole-message greetings / acknowledgements (English + Italian). A user turn
+# made only of these carries nothing to remember, so extraction skips it
+# without an LLM call. Yes/no answers are deliberately absent: answering the
+# assistant's question ("Are you vegetarian?" → "no") is how a fact gets set.
+_SMALL_TALK_WORDS = frozenset(
+    {
+        "hi",
+        "hey",
+        "hello",
+        "ciao",
+        "ok",
+        "okay",
+        "k",
+        "thanks",
+        "thank",
+        "you",
+        "thx",
+        "ty",
+        "grazie",
+        "cool",
+        "great",
+        "nice",
+        "perfect",
+        "perfetto",
+        "good",
+        "morning",
+        "night",
+        "bye",
+        "lol",
+        "haha",
+    }
+)
+_SMALL_TALK_MAX_WORDS = 4
+_WORD_RE = re.compile(r"\w+")
+
+
+def _is_small_talk(user_msg: str, agent_msg: str) -> bool:
+    """True when the turn is only a short greeting/acknowledgement.
+
+    Never for an empty user message (a photo-only turn carries its content in
+    the attachment and the reply), nor for a reply to the assistant's question,
+    where even "ok" or "good" can be the answer.
+    """
+    if not user_msg.strip() or agent_msg.rstrip().endswith("?"):
+        return False
+    words = _WORD_RE.findall(user_msg.lower())
+    return len(words) <= _SMALL_TALK_MAX_WORDS and all(w in _SMALL_TALK_WORDS for w in words)
+
+
+def _data_version(db: sqlite3.Connection) -> int:
+    """``PRAGMA data_version``: changes whenever another connection commits."""
+    return db.execute("PRAGMA data_version").fetchone()[0]
+
+
 def _normalize_subject(subject: str) -> str:
     """Canonicalise a memory subject (lowercase, trimmed)."""
     return (subject or "").strip().lower()
@@ -408,7 +449,17 @@ def _tokens(text: str) -> set[str]:
     return {t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS}
 
 
-def _similarity(a: set[str], b: set[str]) -> float:
+@lru_cache(maxsize=4096)
+def _row_tokens(subject: str, content: str) -> frozenset[str]:
+    """:func:`_tokens` of a memory row's subject + content, memoised.
+
+    The same rows are re-scored for every update candidate, recall query and
+    hygiene pair, so each row is tokenised once instead of once per comparison.
+    """
+    return frozenset(_tokens(f"{subject} {content}"))
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
     """Jaccard overlap between two token sets (0.0 when either is empty)."""
     if not a or not b:
         return 0.0
@@ -422,12 +473,20 @@ def _similarity(a: set[str], b: set[str]) -> float:
 _RECENCY_HALF_LIFE_DAYS = 30.0
 
 
+_SQLITE_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _sqlite_ts(when: datetime) -> str:
+    """Format a UTC datetime the way SQLite's ``datetime()`` does."""
+    return when.strftime(_SQLITE_TS_FORMAT)
+
+
 def _parse_sqlite_ts(ts: str | None) -> datetime | None:
     """Parse a SQLite ``datetime('now')`` string (UTC, no tz suffix)."""
     if not ts:
         return None
     try:
-        return datetime.strptime(ts, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
+        return datetime.strptime(ts, _SQLITE_TS_FORMAT).replace(tzinfo=UTC)
     except ValueError, TypeError:
         return None
 
@@ -470,8 +529,46 @@ def _pair_similarity(a: dict, b: dict) -> float:
     if va is not None and vb is not None and va.shape == vb.shape:
         return cosine_similarity(va, vb)
     return _similarity(
-        _tokens(f"{a['subject']} {a['content']}"),
-        _tokens(f"{b['subject']} {b['content']}"),
+        _row_tokens(a["subject"], a["content"]),
+        _row_tokens(b["subject"], b["content"]),
+    )
+
+
+_LONG_TERM_HEADER = "## Long-term memories\n"
+_SHORT_TERM_HEADER = "## Current context (short-term)\n"
+
+
+def _format_long_term_section(rows: list[sqlite3.Row] | list[dict]) -> str:
+    """Render long-term rows as the prompt's long-term section ("" if none)."""
+    if not rows:
+        return ""
+    return _LONG_TERM_HEADER + "\n".join(
+        [f"- [{m['category']}] {m['subject']}: {m['content']}" for m in rows]
+    )
+
+
+def _format_existing_block(
+    long_term: list[sqlite3.Row] | list[dict], short_term: list[sqlite3.Row] | list[dict]
+) -> str:
+    """Render both tiers as the extraction prompt's dedup list ("" if none)."""
+    if not long_term and not short_term:
+        return ""
+    parts = ["## Existing memories (do NOT extract duplicates)\n"]
+    parts.extend([f"- [LT] {m['subject']}: {m['content']}" for m in long_term])
+    parts.extend([f"- [ST] {m['content']}" for m in short_term])
+    parts.append("")  # trailing newline
+    return "\n".join(parts) + "\n"
+
+
+def _format_short_term_section(rows: list[sqlite3.Row] | list[dict]) -> str:
+    """Render short-term rows as the prompt's current-context section ("" if none)."""
+    if not rows:
+        return ""
+    return _SHORT_TERM_HEADER + "\n".join(
+        [
+            f"- {m['content']} ({m['context']})" if m["context"] else f"- {m['content']}"
+            for m in rows
+        ]
     )
 
 
@@ -483,6 +580,12 @@ class MemoryStore:
     provides async helpers to query both tiers for injection into the
     system prompt, and runs automatic memory extraction after each
     conversation turn.
+
+    All writes run on one ``sqlite3`` connection per instance, opened on first
+    use and driven through :func:`asyncio.to_thread` under a thread lock (the
+    same scheme as :class:`core.history.ConversationHistory`). Plain SELECTs
+    (prompt injection, listings) go to a second, read-only connection with its
+    own lock, so they don't queue behind consolidation or extraction writes.
     """
 
     def __init__(
@@ -490,6 +593,7 @@ class MemoryStore:
         db_path: str = "data/memory.db",
         long_term_limit: int = 50,
         *,
+        short_term_limit: int = 100,
         embedder: EmbeddingClient | None = None,
         injection_top_k: int = 12,
         recall_top_k: int = 10,
@@ -502,6 +606,7 @@ class MemoryStore:
     ):
         self.db_path = db_path
         self.long_term_limit = long_term_limit
+        self.short_term_limit = short_term_limit
         self.embedder = embedder
         self.injection_top_k = injection_top_k
         self.recall_top_k = recall_top_k
@@ -512,22 +617,146 @@ class MemoryStore:
         self.hygiene_enabled = hygiene_enabled
         self.hygiene_similarity_threshold = hygiene_similarity_threshold
         self._ready = False
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._read_conn: sqlite3.Connection | None = None
+        self._read_lock = threading.Lock()
         self._last_extraction: float | None = None  # monotonic timestamp of last extraction
         # Turns skipped by the cooldown, replayed into the next extraction so
         # back-to-back salient turns aren't dropped (issue #7).
         self._pending_turns: list[tuple[str, str]] = []
+        # Rendered prompt sections keyed by (section, scope) -> (monotonic ts,
+        # PRAGMA data_version, text). Writes through this store bump
+        # _cache_version and clear it; any other commit changes data_version.
+        self._prompt_cache: dict[tuple[str, str | None], tuple[float, int, str]] = {}
+        self._cache_version = 0
+
+    # Backstop for how long a rendered prompt section is reused. Commits from
+    # any connection (this store, the sqlite3 CLI skill, the admin UI) already
+    # miss via data_version; the TTL bounds short-term expiry, which is time-based.
+    _PROMPT_CACHE_TTL = 30.0
+
+    def invalidate_prompt_cache(self) -> None:
+        """Drop cached prompt sections so the next prompt re-reads the DB."""
+        self._cache_version += 1
+        self._prompt_cache.clear()
+
+    async def _cached_section(self, section: str, scope: str | None) -> str:
+        """Return the rendered ``"short_term"`` section, ``"both"`` sections
+        with long-term in recency order, or the extraction prompt's
+        ``"existing"`` dedup list, re-reading them once the database changed
+        (``PRAGMA data_version`` on the reader) or the TTL lapses.
+
+        A result built while a write invalidated the cache is returned but not
+        stored, so it can't outlive the write.
+        """
+        key = (section, scope)
+        now = time.monotonic()
+        version = self._cache_version
+        # Read before the rows: a commit landing in between leaves the entry
+        # tagged with the older value, so the next lookup misses.
+        data_version = await self._read(_data_version)
+        hit = self._prompt_cache.get(key)
+        if hit is not None and hit[1] == data_version and now - hit[0] < self._PROMPT_CACHE_TTL:
+            return hit[2]
+        if section == "both":
+            long_term, short_term = await self._get_both_tiers(scope)
+            sections = (
+                _format_long_term_section(long_term),
+                _format_short_term_section(short_term),
+            )
+            text = "\n\n".join(s for s in sections if s)
+        elif section == "existing":
+            text = _format_existing_block(*await self._get_both_tiers(scope))
+        else:
+            sql, params = self._short_term_query(scope)
+            text = _format_short_term_section(await self._fetch_rows(sql, params))
+        if version == self._cache_version:
+            self._prompt_cache[key] = (now, data_version, text)
+        return text
+
+    def _open(self) -> None:
+        """Open the shared connection and bring the schema up to date (worker thread)."""
+        with self._db_lock:
+            if self._conn is not None:
+                return
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                self.db_path, check_same_thread=False, cached_statements=_CACHED_STATEMENTS
+            )
+            db.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                db.execute(f"PRAGMA {pragma}")
+            db.executescript(_SCHEMA_SQL)
+            self._migrate_long_term(db)
+            self._migrate_short_term(db)
+            # Opened after the schema exists: a read-only connection can't create it.
+            reader = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_CACHED_STATEMENTS,
+            )
+            reader.row_factory = sqlite3.Row
+            for pragma in _READER_PRAGMAS:
+                reader.execute(f"PRAGMA {pragma}")
+            self._conn = db
+            self._read_conn = reader
 
     async def _ensure_schema(self) -> None:
         if self._ready:
             return
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        schema = _SCHEMA_FILE.read_text()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript(schema)
-            await self._migrate_long_term(db)
-            await self._migrate_short_term(db)
+        await asyncio.to_thread(self._open)
         self._ready = True
 
+    def _locked[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._db_lock:
+            if self._conn is None:
+                # close() ran after this call's _ensure_schema (a late drained write).
+                raise RuntimeError("memory store closed")
+            return fn(self._conn)
+
+    async def _run[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``fn(conn)`` on the shared connection in a worker thread."""
+        await self._ensure_schema()
+        return await asyncio.to_thread(self._locked, fn)
+
+    def _read_locked[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._read_lock:
+            if self._read_conn is None:
+                raise RuntimeError("memory store closed")
+            return fn(self._read_conn)
+
+    async def _read[T](self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run the read-only ``fn(conn)`` on the reader connection in a worker thread."""
+        await self._ensure_schema()
+        return await asyncio.to_thread(self._read_locked, fn)
+
+    async def _fetch_rows(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        """Run a SELECT on the reader connection and return its ``sqlite3.Row`` rows."""
+        return await self._read(lambda db: db.execute(sql, params).fetchall())
+
+    async def _fetch_dicts(self, sql: str, params: tuple = ()) -> list[dict]:
+        """Run a SELECT on the reader connection and return its rows as dicts."""
+        return await self._read(lambda db: [dict(r) for r in db.execute(sql, params).fetchall()])
+
+    def _close_locked(self) -> None:
+        # Under each connection's own lock, so a worker thread still running a
+        # cancelled call finishes before its connection is closed.
+        with self._db_lock:
+            writer, self._conn = self._conn, None
+            if writer is not None:
+                writer.close()
+        with self._read_lock:
+            reader, self._read_conn = self._read_conn, None
+            if reader is not None:
+                reader.close()
+
+    async def close(self) -> None:
+        """Close both connections; the next call transparently reopens them."""
+        self._ready = False
+        await asyncio.to_thread(self._close_locked)
+
     # Columns added after the original two-tier schema shipped. Each is applied
     # via ALTER TABLE on databases created before the column existed, so an
     # existing data/memory.db upgrades in place (defaults are constant, as
@@ -544,51 +773,49 @@ class MemoryStore:
 
     _SHORT_TERM_MIGRATIONS = (("scope", "scope TEXT NOT NULL DEFAULT ''"),)
 
-    async def _migrate_long_term(self, db: aiosqlite.Connection) -> None:
-        cursor = await db.execute("PRAGMA table_info(long_term)")
-        existing = {row[1] for row in await cursor.fetchall()}
+    def _migrate_long_term(self, db: sqlite3.Connection) -> None:
+        existing = {row[1] for row in db.execute("PRAGMA table_info(long_term)").fetchall()}
         for name, ddl in self._LONG_TERM_MIGRATIONS:
             if name not in existing:
-                await db.execute(f"ALTER TABLE long_term ADD COLUMN {ddl}")  # noqa: S608
+                db.execute(f"ALTER TABLE long_term ADD COLUMN {ddl}")  # noqa: S608
         # Safe to create now: the archived column is guaranteed to exist (fresh
         # DBs declare it; legacy DBs just had it added above).
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_lt_archived ON long_term(archived)")
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_lt_scope ON long_term(scope)")
-        await db.commit()
+        db.execute("CREATE INDEX IF NOT EXISTS idx_lt_archived ON long_term(archived)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_lt_scope ON long_term(scope)")
+        db.commit()
 
-    async def _migrate_short_term(self, db: aiosqlite.Connection) -> None:
-        cursor = await db.execute("PRAGMA table_info(short_term)")
-        existing = {row[1] for row in await cursor.fetchall()}
+    def _migrate_short_term(self, db: sqlite3.Connection) -> None:
+        existing = {row[1] for row in db.execute("PRAGMA table_info(short_term)").fetchall()}
         for name, ddl in self._SHORT_TERM_MIGRATIONS:
             if name not in existing:
-                await db.execute(f"ALTER TABLE short_term ADD COLUMN {ddl}")  # noqa: S608
-        await db.execute("CREATE INDEX IF NOT EXISTS idx_st_scope ON short_term(scope)")
-        await db.commit()
+                db.execute(f"ALTER TABLE short_term ADD COLUMN {ddl}")  # noqa: S608
+        db.execute("CREATE INDEX IF NOT EXISTS idx_st_scope ON short_term(scope)")
+        if "created_at" in existing:
+            # Newest-first LIMIT reads walk this index instead of sorting every row.
+            db.execute("CREATE INDEX IF NOT EXISTS idx_st_created ON short_term(created_at)")
+        db.commit()
 
     async def rename_scope(self, old: str, new: str) -> None:
         """Move an agent's private memories to a new scope key after the agent
         slug is renamed (#69). An agent's scope key is its slug (see #42)."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("UPDATE long_term SET scope = ? WHERE scope = ?", (new, old))
-            await db.execute("UPDATE short_term SET scope = ? WHERE scope = ?", (new, old))
-            await db.commit()
+
+        def _rename(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute("UPDATE long_term SET scope = ? WHERE scope = ?", (new, old))
+                db.execute("UPDATE short_term SET scope = ? WHERE scope = ?", (new, old))
+
+        await self._run(_rename)
+        self.invalidate_prompt_cache()
 
     async def get_long_term(self, scope: str | None = None) -> list[dict]:
         """Retrieve recent (non-archived) long-term memories for injection.
 
         ``scope`` filters per #42 (see :func:`_scope_filter`); ``None`` = all.
         """
-        await self._ensure_schema()
         clause, params = _scope_filter(scope)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT category, subject, content FROM long_term "
-                f"WHERE archived = 0{clause} ORDER BY updated_at DESC LIMIT ?",  # noqa: S608
-                (*params, self.long_term_limit),
-            )
-            return [dict(row) for row in await cursor.fetchall()]
+        return await self._fetch_dicts(
+            _SQL_RECENT_LONG_TERM.format(scope=clause), (*params, self.long_term_limit)
+        )
 
     async def get_relevant_long_term(self, query: str, scope: str | None = None) -> list[dict]:
         """Return long-term memories most relevant to *query*, relevance-ranked.
@@ -611,16 +838,12 @@ class MemoryStore:
         if not query_vec:
             return await self.get_long_term(scope)
 
-        await self._ensure_schema()
         clause, params = _scope_filter(scope)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, category, subject, content, importance, embedding, "
-                f"updated_at, last_accessed FROM long_term WHERE archived = 0{clause}",  # noqa: S608
-                params,
-            )
-            rows = [dict(r) for r in await cursor.fetchall()]
+        rows = await self._fetch_dicts(
+            "SELECT id, category, subject, content, importance, embedding, "
+            f"updated_at, last_accessed FROM long_term WHERE archived = 0{clause}",  # noqa: S608
+            params,
+        )
 
         rel_map = _batch_relevance(query_vec, rows)
         scored: list[tuple[float, dict]] = []
@@ -672,16 +895,12 @@ class MemoryStore:
         limit = self.recall_top_k if not limit or limit < 1 else limit
         limit = min(limit, self._RECALL_MAX_LIMIT)
 
-        await self._ensure_schema()
         clause, params = _scope_filter(scope)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, category, subject, content, embedding, archived "  # noqa: S608
-                f"FROM long_term WHERE 1=1{clause}",
-                params,
-            )
-            rows = [dict(r) for r in await cursor.fetchall()]
+        rows = await self._fetch_dicts(
+            "SELECT id, category, subject, content, embedding, archived "  # noqa: S608
+            f"FROM long_term WHERE 1=1{clause}",
+            params,
+        )
         if not rows:
             return []
 
@@ -695,7 +914,7 @@ class MemoryStore:
             if i in rel_map:
                 relevance = rel_map[i]
             else:
-                relevance = _similarity(query_tokens, _tokens(f"{row['subject']} {row['content']}"))
+                relevance = _similarity(query_tokens, _row_tokens(row["subject"], row["content"]))
             if relevance >= self._RECALL_MIN_RELEVANCE:
                 scored.append((relevance, row))
 
@@ -717,32 +936,59 @@ class MemoryStore:
         """
         if not ids:
             return
-        await self._ensure_schema()
         archived_clause = ", archived = 0" if unarchive else ""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executemany(
-                "UPDATE long_term SET access_count = access_count + 1, "  # noqa: S608
-                f"last_accessed = datetime('now'){archived_clause} WHERE id = ?",
-                [(i,) for i in ids],
-            )
-            await db.commit()
+
+        def _update(db: sqlite3.Connection) -> None:
+            with db:
+                db.executemany(
+                    "UPDATE long_term SET access_count = access_count + 1, "  # noqa: S608
+                    f"last_accessed = datetime('now'){archived_clause} WHERE id = ?",
+                    [(i,) for i in ids],
+                )
+
+        await self._run(_update)
+        if unarchive:
+            self.invalidate_prompt_cache()
 
     async def get_short_term(self, scope: str | None = None) -> list[dict]:
         """Retrieve active (non-expired) short-term memories.
 
         ``scope`` filters per #42 (see :func:`_scope_filter`); ``None`` = all.
         """
-        await self._ensure_schema()
+        return await self._fetch_dicts(*self._short_term_query(scope))
+
+    def _short_term_query(self, scope: str | None) -> tuple[str, tuple]:
+        """SQL + params for the newest ``short_term_limit`` active short-term rows
+        visible to *scope*."""
         clause, params = _scope_filter(scope)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT content, context FROM short_term "
-                f"WHERE expires_at > datetime('now'){clause} "  # noqa: S608
-                "ORDER BY created_at DESC",
-                params,
-            )
-            return [dict(row) for row in await cursor.fetchall()]
+        now = _sqlite_ts(datetime.now(tz=UTC))
+        return (
+            _SQL_ACTIVE_SHORT_TERM.format(scope=clause),
+            (now, *params, self.short_term_limit),
+        )
+
+    async def _get_both_tiers(
+        self, scope: str | None = None
+    ) -> tuple[list[sqlite3.Row], list[sqlite3.Row]]:
+        """:meth:`get_long_term` and :meth:`get_short_term` in one worker call.
+
+        Both SELECTs run back to back in one read transaction, so the two tiers
+        come from the same snapshot for a single thread hop. Rows come back as
+        ``sqlite3.Row`` (indexable by column name) for the prompt formatters,
+        without a dict copy per memory.
+        """
+        clause, params = _scope_filter(scope)
+        long_sql = _SQL_RECENT_LONG_TERM.format(scope=clause)
+        short_sql, short_params = self._short_term_query(scope)
+
+        def _both(db: sqlite3.Connection) -> tuple[list[sqlite3.Row], list[sqlite3.Row]]:
+            with db:
+                db.execute("BEGIN")
+                long_rows = db.execute(long_sql, (*params, self.long_term_limit)).fetchall()
+                short_rows = db.execute(short_sql, short_params).fetchall()
+            return long_rows, short_rows
+
+        return await self._read(_both)
 
     async def format_for_prompt(self, query: str | None = None, scope: str | None = None) -> str:
         """Format both tiers into a block for the system prompt.
@@ -754,28 +1000,18 @@ class MemoryStore:
         ``scope`` restricts to the active agent's view per #42: ``""`` =
         shared only (default identity), ``"<agent>"`` = shared + that
         agent's private memory, ``None`` = every scope.
-        """
-        sections: list[str] = []
-
-        if query:
-            long_term = await self.get_relevant_long_term(query, scope)
-        else:
-            long_term = await self.get_long_term(scope)
-        if long_term:
-            lines = [f"- [{m['category']}] {m['subject']}: {m['content']}" for m in long_term]
-            sections.append("## Long-term memories\n" + "\n".join(lines))
-
-        short_term = await self.get_short_term(scope)
-        if short_term:
-            lines = []
-            for m in short_term:
-                entry = f"- {m['content']}"
-                if m.get("context"):
-                    entry += f" ({m['context']})"
-                lines.append(entry)
-            sections.append("## Current context (short-term)\n" + "\n".join(lines))
 
-        return "\n\n".join(sections) if sections else ""
+        Sections that don't depend on *query* (short-term, and long-term when
+        it is recency-ordered) are cached until the database changes (at most
+        ``_PROMPT_CACHE_TTL`` seconds).
+        """
+        if query and query.strip() and self.embedder:
+            long_section = _format_long_term_section(
+                await self.get_relevant_long_term(query, scope)
+            )
+            short_section = await self._cached_section("short_term", scope)
+            return "\n\n".join(s for s in (long_section, short_section) if s)
+        return await self._cached_section("both", scope)
 
     # -- Automatic memory extraction --
 
@@ -820,8 +1056,17 @@ class MemoryStore:
         that agent; everything else is stored shared (``''``). With no active
         agent it is ``""`` and every fact is shared.
 
+        A user message that is only small talk ("ok thanks", "ciao", an emoji)
+        is skipped up front unless it answers a question in *agent_msg* (see
+        :func:`_is_small_talk`): it can't carry a fact, and it neither starts
+        the cooldown nor gets buffered.
+
         Returns the number of memories stored.
         """
+        if _is_small_talk(user_msg, agent_msg):
+            log.debug("Skipping memory extraction for small talk: %r", user_msg[:40])
+            return 0
+
         now = time.monotonic()
         if (
             cooldown_seconds > 0
@@ -845,19 +1090,28 @@ class MemoryStore:
         self._pending_turns = []
 
         # Build existing-memories block so the LLM can avoid duplicates — scoped
-        # to what this agent may see (shared + its own private).
+        # to what this agent may see (shared + its own private). It only changes
+        # on a memory write, so it extends the cached prefix after the static
+        # instructions; the per-turn exchange stays in the uncached prompt.
         existing_block = await self._existing_memories_block(agent_scope)
+        cached_prefix = _EXTRACTION_INSTRUCTIONS
+        if existing_block:
+            cached_prefix = f"{cached_prefix}\n\n{existing_block.rstrip()}"
 
         prompt = _EXTRACTION_PROMPT.format(
             user_msg=user_msg,
             agent_msg=agent_msg,
             recent_turns_block=recent_turns_block,
-            existing_memories_block=existing_block,
             scope_block=_extraction_scope_block(agent_scope),
         )
 
         try:
-            raw = await llm.generate_text(model=model, prompt=prompt, max_tokens=4096)
+            raw = await llm.generate_text(
+                model=model,
+                prompt=prompt,
+                max_tokens=4096,
+                cached_prefix=cached_prefix,
+            )
         except Exception:
             log.exception("Memory extraction LLM call failed")
             return 0
@@ -891,22 +1145,12 @@ class MemoryStore:
         return stored
 
     async def _existing_memories_block(self, scope: str | None = None) -> str:
-        """Build a summary of existing memories for the extraction prompt."""
-        long_term = await self.get_long_term(scope)
-        short_term = await self.get_short_term(scope)
+        """Build a summary of existing memories for the extraction prompt.
 
-        if not long_term and not short_term:
-            return ""
-
-        parts = ["## Existing memories (do NOT extract duplicates)\n"]
-        if long_term:
-            for m in long_term:
-                parts.append(f"- [LT] {m['subject']}: {m['content']}")
-        if short_term:
-            for m in short_term:
-                parts.append(f"- [ST] {m['content']}")
-        parts.append("")  # trailing newline
-        return "\n".join(parts) + "\n"
+        Served from the prompt cache, so back-to-back turns with no memory
+        write in between don't re-read both tiers.
+        """
+        return await self._cached_section("existing", scope)
 
     async def update_memory(
         self, llm: LLMClient, model: str, candidate: dict, scope: str = ""
@@ -982,24 +1226,27 @@ class MemoryStore:
             new_category = decision.get("category") or category
             new_subject = _normalize_subject(decision.get("subject") or subject)
             blob = await self._embed_blob(f"{new_subject}: {new_content}")
-            await self._ensure_schema()
-            async with aiosqlite.connect(self.db_path) as db:
+
+            def _update(db: sqlite3.Connection) -> None:
                 # Re-mentioning a fact reinforces it: bump importance (capped).
-                if blob is not None:
-                    await db.execute(
-                        "UPDATE long_term SET category = ?, subject = ?, content = ?, "
-                        "embedding = ?, importance = MIN(10.0, importance + 1.0), "
-                        "updated_at = datetime('now') WHERE id = ?",
-                        (new_category, new_subject, new_content, blob, target_id),
-                    )
-                else:
-                    await db.execute(
-                        "UPDATE long_term SET category = ?, subject = ?, content = ?, "
-                        "importance = MIN(10.0, importance + 1.0), "
-                        "updated_at = datetime('now') WHERE id = ?",
-                        (new_category, new_subject, new_content, target_id),
-                    )
-                await db.commit()
+                with db:
+                    if blob is not None:
+                        db.execute(
+                            "UPDATE long_term SET category = ?, subject = ?, content = ?, "
+                            "embedding = ?, importance = MIN(10.0, importance + 1.0), "
+                            "updated_at = datetime('now') WHERE id = ?",
+                            (new_category, new_subject, new_content, blob, target_id),
+                        )
+                    else:
+                        db.execute(
+                            "UPDATE long_term SET category = ?, subject = ?, content = ?, "
+                            "importance = MIN(10.0, importance + 1.0), "
+                            "updated_at = datetime('now') WHERE id = ?",
+                            (new_category, new_subject, new_content, target_id),
+                        )
+
+            await self._run(_update)
+            self.invalidate_prompt_cache()
             log.debug("UPDATE long-term %s: %s", target_id, new_content[:80])
             return "UPDATE"
 
@@ -1008,10 +1255,13 @@ class MemoryStore:
             if target_id not in valid_ids:
                 log.warning("update_memory DELETE with invalid id %r; no-op", target_id)
                 return "NOOP"
-            await self._ensure_schema()
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("DELETE FROM long_term WHERE id = ?", (target_id,))
-                await db.commit()
+
+            def _delete(db: sqlite3.Connection) -> None:
+                with db:
+                    db.execute("DELETE FROM long_term WHERE id = ?", (target_id,))
+
+            await self._run(_delete)
+            self.invalidate_prompt_cache()
             log.debug("DELETE long-term %s (contradicted)", target_id)
             return "DELETE"
 
@@ -1030,16 +1280,12 @@ class MemoryStore:
 
         ``scope`` (#42) bounds the candidate set: ``""`` = shared only, an agent
         key = shared + that agent, ``None`` = every scope."""
-        await self._ensure_schema()
         clause, params = _scope_filter(scope)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, category, subject, content, created_at, updated_at, embedding "
-                f"FROM long_term WHERE archived = 0{clause}",  # noqa: S608
-                params,
-            )
-            rows = [dict(r) for r in await cursor.fetchall()]
+        rows = await self._fetch_dicts(
+            "SELECT id, category, subject, content, created_at, updated_at, embedding "
+            f"FROM long_term WHERE archived = 0{clause}",  # noqa: S608
+            params,
+        )
 
         subject_norm = _normalize_subject(subject)
         cand_tokens = _tokens(f"{subject} {content}")
@@ -1052,7 +1298,7 @@ class MemoryStore:
             if i in rel_map:
                 base = rel_map[i]
             else:
-                base = _similarity(cand_tokens, _tokens(f"{row['subject']} {row['content']}"))
+                base = _similarity(cand_tokens, _row_tokens(row["subject"], row["content"]))
             score = base
             if subject_norm and _normalize_subject(row["subject"]) == subject_norm:
                 score += 0.5
@@ -1100,17 +1346,20 @@ class MemoryStore:
         scope: str = "",
     ) -> None:
         """Insert a new long-term memory row (with embedding + importance)."""
-        await self._ensure_schema()
         blob = await self._embed_blob(f"{subject}: {content}")
         imp = self.default_importance if importance is None else importance
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                "INSERT INTO long_term "
-                "(category, subject, content, source, confidence, embedding, importance, scope) "
-                "VALUES (?, ?, ?, 'conversation', 'stated', ?, ?, ?)",
-                (category, subject, content, blob, imp, scope),
-            )
-            await db.commit()
+
+        def _insert(db: sqlite3.Connection) -> None:
+            with db:
+                db.execute(
+                    "INSERT INTO long_term (category, subject, content, source, "
+                    "confidence, embedding, importance, scope) "
+                    "VALUES (?, ?, ?, 'conversation', 'stated', ?, ?, ?)",
+                    (category, subject, content, blob, imp, scope),
+                )
+
+        await self._run(_insert)
+        self.invalidate_prompt_cache()
 
     async def _store_short_term(self, mem: dict, scope: str = "") -> int:
         """Store a short-term memory with a LLM-determined TTL.
@@ -1121,39 +1370,51 @@ class MemoryStore:
         """
         content = mem.get("content", "")
         context = mem.get("context", "")
-        ttl_hours = mem.get("ttl_hours")
         if not content:
             return 0
-        if not ttl_hours or not isinstance(ttl_hours, int | float):
+        # Models sometimes emit the TTL as a string ("8"); accept anything that
+        # reads as a positive, finite number of hours.
+        try:
+            ttl_hours = float(mem.get("ttl_hours") or 0)
+        except TypeError, ValueError:
+            ttl_hours = 0.0
+        if not 0 < ttl_hours < math.inf:
             log.warning("Short-term memory missing ttl_hours, skipping: %s", content[:80])
             return 0
 
-        expires_at = datetime.now(tz=UTC) + timedelta(hours=ttl_hours)
+        now = datetime.now(tz=UTC)
         # Store in SQLite-compatible format (no timezone suffix, always UTC)
-        expires_str = expires_at.strftime("%Y-%m-%d %H:%M:%S")
+        expires_str = _sqlite_ts(now + timedelta(hours=ttl_hours))
+        now_str = _sqlite_ts(now)
 
-        await self._ensure_schema()
         clause, params = _scope_filter(scope or "")
-        async with aiosqlite.connect(self.db_path) as db:
-            # Check for duplicate active short-term memories within this scope.
-            cursor = await db.execute(
-                f"SELECT id, content FROM short_term WHERE expires_at > datetime('now'){clause}",  # noqa: S608
-                params,
-            )
-            existing = await cursor.fetchall()
-            content_lower = content.lower()
-            for row in existing:
-                if content_lower in row[1].lower() or row[1].lower() in content_lower:
-                    log.debug("Skipping duplicate short-term memory: %s", content[:80])
-                    return 0
-
-            await db.execute(
-                "INSERT INTO short_term (content, context, expires_at, scope) VALUES (?, ?, ?, ?)",
-                (content, context, expires_str, scope),
-            )
-            await db.commit()
-            log.debug("Stored short-term memory (TTL %dh): %s", ttl_hours, content[:80])
-            return 1
+        content_lower = content.lower()
+
+        def _insert(db: sqlite3.Connection) -> bool:
+            # Duplicate = an active row in this scope whose content contains, or is
+            # contained in, the new one (case-insensitive). Checked in SQL so the
+            # scope's rows are never pulled into Python.
+            duplicate = db.execute(
+                "SELECT 1 FROM short_term WHERE expires_at > ?"  # noqa: S608
+                f"{clause} AND (instr(lower(content), ?) OR instr(?, lower(content))) LIMIT 1",
+                (now_str, *params, content_lower, content_lower),
+            ).fetchone()
+            if duplicate:
+                return False
+            with db:
+                db.execute(
+                    "INSERT INTO short_term (content, context, expires_at, scope) "
+                    "VALUES (?, ?, ?, ?)",
+                    (content, context, expires_str, scope),
+                )
+            return True
+
+        if not await self._run(_insert):
+            log.debug("Skipping duplicate short-term memory: %s", content[:80])
+            return 0
+        self.invalidate_prompt_cache()
+        log.debug("Stored short-term memory (TTL %gh): %s", ttl_hours, content[:80])
+        return 1
 
     # -- Consolidation & cleanup --
 
@@ -1167,17 +1428,13 @@ class MemoryStore:
 
         Returns a summary dict with counts.
         """
-        await self._ensure_schema()
-
         # Fetch non-expired short-term memories (with IDs for logging)
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, content, context, created_at, expires_at, scope FROM short_term "
-                "WHERE expires_at > datetime('now') "
-                "ORDER BY created_at ASC",
-            )
-            active_short_term = [dict(row) for row in await cursor.fetchall()]
+        active_short_term = await self._fetch_dicts(
+            "SELECT id, content, context, created_at, expires_at, scope FROM short_term "
+            "WHERE expires_at > ? "
+            "ORDER BY created_at ASC",
+            (_sqlite_ts(datetime.now(tz=UTC)),),
+        )
 
         # Promote per scope (#42): each scope's short-term is reviewed and
         # promoted into long-term of the same scope, never mixing two agents'
@@ -1226,22 +1483,25 @@ class MemoryStore:
         deleted) when it is old enough, has low importance, and has not been
         accessed recently. Returns the number archived.
         """
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "UPDATE long_term SET archived = 1 WHERE archived = 0 "
-                "AND importance <= ? "
-                "AND created_at < datetime('now', ?) "
-                "AND COALESCE(last_accessed, created_at) < datetime('now', ?)",
-                (
-                    self.archive_max_importance,
-                    f"-{self.archive_after_days} days",
-                    f"-{self.archive_min_idle_days} days",
-                ),
-            )
-            count = cursor.rowcount
-            await db.commit()
+        params = (
+            self.archive_max_importance,
+            f"-{self.archive_after_days} days",
+            f"-{self.archive_min_idle_days} days",
+        )
+
+        def _archive(db: sqlite3.Connection) -> int:
+            with db:
+                return db.execute(
+                    "UPDATE long_term SET archived = 1 WHERE archived = 0 "
+                    "AND importance <= ? "
+                    "AND created_at < datetime('now', ?) "
+                    "AND COALESCE(last_accessed, created_at) < datetime('now', ?)",
+                    params,
+                ).rowcount
+
+        count = await self._run(_archive)
         if count:
+            self.invalidate_prompt_cache()
             log.info("Archived %d cold long-term memories", count)
         return count
 
@@ -1251,14 +1511,10 @@ class MemoryStore:
     async def _hygiene_pass(self, llm: LLMClient, model: str) -> int:
         """Cluster near-duplicate long-term memories and merge each cluster via
         one LLM call (Tier 4, issue #6). Returns the number of rows removed."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT id, category, subject, content, created_at, updated_at, embedding, scope "
-                "FROM long_term WHERE archived = 0"
-            )
-            rows = [dict(r) for r in await cursor.fetchall()]
+        rows = await self._fetch_dicts(
+            "SELECT id, category, subject, content, created_at, updated_at, embedding, scope "
+            "FROM long_term WHERE archived = 0"
+        )
 
         if len(rows) < 2:
             return 0
@@ -1331,39 +1587,44 @@ class MemoryStore:
         updates = plan.get("updates") or []
         deletes = plan.get("deletes") or []
 
-        removed = 0
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            for upd in updates:
-                if not isinstance(upd, dict):
-                    continue
-                uid = upd.get("id")
-                if uid not in valid_ids:
-                    continue
-                content = (upd.get("content") or "").strip()
-                if not content:
-                    continue
-                subject = _normalize_subject(upd.get("subject") or "")
-                category = upd.get("category") or "fact"
-                blob = await self._embed_blob(f"{subject}: {content}")
-                if blob is not None:
-                    await db.execute(
-                        "UPDATE long_term SET category = ?, subject = ?, content = ?, "
-                        "embedding = ?, updated_at = datetime('now') WHERE id = ?",
-                        (category, subject, content, blob, uid),
-                    )
-                else:
-                    await db.execute(
-                        "UPDATE long_term SET category = ?, subject = ?, content = ?, "
-                        "updated_at = datetime('now') WHERE id = ?",
-                        (category, subject, content, uid),
-                    )
-            for did in deletes:
-                if did in valid_ids:
-                    await db.execute("DELETE FROM long_term WHERE id = ?", (did,))
-                    removed += 1
-            await db.commit()
-        return removed
+        # Embed first: the writes below then run as one transaction.
+        rewrites: list[tuple[str, str, str, bytes | None, int]] = []
+        for upd in updates:
+            if not isinstance(upd, dict):
+                continue
+            uid = upd.get("id")
+            if uid not in valid_ids:
+                continue
+            content = (upd.get("content") or "").strip()
+            if not content:
+                continue
+            subject = _normalize_subject(upd.get("subject") or "")
+            category = upd.get("category") or "fact"
+            blob = await self._embed_blob(f"{subject}: {content}")
+            rewrites.append((category, subject, content, blob, uid))
+        removals = [did for did in deletes if did in valid_ids]
+
+        def _apply(db: sqlite3.Connection) -> None:
+            with db:
+                for category, subject, content, blob, uid in rewrites:
+                    if blob is not None:
+                        db.execute(
+                            "UPDATE long_term SET category = ?, subject = ?, content = ?, "
+                            "embedding = ?, updated_at = datetime('now') WHERE id = ?",
+                            (category, subject, content, blob, uid),
+                        )
+                    else:
+                        db.execute(
+                            "UPDATE long_term SET category = ?, subject = ?, content = ?, "
+                            "updated_at = datetime('now') WHERE id = ?",
+                            (category, subject, content, uid),
+                        )
+                for did in removals:
+                    db.execute("DELETE FROM long_term WHERE id = ?", (did,))
+
+        await self._run(_apply)
+        self.invalidate_prompt_cache()
+        return len(removals)
 
     async def _run_consolidation_llm(
         self, llm: LLMClient, model: str, short_term_rows: list[dict], scope: str = ""
@@ -1396,7 +1657,12 @@ class MemoryStore:
         )
 
         try:
-            raw = await llm.generate_text(model=model, prompt=prompt, max_tokens=4096)
+            raw = await llm.generate_text(
+                model=model,
+                prompt=prompt,
+                max_tokens=4096,
+                cached_prefix=_CONSOLIDATION_INSTRUCTIONS,
+            )
         except Exception:
             log.exception("Consolidation LLM call failed")
             return 0
@@ -1430,11 +1696,14 @@ class MemoryStore:
 
     async def _delete_expired_short_term(self) -> int:
         """Delete all expired short-term memories. Returns the count deleted."""
-        await self._ensure_schema()
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute("DELETE FROM short_term WHERE expires_at < datetime('now')")
-            count = cursor.rowcount
-            await db.commit()
-            if count:
-                log.info("Deleted %d expired short-term memories", count)
-            return count
+
+        now = _sqlite_ts(datetime.now(tz=UTC))
+
+        def _delete(db: sqlite3.Connection) -> int:
+            with db:
+                return db.execute("DELETE FROM short_term WHERE expires_at < ?", (now,)).rowcount
+
+        count = await self._run(_delete)
+        if count:
+            log.info("Deleted %d expired short-term memories", count)
+        return count
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass, field
+from functools import cached_property
 
 # Mime types we accept as images for LLM vision.
 IMAGE_MIME_TYPES = frozenset(
@@ -28,8 +29,10 @@ class Attachment:
     def is_image(self) -> bool:
         return self.mime_type in IMAGE_MIME_TYPES
 
-    @property
+    @cached_property
     def base64_data(self) -> str:
+        # Encoded once per attachment: a turn can build both the main and the
+        # vision-fallback block from the same image. ``data`` is never reassigned.
         return base64.standard_b64encode(self.data).decode("ascii")
 
     def to_anthropic_block(self) -> dict:
@@ -89,7 +89,7 @@ async def run_agent_task(
         )
 
         # Deliver the response to the target channel
-        ch = agent.channels.get(channel)
+        ch = await agent.get_channel(channel)
         if ch and response.text:
             text = response.text.replace("[NO_UPDATES]", "").strip()
             if silent_mode and not text:
@@ -134,6 +134,9 @@ async def run_subagent_task(
         log.error("Scheduler subagent task dropped; agent not initialized")
         return
 
+    # Bots connect in the background after the scheduler starts: wait for this
+    # job's bot first, so its allowlist (the owner) is known.
+    ch = await agent.get_channel(channel)
     owner = _get_owner_chat_id(agent, channel)
     target = origin_chat_id or owner
     log.info("Scheduler running subagent (agent=%s): %s", agent_name or "default", task[:100])
@@ -147,7 +150,6 @@ async def run_subagent_task(
             background=False,
         )
         text = result.get("result") or result.get("error") or ""
-        ch = agent.channels.get(channel)
         if ch and text and target:
             await ch.send(target, text)
         elif not ch:
@@ -256,18 +258,28 @@ class AgentScheduler:
         # Jobs are persisted in JobStore; APScheduler just runs them.
         self.scheduler = AsyncIOScheduler(timezone=self.tz)
 
-    async def load_jobs(self) -> None:
+    async def load_jobs(self) -> int:
         """Load all active jobs from JobStore into APScheduler.
 
         Past one-shots (whose ``run_at`` has already elapsed, e.g. while the
         agent was down) are retired to ``done`` rather than registered, so they
         drop out of the active jobs list instead of lingering forever.
+
+        Returns the number of jobs registered.
         """
-        jobs = await self.job_store.list_jobs(status="active")
+        jobs = await self.job_store.list_active_for_scheduler()
+        past: list[str] = []
+        registered = 0
         for job in jobs:
-            if await self._retire_if_past(job):
+            if self._is_past_oneshot(job):
+                past.append(job["id"])
                 continue
-            self._register_job(job)
+            registered += self._register_job(job)
+        if past:
+            # One UPDATE for every one-shot that elapsed while we were down.
+            await self.job_store.update_statuses([(job_id, "done") for job_id in past])
+            log.info("Marked %d past one-shot job(s) done: %s", len(past), ", ".join(past))
+        return registered
 
     def _resolve_run_at(self, job: dict) -> datetime | None:
         """Parse a one-shot job's ``run_at`` into a tz-aware datetime.
@@ -287,19 +299,23 @@ class AgentScheduler:
             run_at = run_at.replace(tzinfo=self.tz)
         return run_at
 
-    async def _retire_if_past(self, job: dict) -> bool:
-        """Mark an active, past one-shot job as ``done``. Returns True if retired."""
+    def _is_past_oneshot(self, job: dict) -> bool:
+        """True for an active one-shot job whose ``run_at`` has already elapsed."""
         if job.get("schedule") != "once" or job.get("status") != "active":
             return False
         run_at = self._resolve_run_at(job)
-        if run_at is not None and run_at < datetime.now(self.tz):
-            await self.job_store.update_status(job["id"], "done")
-            log.info("One-shot job %r is in the past; marked done", job["id"])
-            return True
-        return False
+        return run_at is not None and run_at < datetime.now(self.tz)
 
-    def _register_job(self, job: dict) -> None:
-        """Register a single job dict into APScheduler."""
+    async def _retire_if_past(self, job: dict) -> bool:
+        """Mark an active, past one-shot job as ``done``. Returns True if retired."""
+        if not self._is_past_oneshot(job):
+            return False
+        await self.job_store.update_status(job["id"], "done")
+        log.info("One-shot job %r is in the past; marked done", job["id"])
+        return True
+
+    def _register_job(self, job: dict) -> bool:
+        """Register a single job dict into APScheduler. Returns True if registered."""
         job_id = job["id"]
         job_type = job["type"]
         schedule = job.get("schedule", "cron")
@@ -315,11 +331,11 @@ class AgentScheduler:
                 run_at = self._resolve_run_at(job)
                 if run_at is None:
                     log.warning("One-shot job %r has no/invalid run_at; skipping", job_id)
-                    return
+                    return False
                 # Skip one-shots in the past (retired to done by _retire_if_past)
                 if run_at < datetime.now(self.tz):
                     log.info("One-shot job %r is in the past; skipping", job_id)
-                    return
+                    return False
 
                 if job_type == "system":
                     self.scheduler.add_job(
@@ -376,7 +392,7 @@ class AgentScheduler:
                 cron_expr = job.get("cron")
                 if not cron_expr:
                     log.warning("Cron job %r has no cron expression; skipping", job_id)
-                    return
+                    return False
                 cron_kwargs = _parse_cron(cron_expr)
 
                 if job_type == "system":
@@ -431,9 +447,11 @@ class AgentScheduler:
                     )
 
             log.info("Registered %s job %r", schedule, job_id)
+            return True
 
         except Exception:
             log.exception("Failed to register job %r", job_id)
+            return False
 
     async def sync_job(self, job_id: str) -> None:
         """Re-sync a single job from JobStore into APScheduler.
@@ -473,7 +491,6 @@ class AgentScheduler:
     def start(self) -> None:
         """Start the scheduler. Call after load_jobs()."""
         self.scheduler.start()
-        log.info("Scheduler started with %d jobs", len(self.scheduler.get_jobs()))
 
     def shutdown(self) -> None:
         """Gracefully shut down the scheduler."""
@@ -35,6 +35,6 @@ CREATE TABLE IF NOT EXISTS short_term (
 CREATE INDEX IF NOT EXISTS idx_lt_category ON long_term(category);
 CREATE INDEX IF NOT EXISTS idx_lt_subject ON long_term(subject);
 CREATE INDEX IF NOT EXISTS idx_st_expires ON short_term(expires_at);
--- idx_lt_archived / idx_lt_scope / idx_st_scope are created in the
+-- idx_lt_archived / idx_lt_scope / idx_st_scope / idx_st_created are created in the
 -- MemoryStore._migrate_* methods, after their columns are guaranteed to exist
 -- (so legacy DBs that predate those columns migrate cleanly).
@@ -55,12 +55,21 @@ class _SchedulerSpy:
         self.reloads += 1
 
 
+class _MemorySpy:
+    def __init__(self):
+        self.invalidations = 0
+
+    def invalidate_prompt_cache(self):
+        self.invalidations += 1
+
+
 class _AgentStub:
     def __init__(self):
         self.config = Config()
         self.channels = {}
         self.job_store = None  # rename route reaches _get_job_store(); set per-test
         self.scheduler = _SchedulerSpy()
+        self.memory = _MemorySpy()
         self._default_accounts = None  # rebuilt when the default agent is edited
 
     def _build_default_accounts(self, config):
@@ -377,6 +386,7 @@ def test_agent_rename_cascades(tmp_path) -> None:
     assert client.get("/agents/coach", headers=AUTH).status_code == 404
     assert client.get("/agents/trainer", headers=AUTH).status_code == 200
     assert agent.scheduler.reloads == 1  # live scheduler re-registered the renamed job
+    assert agent.memory.invalidations == 1  # running agent drops its stale prompt cache
 
     async def check() -> None:
         h = ConversationHistory(db_path=history_db)
@@ -57,6 +57,16 @@ async def test_agent_override_strips_leaked_managed_env(monkeypatch) -> None:
     assert res2["stdout"].strip().startswith("owner-leaked|"), res2
 
 
+def test_resolve_command_rewrites_tools_dir_without_stat(monkeypatch) -> None:
+    monkeypatch.setattr("core.executor._local_tools_dir", lambda: "/repo/tools/")
+    monkeypatch.setattr("core.executor.Path.exists", lambda self: pytest.fail("stat on hot path"))
+    executor = ToolExecutor()
+
+    resolved = executor._resolve_command("python3 /app/tools/jobs.py list")
+
+    assert resolved.endswith(" /repo/tools/jobs.py list")
+
+
 def test_parse_json_output_handles_invalid_json() -> None:
     executor = ToolExecutor()
     output = executor.parse_json_output("not json")
@@ -69,7 +79,7 @@ async def test_himalaya_command_sets_env(monkeypatch) -> None:
     executor = ToolExecutor()
     created = {}
 
-    async def _fake_subprocess_shell(command, stdout, stderr, env, cwd=None):
+    async def _fake_spawn(*args, stdout, stderr, env, cwd=None):
         created["env"] = env
         created["cwd"] = cwd
 
@@ -81,9 +91,84 @@ async def test_himalaya_command_sets_env(monkeypatch) -> None:
 
         return _Proc()
 
-    monkeypatch.setattr("core.executor.asyncio.create_subprocess_shell", _fake_subprocess_shell)
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_shell", _fake_spawn)
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_exec", _fake_spawn)
     monkeypatch.setattr("core.executor.himalaya_env", lambda: {"HIMALAYA_CONFIG": "/tmp/x"})
 
     await executor.run_command("himalaya envelope list")
 
     assert created["env"]["HIMALAYA_CONFIG"] == "/tmp/x"
+
+
+@pytest.mark.asyncio
+async def test_himalaya_env_built_once_and_reused(monkeypatch) -> None:
+    executor = ToolExecutor()
+    envs = []
+
+    async def _fake_spawn(*args, stdout, stderr, env, cwd=None):
+        envs.append(env)
+
+        class _Proc:
+            returncode = 0
+
+            async def communicate(self):
+                return b"", b""
+
+        return _Proc()
+
+    calls = []
+
+    def _himalaya_env():
+        calls.append(1)
+        return {"HIMALAYA_CONFIG": "/tmp/x"}
+
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_shell", _fake_spawn)
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_exec", _fake_spawn)
+    monkeypatch.setattr("core.executor.himalaya_env", _himalaya_env)
+
+    await executor.run_command("himalaya envelope list")
+    await executor.run_command("himalaya folder list")
+    await executor.run_command("himalaya envelope list", tool_env={"GH_TOKEN": "t"})
+
+    assert len(calls) == 1
+    assert envs[0] is envs[1]
+    # Layered tool env goes on a copy, never into the shared dict.
+    assert envs[2]["GH_TOKEN"] == "t" and envs[2]["HIMALAYA_CONFIG"] == "/tmp/x"
+    assert envs[0].get("GH_TOKEN") != "t"
+
+
+@pytest.mark.asyncio
+async def test_plain_command_skips_the_shell(monkeypatch) -> None:
+    executor = ToolExecutor()
+    spawned = []
+
+    def _fake(kind):
+        async def _spawn(*args, stdout, stderr, env, cwd=None):
+            spawned.append((kind, args))
+
+            class _Proc:
+                returncode = 0
+
+                async def communicate(self):
+                    return b"", b""
+
+            return _Proc()
+
+        return _spawn
+
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_exec", _fake("exec"))
+    monkeypatch.setattr("core.executor.asyncio.create_subprocess_shell", _fake("shell"))
+
+    await executor.run_command("himalaya envelope list --folder 'Sent Items'")
+    await executor.run_command("himalaya envelope list | jq .")
+
+    assert spawned[0] == ("exec", ("himalaya", "envelope", "list", "--folder", "Sent Items"))
+    assert spawned[1] == ("shell", ("himalaya envelope list | jq .",))
+
+
+@pytest.mark.asyncio
+async def test_missing_binary_still_reports_via_shell() -> None:
+    res = await ToolExecutor()._exec("humux-no-such-binary --version", 10)
+
+    assert res["exit_code"] == 127
+    assert "humux-no-such-binary" in res["stderr"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import pytest
@@ -12,6 +13,7 @@ from core.goal_decomposition import (
     _extract_json_object,
     classify_complexity,
     decompose_goal,
+    plan_if_complex,
 )
 
 
@@ -54,6 +56,32 @@ async def test_classify_short_message_skips_llm() -> None:
     assert llm.call_count == 0  # No LLM call made
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [
+        "What's the weather like right now?",
+        "Hello there, how are you doing today?",
+        "Send an email to Marco about the invoice",
+        "Read my latest email from the bank please",
+    ],
+)
+async def test_classify_obviously_simple_skips_llm(message: str) -> None:
+    llm = _LLMStub("COMPLEX")
+    assert await classify_complexity(llm, "test-model", message) is False
+    assert llm.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_classify_chained_actions_still_ask_llm() -> None:
+    llm = _LLMStub("COMPLEX")
+    result = await classify_complexity(
+        llm, "test-model", "Send an email to Marco and then book a table for four"
+    )
+    assert result is True
+    assert llm.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_classify_returns_false_on_error() -> None:
     """LLM errors should gracefully return False (simple)."""
@@ -164,6 +192,22 @@ async def test_decompose_goal_returns_none_on_invalid_json() -> None:
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_decompose_goal_recovers_truncated_output() -> None:
+    """A reply cut off mid-array keeps the steps that were fully emitted."""
+    truncated = (
+        '{"goal": "Plan trip", "steps": ['
+        '{"id": 1, "title": "Passport", "description": "Check it", "depends_on": []},\n'
+        '{"id": 2, "title": "Flights", "description": "Search {direct}", "depends_on": [1]},\n'
+        '{"id": 3, "title": "Hot'
+    )
+    result = await decompose_goal(_LLMStub(truncated), "test-model", "Plan my trip to Tokyo")
+    assert result is not None
+    assert result.goal == "Plan trip"
+    assert [s.title for s in result.steps] == ["Passport", "Flights"]
+    assert result.steps[1].depends_on == [1]
+
+
 @pytest.mark.asyncio
 async def test_decompose_goal_returns_none_on_empty_steps() -> None:
     response = json.dumps({"goal": "Something", "steps": []})
@@ -196,6 +240,55 @@ async def test_decompose_goal_caps_at_6_steps() -> None:
     assert len(result.steps) == 6  # Capped at 6
 
 
+# -- plan_if_complex tests --
+
+
+class _RoutingLLM:
+    """Answers the classifier and the decomposer with separate canned replies."""
+
+    def __init__(self, verdict: str, plan: str, plan_delay: float = 0.0):
+        self._verdict = verdict
+        self._plan = plan
+        self._plan_delay = plan_delay
+        self.plan_finished = False
+
+    async def generate_text(self, *, model: str, prompt: str, max_tokens: int = 1024) -> str:
+        if "request classifier" in prompt:
+            return self._verdict
+        await asyncio.sleep(self._plan_delay)
+        self.plan_finished = True
+        return self._plan
+
+
+_PLAN = json.dumps(
+    {"goal": "Trip", "steps": [{"id": 1, "title": "Book", "description": "Flights"}]}
+)
+
+
+@pytest.mark.asyncio
+async def test_plan_if_complex_returns_plan() -> None:
+    llm = _RoutingLLM("COMPLEX", _PLAN)
+    result = await plan_if_complex(llm, "test-model", "Plan my trip to Tokyo next month")
+    assert result is not None
+    assert result.goal == "Trip"
+
+
+@pytest.mark.asyncio
+async def test_plan_if_complex_cancels_speculative_decomposition() -> None:
+    llm = _RoutingLLM("SIMPLE", _PLAN, plan_delay=10)
+    result = await plan_if_complex(llm, "test-model", "What's the weather like right now?")
+    assert result is None
+    await asyncio.sleep(0)
+    assert llm.plan_finished is False
+
+
+@pytest.mark.asyncio
+async def test_plan_if_complex_short_message_skips_llm() -> None:
+    llm = _LLMStub("COMPLEX")
+    assert await plan_if_complex(llm, "test-model", "Hi") is None
+    assert llm.call_count == 0
+
+
 # -- _extract_json_object tests --
 
 
@@ -231,6 +324,11 @@ class TestExtractJsonObject:
         result = _extract_json_object(raw)
         assert result == {"content": "a {b} c"}
 
+    def test_escaped_quotes_in_strings(self):
+        raw = 'Result: {"content": "say \\"}\\" and \\\\", "n": 1} trailing }'
+        result = _extract_json_object(raw)
+        assert result == {"content": 'say "}" and \\', "n": 1}
+
     def test_array_returns_none(self):
         """Arrays should not be returned (we want objects only)."""
         assert _extract_json_object("[1, 2, 3]") is None
@@ -265,3 +363,39 @@ class TestFormatForPrompt:
         )
         result = goal.format_for_prompt()
         assert "3. C (after steps 1, 2)" in result
+
+    def test_rendered_once(self):
+        goal = DecomposedGoal(goal="G", steps=[SubGoal(id=1, title="A", description="Do A")])
+        first = goal.format_for_prompt()
+        goal.steps.clear()  # a second render would now come out empty
+        assert goal.format_for_prompt() is first
+        assert goal == DecomposedGoal(goal="G", steps=[])
+
+
+# -- AgentCore plan cache --
+
+
+@pytest.mark.asyncio
+async def test_agent_reuses_cached_plan_for_repeated_request(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    from core.agent import AgentCore
+    from core.config import Config
+
+    agent = AgentCore(Config())
+    llm = _RoutingLLM("COMPLEX", _PLAN)
+    calls = []
+    monkeypatch.setattr(agent, "_background_llm", lambda *a: calls.append(a) or llm)
+
+    first = await agent._maybe_decompose("Plan my trip to Tokyo next month")
+    again = await agent._maybe_decompose("  plan my TRIP to Tokyo   next month ")
+
+    assert first is not None
+    assert again is first
+    assert len(calls) == 1
+
+    # Past the TTL the plan is rebuilt rather than served stale.
+    import core.agent as agent_mod
+
+    monkeypatch.setattr(agent_mod, "_PLAN_CACHE_TTL", 0.0)
+    assert await agent._maybe_decompose("Plan my trip to Tokyo next month") is not first
+    assert len(calls) == 2
@@ -89,6 +89,13 @@ def test_coalesce_does_not_mutate_input() -> None:
     assert msgs == [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}]
 
 
+def test_coalesce_shares_untouched_messages_and_list_is_new() -> None:
+    msgs = [{"role": "user", "content": "a"}, {"role": "assistant", "content": "b"}]
+    out = _coalesce_user_messages(msgs)
+    assert out is not msgs
+    assert all(o is m for o, m in zip(out, msgs, strict=True))
+
+
 def test_coalesce_empty() -> None:
     assert _coalesce_user_messages([]) == []
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import aiosqlite
 import pytest
 
 from core.history import ConversationHistory
@@ -55,6 +58,37 @@ async def test_multiple_pairs(tmp_path) -> None:
     assert messages[3]["content"] == "reply3"
 
 
+@pytest.mark.asyncio
+async def test_add_turns_stores_pair_in_order(tmp_path) -> None:
+    """add_turns persists a batch of turns, in list order."""
+    db_path = str(tmp_path / "agent.db")
+    history = ConversationHistory(db_path=db_path, max_turns=5)
+
+    await history.add_turns("telegram", "u1", [("user", "hi"), ("assistant", "hello")])
+    await history.add_turns("telegram", "u1", [])
+
+    messages = await history.get_messages("telegram", "u1")
+
+    assert [(m["role"], m["content"]) for m in messages] == [
+        ("user", "hi"),
+        ("assistant", "hello"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fresh_schema_skips_autoincrement(tmp_path) -> None:
+    """Turn/message ids are plain rowids — no sqlite_sequence bookkeeping."""
+    db_path = str(tmp_path / "agent.db")
+    history = ConversationHistory(db_path=db_path)
+
+    await history.add_turn("telegram", "u1", "user", "hi")
+    await history.append_session_message("telegram", "u1", {"role": "user", "content": "hi"})
+
+    async with aiosqlite.connect(db_path) as db:
+        cursor = await db.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_sequence'")
+        assert await cursor.fetchone() is None
+
+
 @pytest.mark.asyncio
 async def test_messages_include_timestamps(tmp_path) -> None:
     """Returned messages include a created_at key."""
@@ -140,6 +174,55 @@ async def test_session_persists_across_instances(tmp_path) -> None:
     assert session[1]["content"] == "pong"
 
 
+@pytest.mark.asyncio
+async def test_concurrent_cold_loads_share_one_session(tmp_path) -> None:
+    """Concurrent first reads of a session load it once and share the list."""
+    db_path = str(tmp_path / "agent.db")
+
+    h1 = ConversationHistory(db_path=db_path)
+    await h1.append_session_message("telegram", "u1", {"role": "user", "content": "ping"})
+
+    h2 = ConversationHistory(db_path=db_path)
+    sessions = await asyncio.gather(*(h2.get_session("telegram", "u1") for _ in range(5)))
+    assert all(s is sessions[0] for s in sessions)
+    assert sessions[0] == [{"role": "user", "content": "ping"}]
+    assert h2._load_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_session_cache_evicts_least_recently_used(tmp_path) -> None:
+    """Past max_sessions the LRU session leaves memory and reloads from SQLite."""
+    db_path = str(tmp_path / "agent.db")
+    history = ConversationHistory(db_path=db_path, max_sessions=2)
+
+    await history.append_session_message("telegram", "u1", {"role": "user", "content": "one"})
+    await history.append_session_message("telegram", "u2", {"role": "user", "content": "two"})
+    await history.get_session("telegram", "u1")  # u1 becomes most recent
+    await history.append_session_message("telegram", "u3", {"role": "user", "content": "three"})
+
+    assert list(history._sessions) == [("telegram", "u1", ""), ("telegram", "u3", "")]
+    assert await history.get_session("telegram", "u2") == [{"role": "user", "content": "two"}]
+    assert ("telegram", "u1", "") not in history._sessions
+
+
+@pytest.mark.asyncio
+async def test_concurrent_session_loads_survive_eviction(tmp_path) -> None:
+    """With a one-session cache, concurrent loads evict each other; none raises."""
+    import asyncio
+
+    history = ConversationHistory(db_path=str(tmp_path / "agent.db"), max_sessions=1)
+    for user in ("u1", "u2", "u3"):
+        await history.append_session_message("telegram", user, {"role": "user", "content": user})
+    history._sessions.clear()
+
+    got = await asyncio.gather(
+        *(history.get_session("telegram", u) for u in ("u1", "u2", "u1", "u3", "u1"))
+    )
+
+    assert [s[0]["content"] for s in got] == ["u1", "u2", "u1", "u3", "u1"]
+    assert history._touch_session(("telegram", "gone", "")) is None
+
+
 @pytest.mark.asyncio
 async def test_session_isolation_by_channel_user(tmp_path) -> None:
     """Sessions are isolated per (channel, user_id, chat_id)."""
@@ -407,3 +490,15 @@ async def test_new_command_case_insensitive(tmp_path) -> None:
 
     assert response.text == "Conversation cleared."
     assert await agent.history.get_messages("telegram", "u1") == []
+
+
+@pytest.mark.asyncio
+async def test_call_racing_close_raises_a_clear_error(tmp_path) -> None:
+    """A call that got past _ensure_schema before close() fails clearly, not on None."""
+    history = ConversationHistory(db_path=str(tmp_path / "agent.db"))
+    await history._ensure_schema()
+    await history.close()
+    with pytest.raises(RuntimeError, match="history store closed"):
+        history._locked(lambda db: db.execute("SELECT 1"))
+    assert await history.get_session("telegram", "u1") == []  # later calls reopen
+    await history.close()
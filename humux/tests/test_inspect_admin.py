@@ -233,3 +233,48 @@ def test_patch_config_restart_required_only_on_real_change(tmp_path) -> None:
     # voice change → restart; hot-applied key → no restart.
     assert patch({"voice.tts_voice": "en-US-AvaNeural"})["restart_required"] is True
     assert patch({"memory.long_term_limit": "99"})["restart_required"] is False
+
+
+def test_history_store_cache_closes_replaced_and_on_shutdown(tmp_path) -> None:
+    """The admin history connection is closed when the db path changes and at shutdown."""
+    from api.admin import _HISTORY_STORES, _history_from_config, close_history_stores
+
+    store = _Store(tmp_path)
+
+    async def run() -> None:
+        first = await _history_from_config(cast(ConfigStore, store))
+        assert await _history_from_config(cast(ConfigStore, store)) is first
+        await first.list_chats()  # opens the connection
+        assert first._conn is not None
+
+        store._data["history.db_path"] = str(tmp_path / "other.db")
+        second = await _history_from_config(cast(ConfigStore, store))
+        assert second is not first
+        assert first._conn is None
+        assert list(_HISTORY_STORES.values()) == [second]
+
+        await second.list_chats()
+        await close_history_stores()
+        assert second._conn is None
+        assert _HISTORY_STORES == {}
+
+    asyncio.run(run())
+
+
+def test_admin_job_store_is_reused_and_closed_at_shutdown(tmp_path, monkeypatch) -> None:
+    """With no agent running the admin app reuses one JobStore and closes it at shutdown."""
+    from api.admin import _JOB_STORES, _admin_job_store, close_admin_stores
+
+    monkeypatch.chdir(tmp_path)
+
+    async def run() -> None:
+        store = _admin_job_store()
+        assert _admin_job_store() is store
+        await store.upsert_job("j1", cron="0 7 * * *", task="t")
+        assert store._conn is not None
+
+        await close_admin_stores()
+        assert store._conn is None
+        assert _JOB_STORES == {}
+
+    asyncio.run(run())
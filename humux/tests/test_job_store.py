@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from core.job_store import JobStore
 
 
@@ -36,3 +38,196 @@ def test_agent_persists_and_survives_omitting_edit(tmp_path) -> None:
     # Re-upsert (e.g. status change) without agent must not wipe it.
     store.upsert_job_sync("brief", cron="0 7 * * *", task="t", status="paused")
     assert store.get_job_sync("brief")["agent"] == "coach"
+
+
+def test_schema_switches_database_to_wal(tmp_path) -> None:
+    """Readers must not block the scheduler's writes: the DB runs in WAL mode."""
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    store.upsert_job_sync("a", cron="0 7 * * *", task="t")
+
+    assert store._run_sync(lambda db: db.execute("PRAGMA journal_mode").fetchone()[0]) == "wal"
+    assert store._run_sync(lambda db: db.execute("PRAGMA synchronous").fetchone()[0]) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_calls_share_one_connection(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    store.upsert_job_sync("a", cron="0 7 * * *", task="t")
+    conn = store._conn
+
+    assert (await store.get_job("a"))["task"] == "t"
+    await store.update_status("a", "paused")
+    assert store.get_job_sync("a")["status"] == "paused"
+    assert store._conn is conn
+
+    await store.close()
+    assert store._conn is None
+    assert [j["id"] for j in await store.list_jobs()] == ["a"]  # reopens on demand
+
+
+def test_reads_use_read_only_pool_outside_writer_lock(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    store.upsert_job_sync("a", cron="0 7 * * *", task="t")
+    assert store._read_sync(lambda db: db.execute("PRAGMA query_only").fetchone()[0]) == 1
+
+    # A write in progress (lock held) doesn't stall listings on a warm pool.
+    with store._db_lock:
+        assert [j["id"] for j in store.list_jobs_sync()] == ["a"]
+        assert store.get_job_sync("a")["task"] == "t"
+
+
+class _FakeConfigStore:
+    def __init__(self, raw):
+        self.raw = raw
+        self.deleted = []
+
+    async def get(self, key):
+        return self.raw
+
+    async def delete(self, key):
+        self.deleted.append(key)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw", ["{not json", 42])
+async def test_migrate_from_config_store_ignores_unparseable_jobs(tmp_path, raw) -> None:
+    """Bad JSON (JSONDecodeError) and non-string values (TypeError) both bail out."""
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    config_store = _FakeConfigStore(raw)
+
+    assert await store.migrate_from_config_store(config_store) == 0
+    assert config_store.deleted == []
+
+
+@pytest.mark.asyncio
+async def test_seed_from_config_only_inserts_new_ids(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    await store.upsert_job("brief", cron="0 7 * * *", task="edited", created_by="admin")
+
+    inserted = await store.seed_from_config(
+        [
+            {"id": "brief", "cron": "0 8 * * *", "task": "from config"},
+            {"id": "digest", "cron": "0 9 * * *", "task": "d", "agent": "coach"},
+        ]
+    )
+
+    assert inserted == 1
+    assert (await store.get_job("brief"))["task"] == "edited"
+    digest = await store.get_job("digest")
+    assert (digest["created_by"], digest["agent"]) == ("config", "coach")
+    assert await store.seed_from_config([{"id": "digest", "cron": "0 9 * * *"}]) == 0
+    # A stored id's config entry isn't read, so one without ``cron`` can't abort the seed.
+    assert await store.seed_from_config([{"id": "brief"}, {"id": "n", "cron": "0 6 * * *"}]) == 1
+
+
+def test_upsert_returns_stored_row_without_reselect(tmp_path, monkeypatch) -> None:
+    """The upsert hands back the merged row (sticky agent included) itself."""
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    store.upsert_job_sync("brief", cron="0 7 * * *", task="t", agent="coach")
+    monkeypatch.setattr(
+        "core.job_store._get_job", lambda *a: pytest.fail("re-selected after upsert")
+    )
+
+    job = store.upsert_job_sync("brief", cron="0 8 * * *", task="t2")
+
+    assert (job["cron"], job["task"], job["agent"]) == ("0 8 * * *", "t2", "coach")
+
+
+def test_status_listings_use_the_status_index(tmp_path) -> None:
+    from core.job_store import _SQL_LIST_BY_STATUS, _SQL_LIST_LIVE
+
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+
+    def plan(sql, *args):
+        rows = store._read_sync(lambda db: db.execute(f"EXPLAIN QUERY PLAN {sql}", args).fetchall())
+        return " | ".join(r[-1] for r in rows)
+
+    by_status = plan(_SQL_LIST_BY_STATUS, "active")
+    assert "idx_jobs_status_created" in by_status
+    assert "TEMP B-TREE" not in by_status  # index order serves ORDER BY
+    assert "idx_jobs_status_created" in plan(_SQL_LIST_LIVE)
+
+
+def test_job_columns_come_back_in_a_fixed_order_on_migrated_dbs(tmp_path) -> None:
+    """A pre-migration DB gets agent/origin_* appended last; reads don't care."""
+    import sqlite3
+
+    from core.job_store import _JOB_COLUMNS
+
+    db_path = tmp_path / "jobs.db"
+    with sqlite3.connect(db_path) as db:
+        db.execute(
+            "CREATE TABLE jobs (id TEXT PRIMARY KEY, type TEXT NOT NULL DEFAULT 'agent', "
+            "schedule TEXT NOT NULL DEFAULT 'cron', cron TEXT, run_at TEXT, "
+            "task TEXT NOT NULL DEFAULT '', channel TEXT NOT NULL DEFAULT 'telegram', "
+            "status TEXT NOT NULL DEFAULT 'active', created_by TEXT NOT NULL DEFAULT 'admin', "
+            "description TEXT NOT NULL DEFAULT '', "
+            "created_at TEXT NOT NULL DEFAULT (datetime('now')), "
+            "updated_at TEXT NOT NULL DEFAULT (datetime('now')))"
+        )
+        db.execute("INSERT INTO jobs (id, cron, task) VALUES ('old', '0 7 * * *', 't')")
+
+    store = JobStore(db_path=str(db_path))
+
+    assert tuple(store.get_job_sync("old")) == _JOB_COLUMNS
+    assert tuple(store.upsert_job_sync("new", cron="0 8 * * *")) == _JOB_COLUMNS
+
+
+@pytest.mark.asyncio
+async def test_list_active_for_scheduler_projects_scheduling_columns(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    await store.upsert_job("a", cron="0 7 * * *", task="t", agent="coach", description="ui")
+    await store.upsert_job("p", cron="0 7 * * *", task="t", status="paused")
+
+    jobs = await store.list_active_for_scheduler()
+
+    assert [j["id"] for j in jobs] == ["a"]
+    assert jobs[0]["agent"] == "coach"
+    assert "description" not in jobs[0] and "created_at" not in jobs[0]
+
+
+@pytest.mark.asyncio
+async def test_writes_stamp_timestamps_in_sqlite_format(tmp_path, monkeypatch) -> None:
+    """Timestamps come from Python but keep datetime('now')'s text layout."""
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    monkeypatch.setattr("core.job_store._now", lambda: "2026-01-02 03:04:05")
+    job = await store.upsert_job("a", cron="0 7 * * *")
+    assert (job["created_at"], job["updated_at"]) == ("2026-01-02 03:04:05",) * 2
+
+    monkeypatch.setattr("core.job_store._now", lambda: "2026-01-03 00:00:00")
+    await store.update_status("a", "paused")
+    job = await store.get_job("a")
+    assert (job["created_at"], job["updated_at"]) == ("2026-01-02 03:04:05", "2026-01-03 00:00:00")
+
+    from datetime import datetime
+
+    monkeypatch.undo()
+    from core.job_store import _now
+
+    sqlite_now = await store._read(lambda db: db.execute("SELECT datetime('now')").fetchone()[0])
+    for stamp in (_now(), sqlite_now):
+        datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S")
+
+
+@pytest.mark.asyncio
+async def test_update_statuses_applies_each_pair_in_one_statement(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    for job_id in ("a", "b", "c"):
+        await store.upsert_job(job_id, cron="0 7 * * *")
+
+    changed = await store.update_statuses([("a", "done"), ("b", "paused"), ("missing", "done")])
+
+    assert changed == 2
+    statuses = {j["id"]: j["status"] for j in await store.list_jobs(include_done=True)}
+    assert statuses == {"a": "done", "b": "paused", "c": "active"}
+    assert await store.update_statuses([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_migrate_from_config_store_seeds_jobs_and_drops_key(tmp_path) -> None:
+    store = JobStore(db_path=str(tmp_path / "jobs.db"))
+    config_store = _FakeConfigStore('[{"id": "brief", "cron": "0 7 * * *", "task": "t"}]')
+
+    assert await store.migrate_from_config_store(config_store) == 1
+    assert (await store.get_job("brief"))["task"] == "t"
+    assert config_store.deleted == ["scheduler.jobs"]
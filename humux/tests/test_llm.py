@@ -40,6 +40,19 @@ def test_from_agent_config_openrouter_base_url_override() -> None:
     assert "example.test" in str(client._client.base_url)
 
 
+@pytest.mark.parametrize("provider", ["google", "grok", "deepseek"])
+def test_from_agent_config_picks_provider_credentials(provider: str) -> None:
+    cfg = AgentConfig(llm_provider=provider, **{f"{provider}_api_key": "k-" + provider})
+    client = LLMClient.from_agent_config(cfg)
+    assert client.provider == provider
+    assert client._client.api_key == "k-" + provider
+
+
+def test_from_agent_config_unknown_provider_falls_back_to_anthropic() -> None:
+    cfg = AgentConfig(llm_provider="mystery", anthropic_api_key="a")
+    assert LLMClient.from_agent_config(cfg).provider == "anthropic"
+
+
 @pytest.mark.asyncio
 async def test_anthropic_generate_sends_effort_when_set() -> None:
     client = LLMClient("anthropic", "x", thinking_level="medium")
@@ -80,6 +93,38 @@ async def test_anthropic_generate_text_sends_effort_when_set() -> None:
     assert kwargs["output_config"] == {"effort": "low"}
 
 
+@pytest.mark.asyncio
+async def test_anthropic_generate_text_marks_cached_prefix() -> None:
+    """A cached_prefix goes out as its own cache-breakpoint block before the prompt."""
+    client = LLMClient("anthropic", "x")
+    create = AsyncMock(return_value=type("R", (), {"content": []})())
+    client._client = type("C", (), {"messages": type("M", (), {"create": create})()})()
+
+    await client.generate_text(model="claude-haiku-4-5", prompt="data", cached_prefix="rules")
+
+    [message] = create.await_args.kwargs["messages"]
+    assert message["content"] == [
+        {"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "data"},
+    ]
+
+    await client.generate_text(model="claude-haiku-4-5", prompt="data")
+    assert create.await_args.kwargs["messages"] == [{"role": "user", "content": "data"}]
+
+
+@pytest.mark.asyncio
+async def test_openai_generate_text_prepends_cached_prefix() -> None:
+    client = LLMClient("openai", "x")
+    msg = type("Msg", (), {"content": "ok"})()
+    resp = type("R", (), {"choices": [type("Choice", (), {"message": msg})()]})()
+    create = AsyncMock(return_value=resp)
+    completions = type("Co", (), {"create": create})()
+    client._client = type("C", (), {"chat": type("Ch", (), {"completions": completions})()})()
+
+    assert await client.generate_text(model="gpt-5", prompt="data", cached_prefix="rules") == "ok"
+    assert create.await_args.kwargs["messages"] == [{"role": "user", "content": "rules\n\ndata"}]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("stop_reason", "expected"),
@@ -178,3 +223,155 @@ def test_reasoning_kwargs_per_provider() -> None:
     assert LLMClient("anthropic", "x")._reasoning_kwargs() == {}
     # unknown level value is ignored (off)
     assert LLMClient("anthropic", "x", thinking_level="bogus")._reasoning_kwargs() == {}
+
+
+@pytest.mark.asyncio
+async def test_openai_generate_defers_model_dump_until_assistant_message() -> None:
+    dumps = []
+
+    def _dump(self, exclude_none=True):
+        dumps.append(1)
+        return {"role": "assistant", "content": "hi", "tool_calls": []}
+
+    client = LLMClient("openai", "x")
+    msg = type(
+        "Msg",
+        (),
+        {
+            "tool_calls": None,
+            "content": "hi",
+            "reasoning_content": None,
+            "reasoning": None,
+            "model_dump": _dump,
+        },
+    )()
+    choice = type("Choice", (), {"message": msg, "finish_reason": "stop"})()
+    create = AsyncMock(return_value=type("R", (), {"choices": [choice], "usage": None})())
+    completions = type("Co", (), {"create": create})()
+    client._client = type("C", (), {"chat": type("Ch", (), {"completions": completions})()})()
+
+    out = await client.generate(model="gpt-5", system="s", messages=[], tools=[])
+    assert out.text == "hi" and dumps == []
+
+    assert client.assistant_message(out)["content"] == "hi"
+    assert client.assistant_message(out)["content"] == "hi"
+    assert dumps == [1]
+
+
+def test_openai_tool_conversion_reused_for_the_same_list() -> None:
+    client = LLMClient("openai", "x")
+    tools = [{"name": "t", "description": "d", "input_schema": {"type": "object"}}]
+
+    first = client._converted_tools(tools)
+    assert client._converted_tools(tools) is first
+    assert first[0]["function"]["name"] == "t"
+    # An equal but distinct list (next turn) converts afresh.
+    assert client._converted_tools(list(tools)) is not first
+
+
+@pytest.mark.asyncio
+async def test_anthropic_generate_sorts_blocks_by_type() -> None:
+    def _block(**kw):
+        return type("B", (), kw)()
+
+    content = [
+        _block(type="thinking", thinking="hmm"),
+        _block(type="text", text="Let me check."),
+        _block(type="tool_use", id="t1", name="web_search", input={"q": "x"}),
+        _block(type="server_tool_use"),
+    ]
+    client = LLMClient("anthropic", "x")
+    resp = type("R", (), {"content": content, "usage": None, "stop_reason": "tool_use"})()
+    create = AsyncMock(return_value=resp)
+    client._client = type("C", (), {"messages": type("M", (), {"create": create})()})()
+
+    out = await client.generate(model="claude-opus-4-8", system="s", messages=[], tools=[])
+
+    assert (out.text, out.reasoning) == ("Let me check.", "hmm")
+    assert [(c.id, c.name, c.arguments) for c in out.tool_calls] == [
+        ("t1", "web_search", {"q": "x"})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_anthropic_generate_strips_each_text_block() -> None:
+    content = [type("B", (), {"type": "text", "text": t})() for t in ("  a \n", " ", "b  ")]
+    client = LLMClient("anthropic", "x")
+    resp = type("R", (), {"content": content, "usage": None, "stop_reason": "end_turn"})()
+    create = AsyncMock(return_value=resp)
+    client._client = type("C", (), {"messages": type("M", (), {"create": create})()})()
+
+    out = await client.generate(model="claude-haiku-4-5", system="s", messages=[], tools=[])
+
+    assert out.text == "a\nb"
+
+
+def test_openai_client_class_imported_once(monkeypatch) -> None:
+    imports = []
+    fake = type("M", (), {"AsyncOpenAI": lambda **kw: kw})
+    monkeypatch.setattr(llm.importlib, "import_module", lambda name: imports.append(name) or fake)
+    llm._openai_client_class.cache_clear()
+    try:
+        LLMClient("openai", "k1")
+        client = LLMClient("deepseek", "k2")
+    finally:
+        llm._openai_client_class.cache_clear()
+
+    assert imports == ["openai"]
+    assert client._client["api_key"] == "k2"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, {}),
+        ("", {}),
+        ("{}", {}),
+        ('{"q": "x", "n": 2}', {"q": "x", "n": 2}),
+        ('{"q": ', {}),
+        ("[1, 2]", {}),
+    ],
+)
+def test_openai_tool_arguments(raw, expected) -> None:
+    assert llm._openai_tool_arguments(raw) == expected
+
+
+async def test_background_llm_reuses_sdk_client_per_provider_and_key() -> None:
+    """Background clients for a non-main provider share one SDK pool per provider;
+    a credential change replaces it and closes the old pool."""
+    from types import SimpleNamespace
+
+    from core.agent import AgentCore
+
+    agent = object.__new__(AgentCore)
+    agent.llm = LLMClient("anthropic", "a")
+    agent.config = SimpleNamespace(agent=SimpleNamespace(openai_api_key="k1", openai_base_url=None))
+    agent._background_clients = {}
+    agent._background_tasks = set()
+
+    low = agent._background_llm("openai", "low")
+    high = agent._background_llm("openai", "HIGH")
+    assert low is not high
+    assert low._client is high._client
+    assert (low.thinking_level, high.thinking_level) == ("low", "high")
+    assert agent._background_llm("anthropic")._client is agent.llm._client
+
+    # A background task already running with the old client keeps it open.
+    import asyncio
+
+    release = asyncio.Event()
+
+    async def _still_using_old_client():
+        await release.wait()
+        assert not low._client.is_closed()
+
+    agent._spawn_background(_still_using_old_client(), name="extract")
+
+    agent.config.agent.openai_api_key = "k2"  # live credential change
+    assert agent._background_llm("openai")._client is not low._client
+    assert len(agent._background_clients) == 1
+    await asyncio.sleep(0.01)
+    assert not low._client.is_closed()
+    release.set()
+    await agent.drain_background()
+    assert low._client.is_closed()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
@@ -85,8 +86,36 @@ def test_lifecycle_htmx_returns_html(monkeypatch) -> None:
     assert "alert-success" in stop_resp.text
 
 
-def test_restart_agent(monkeypatch) -> None:
-    """Test restart returns correct JSON and HTMX responses."""
+def test_warmup_starts_once_and_start_shares_it(monkeypatch) -> None:
+    """Hovering Start warms the agent up; the click then joins that start."""
+    started_agent = SimpleNamespace(channels={"telegram": object()})
+    agent_state = main.AgentState()
+    starts = []
+
+    async def _start_agent(_store):
+        starts.append(1)
+        await asyncio.sleep(0.05)
+        return started_agent
+
+    monkeypatch.setattr(main, "_start_agent", _start_agent)
+
+    headers = {"Authorization": "Bearer secret"}
+    with _client(agent_state) as client:
+        assert client.post("/agent/warmup", headers=headers).json() == {"status": "starting"}
+        assert client.post("/agent/warmup", headers=headers).json() == {"status": "starting"}
+
+        resp = client.post("/agent/start", headers=headers)
+
+    assert resp.json() == {"status": "started", "channels": ["telegram"]}
+    assert starts == [1]
+    assert agent_state.status == "RUNNING"
+    assert agent_state.start_task is None
+
+
+async def test_restart_agent(monkeypatch) -> None:
+    """Restart is accepted (202) and runs as a task after the response."""
+    import httpx
+
     started_agent = SimpleNamespace(channels={"telegram": object()})
     agent_state = main.AgentState()
 
@@ -99,21 +128,126 @@ def test_restart_agent(monkeypatch) -> None:
     monkeypatch.setattr(main, "_start_agent", _start_agent)
     monkeypatch.setattr(main, "_stop_agent", _stop_agent)
 
-    client = _client(agent_state)
+    app, auth = main.create_admin_app(agent_state, _ConfigStoreStub())
+    main._attach_lifecycle_routes(app, _ConfigStoreStub(), agent_state, auth)
     headers = {"Authorization": "Bearer secret"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # JSON response
+        resp = await client.post("/agent/restart", headers=headers)
+        assert resp.status_code == 202
+        assert resp.json() == {"status": "restarting"}
+        await agent_state.restart_task
+        assert agent_state.agent is started_agent
+        assert agent_state.status == "RUNNING"
+        assert agent_state.restart_task is None
+
+        # HTMX response
+        htmx_headers = {**headers, "HX-Request": "true"}
+        resp = await client.post("/agent/restart", headers=htmx_headers)
+        assert resp.status_code == 202
+        assert "Restarting" in resp.text
+        assert "alert-success" in resp.text
+        await agent_state.restart_task
+        assert agent_state.status == "RUNNING"
+
+
+async def test_restart_survives_failed_response(monkeypatch) -> None:
+    """A response that can't be sent doesn't strand the restart lock."""
+    import httpx
+
+    agent_state = main.AgentState(agent=SimpleNamespace(channels={}), status="RUNNING")
+    starts = []
 
-    # JSON response
-    resp = client.post("/agent/restart", headers=headers)
-    assert resp.status_code == 200
-    assert resp.json()["status"] == "restarted"
-    assert resp.json()["channels"] == ["telegram"]
+    async def _start_agent(_store):
+        starts.append(1)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(channels={"telegram": object()})
 
-    # HTMX response
-    htmx_headers = {**headers, "HX-Request": "true"}
-    resp = client.post("/agent/restart", headers=htmx_headers)
-    assert resp.status_code == 200
-    assert "Restarted" in resp.text
-    assert "alert-success" in resp.text
+    async def _stop_agent(_agent):
+        return None
+
+    monkeypatch.setattr(main, "_start_agent", _start_agent)
+    monkeypatch.setattr(main, "_stop_agent", _stop_agent)
+
+    app, auth = main.create_admin_app(agent_state, _ConfigStoreStub())
+    main._attach_lifecycle_routes(app, _ConfigStoreStub(), agent_state, auth)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/agent/restart",
+        "raw_path": b"/agent/restart",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", b"Bearer secret"), (b"host", b"test")],
+        "server": ("test", 80),
+        "client": ("test", 1234),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        raise OSError("client disconnected")
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        pass
+    await agent_state.restart_task
+
+    assert starts == [1]
+    assert agent_state.status == "RUNNING"
+    assert agent_state.restart_task is None
+
+    # The lock was released: a later restart still runs.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post("/agent/restart", headers={"Authorization": "Bearer secret"})
+        assert resp.status_code == 202
+        await agent_state.restart_task
+    assert starts == [1, 1]
+    assert agent_state.status == "RUNNING"
+
+
+async def test_overlapping_restarts_build_one_agent(monkeypatch) -> None:
+    """A second restart (or a start) during a restart doesn't start another agent."""
+    import httpx
+
+    agent_state = main.AgentState(agent=SimpleNamespace(channels={}), status="RUNNING")
+    starts = []
+
+    async def _start_agent(_store):
+        starts.append(1)
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(channels={"telegram": object()})
+
+    async def _stop_agent(_agent):
+        return None
+
+    monkeypatch.setattr(main, "_start_agent", _start_agent)
+    monkeypatch.setattr(main, "_stop_agent", _stop_agent)
+
+    app, auth = main.create_admin_app(agent_state, _ConfigStoreStub())
+    main._attach_lifecycle_routes(app, _ConfigStoreStub(), agent_state, auth)
+    headers = {"Authorization": "Bearer secret"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/agent/restart", headers=headers))
+        await asyncio.sleep(0.01)
+        second = await client.post("/agent/restart", headers=headers)
+        start = await client.post("/agent/start", headers=headers)
+        first = await first
+        await agent_state.restart_task
+
+    assert first.status_code == second.status_code == 202
+    assert first.json() == second.json() == {"status": "restarting"}
+    assert start.json() == {"status": "starting"}
+    assert starts == [1]
+    assert agent_state.status == "RUNNING"
 
 
 def test_lifecycle_requires_auth() -> None:
@@ -121,7 +255,7 @@ def test_lifecycle_requires_auth() -> None:
     agent_state = main.AgentState()
     client = _client(agent_state)
 
-    for path in ["/agent/start", "/agent/stop", "/agent/restart"]:
+    for path in ["/agent/warmup", "/agent/start", "/agent/stop", "/agent/restart"]:
         resp = client.post(path)
         assert resp.status_code == 401, f"{path} should require auth"
 
@@ -207,3 +341,98 @@ async def test_migrate_telegram_unresolved_vault_ref_not_baked_in(tmp_path, monk
 
     assert (await store.get_default()).bot_token == ""  # not baked in as a literal ref
     assert await cs.get("channels.telegram.bot_token") == "${vault:TELEGRAM_BOT_TOKEN}"  # kept
+
+
+async def test_export_config_reused_until_store_or_vault_changes(tmp_path, monkeypatch) -> None:
+    from core.config_store import ConfigStore
+
+    vault = {}
+
+    async def _load_infra_cache():
+        return vault
+
+    monkeypatch.setattr(
+        main,
+        "_secret_store",
+        SimpleNamespace(load_infra_cache=_load_infra_cache, infra_resolve=vault.get),
+    )
+    monkeypatch.setattr(main, "_exported_config", None)
+    cs = ConfigStore(db_path=str(tmp_path / "config.db"))
+    await cs.set("agent.name", "${vault:NAME}")
+    vault["NAME"] = "Ada"
+
+    first = await main._export_config(cs)
+    assert await main._export_config(cs) is first
+    assert first.agent.name == "Ada"
+
+    vault["NAME"] = "Grace"
+    second = await main._export_config(cs)
+    assert second is not first and second.agent.name == "Grace"
+
+    await cs.set("agent.timezone", "UTC")
+    third = await main._export_config(cs)
+    assert third is not second and third.agent.timezone == "UTC"
+
+
+async def test_stop_does_not_hang_on_a_stuck_bot_start(monkeypatch) -> None:
+    """A bot stuck connecting is cancelled after the timeout instead of blocking the stop."""
+    monkeypatch.setattr(main, "_CHANNEL_STARTUP_TIMEOUT", 0.05)
+    cancelled = []
+
+    async def _stuck_connect():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def _noop(*_args, **_kwargs):
+        return None
+
+    store = SimpleNamespace(close=_noop)
+    agent = SimpleNamespace(
+        scheduler=SimpleNamespace(shutdown=lambda: None),
+        channels={},
+        channel_startup=asyncio.gather(_stuck_connect()),
+        drain_background=_noop,
+        history=store,
+        job_store=store,
+        memory=store,
+    )
+
+    await asyncio.wait_for(main._stop_agent(agent), timeout=2)
+
+    assert cancelled == [True]
+    assert agent.channel_startup is None
+
+
+async def test_stop_during_warmup_stops_the_agent_it_brings_up(monkeypatch) -> None:
+    """/agent/stop while a warmup start is in flight waits for it, then stops it."""
+    import httpx
+
+    agent_state = main.AgentState()
+    stopped = []
+
+    async def _start_agent(_store):
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(channels={})
+
+    async def _stop_agent(agent):
+        stopped.append(agent)
+
+    monkeypatch.setattr(main, "_start_agent", _start_agent)
+    monkeypatch.setattr(main, "_stop_agent", _stop_agent)
+
+    app, auth = main.create_admin_app(agent_state, _ConfigStoreStub())
+    main._attach_lifecycle_routes(app, _ConfigStoreStub(), agent_state, auth)
+    headers = {"Authorization": "Bearer secret"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.post("/agent/warmup", headers=headers)).json() == {
+            "status": "starting"
+        }
+        resp = await client.post("/agent/stop", headers=headers)
+
+    assert resp.json() == {"status": "stopped"}
+    assert len(stopped) == 1
+    assert agent_state.agent is None and agent_state.status == "STOPPED"
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import cast
+from types import SimpleNamespace
+from typing import Any, cast
 
 from fastapi.testclient import TestClient
 
@@ -114,3 +115,28 @@ def test_memory_partial_renders() -> None:
     assert "Semantic memory (embeddings)" in body
     assert "Memory lifecycle" in body
     assert "Download model" in body
+
+
+async def test_delete_memory_drops_cached_prompt_block(tmp_path) -> None:
+    """Deleting via the admin API stops the memory being injected right away."""
+    import httpx
+
+    from core.memory import MemoryStore
+
+    memory = MemoryStore(db_path=str(tmp_path / "memory.db"))
+    await memory._insert_long_term("fact", "matteo", "lives in zurich")
+    assert "lives in zurich" in await memory.format_for_prompt()  # now cached
+    memory_id = await memory._read(lambda db: db.execute("SELECT id FROM long_term").fetchone()[0])
+
+    agent_state = AgentState(agent=cast(Any, SimpleNamespace(memory=memory)))
+    app, _auth = create_admin_app(agent_state, cast(ConfigStore, _StoreStub()))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            "/memory/delete",
+            json={"tier": "long-term", "memory_id": memory_id},
+            headers=HEADERS,
+        )
+    assert resp.status_code == 200
+    assert "lives in zurich" not in await memory.format_for_prompt()
+    await memory.close()
@@ -73,7 +73,7 @@ class _LLMStub:
         self._emit_response = self.generate_text
 
     async def generate_text_with_prompt(
-        self, *, model: str, prompt: str, max_tokens: int = 1024
+        self, *, model: str, prompt: str, max_tokens: int = 1024, cached_prefix: str = ""
     ) -> str:
         self.last_prompt = prompt
         return await self._emit_response(model=model, prompt=prompt, max_tokens=max_tokens)
@@ -263,6 +263,10 @@ class TestConsolidateAndCleanup:
         prompt_text = llm.last_prompt or ""
         assert "Likes espresso" in prompt_text
         assert "cortado" in prompt_text
+        # The static instructions travel separately as the cacheable prefix.
+        prefix = llm.generate_text.await_args.kwargs["cached_prefix"]
+        assert "Be ruthless" in prefix
+        assert "Be ruthless" not in prompt_text
 
 
 class TestDeleteExpiredShortTerm:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 
 import aiosqlite
@@ -27,7 +28,9 @@ class _LLMStub:
         self._response = json.dumps(response_json)
         self._update_response = update_response or {"operation": "ADD"}
 
-    async def generate_text(self, *, model: str, prompt: str, max_tokens: int = 1024) -> str:
+    async def generate_text(
+        self, *, model: str, prompt: str, max_tokens: int = 1024, cached_prefix: str = ""
+    ) -> str:
         if "Choose exactly ONE operation" in prompt:
             return json.dumps(self._update_response)
         return self._response
@@ -90,14 +93,45 @@ async def test_extract_memories_skips_invalid_short_term(store) -> None:
     stored = await store.extract_memories(
         llm,
         model="claude-haiku-4-5",
-        user_msg="",
-        agent_msg="",
+        user_msg="Working from home",
+        agent_msg="Noted",
     )
 
     assert stored == 0
     assert await _count_rows(store.db_path, "short_term") == 0
 
 
+@pytest.mark.asyncio
+async def test_extract_memories_skips_small_talk_without_llm(store) -> None:
+    class _NoCallLLM:
+        async def generate_text(self, **kwargs) -> str:
+            raise AssertionError("extraction LLM must not be called for small talk")
+
+    for msg in ("ok thanks!", "Ciao", "👍", "good morning"):
+        assert await store.extract_memories(_NoCallLLM(), "m", msg, "Anytime") == 0
+    assert store._last_extraction is None  # no cooldown started
+    assert store._pending_turns == []
+
+    llm = _make_mock_llm([{"tier": "LONG_TERM", "subject": "matteo", "content": "No dairy"}])
+    assert await store.extract_memories(llm, "m", "no milk for me, thanks", "Noted") == 1
+
+
+@pytest.mark.asyncio
+async def test_small_talk_gate_keeps_answers_and_photo_turns(store) -> None:
+    """A yes/no (or "ok") answering the assistant's question, and a turn with no
+    text (a photo), still reach the extraction LLM."""
+    turns = [
+        ("no", "Are you vegetarian?", "Is not vegetarian"),
+        ("yes", "Got it. Should I book the usual table?", "Wants the usual table booked"),
+        ("ok", "Shall I remind you every Monday?", "Wants a reminder every Monday"),
+        ("", "Lovely photo of your dog Max!", "Has a dog called Max"),
+    ]
+    for user_msg, agent_msg, content in turns:
+        store._last_extraction = None
+        llm = _make_mock_llm([{"tier": "LONG_TERM", "subject": "matteo", "content": content}])
+        assert await store.extract_memories(llm, "m", user_msg, agent_msg) == 1, user_msg
+
+
 @pytest.mark.asyncio
 async def test_extract_memories_strips_markdown_code_fences(store) -> None:
     """LLMs sometimes wrap JSON in ```json ... ``` fences."""
@@ -211,6 +245,14 @@ class TestExtractJsonArray:
         result = _extract_json_array(raw)
         assert result == [{"content": "array [1, 2] inside"}]
 
+    def test_trailing_prose_with_brackets(self):
+        raw = 'Result: [{"a": "x]"}] (see [notes] above)'
+        assert _extract_json_array(raw) == [{"a": "x]"}]
+
+    def test_bracketed_preamble_skipped(self):
+        raw = 'Sure [see notes], here you go: [{"a": 1}]'
+        assert _extract_json_array(raw) == [{"a": 1}]
+
     def test_fence_with_preamble(self):
         raw = 'Here are the memories:\n```json\n[{"a": 1}]\n```\nDone.'
         assert _extract_json_array(raw) == [{"a": 1}]
@@ -264,7 +306,7 @@ async def test_cooldown_buffers_skipped_turn_for_next_extraction(store) -> None:
         def __init__(self):
             self.prompts: list[str] = []
 
-        async def generate_text(self, *, model, prompt, max_tokens=1024):
+        async def generate_text(self, *, model, prompt, max_tokens=1024, cached_prefix=""):
             self.prompts.append(prompt)
             return "[]"
 
@@ -290,12 +332,37 @@ async def test_cooldown_buffers_skipped_turn_for_next_extraction(store) -> None:
     assert "turn three" in llm.prompts[-1]
 
 
+@pytest.mark.asyncio
+async def test_existing_memories_ride_in_the_cached_prefix(store) -> None:
+    """The dedup list extends the cached prefix and stays byte-identical across
+    turns with no memory write; only the exchange varies in the prompt."""
+
+    class _RecordingStub:
+        def __init__(self):
+            self.calls: list[tuple[str, str]] = []
+
+        async def generate_text(self, *, model, prompt, max_tokens=1024, cached_prefix=""):
+            self.calls.append((cached_prefix, prompt))
+            return "[]"
+
+    await store._insert_long_term("preference", "matteo", "prefers oat milk")
+    llm = _RecordingStub()
+    for msg in ("booked the dentist", "the dentist moved to friday"):
+        await store.extract_memories(llm, "m", msg, "Noted", cooldown_seconds=0)
+
+    (prefix1, prompt1), (prefix2, prompt2) = llm.calls
+    assert prefix1 == prefix2
+    assert "- [LT] matteo: prefers oat milk" in prefix1
+    assert "oat milk" not in prompt1
+    assert "booked the dentist" in prompt1 and "moved to friday" in prompt2
+
+
 @pytest.mark.asyncio
 async def test_pending_turns_buffer_is_capped(store) -> None:
     """The cooldown buffer never grows past _MAX_PENDING_TURNS."""
 
     class _Stub:
-        async def generate_text(self, *, model, prompt, max_tokens=1024):
+        async def generate_text(self, *, model, prompt, max_tokens=1024, cached_prefix=""):
             return "[]"
 
     llm = _Stub()
@@ -457,3 +524,66 @@ async def test_short_term_dedup_skips_substring(store) -> None:
     )
     assert stored == 0
     assert await _count_rows(store.db_path, "short_term") == 1
+
+
+@pytest.mark.asyncio
+async def test_short_term_ttl_coerced_or_rejected(store) -> None:
+    """A numeric-string TTL is accepted; missing, non-numeric or non-positive ones are not."""
+    assert await store._store_short_term({"content": "Packing for Rome", "ttl_hours": "8"}) == 1
+    for ttl in (None, 0, -3, "soon", [8], float("nan"), float("inf")):
+        assert await store._store_short_term({"content": f"ttl {ttl!r}", "ttl_hours": ttl}) == 0
+    assert await _count_rows(store.db_path, "short_term") == 1
+
+
+@pytest.mark.asyncio
+async def test_short_term_dedup_is_case_insensitive_and_scoped(store) -> None:
+    """The containment check ignores case and only looks at shared + own scope."""
+    assert await store._store_short_term({"content": "At the gym", "ttl_hours": 2}) == 1
+    assert await store._store_short_term({"content": "at the GYM until 7", "ttl_hours": 2}) == 0
+    assert await store._store_short_term({"content": "the gym", "ttl_hours": 2}) == 0
+    assert await store._store_short_term({"content": "Cooking dinner", "ttl_hours": 2}) == 1
+
+    mem = {"content": "Reading in bed", "ttl_hours": 2}
+    assert await store._store_short_term(mem, scope="atlas") == 1
+    assert await store._store_short_term(mem, scope="lingua") == 1
+    assert await _count_rows(store.db_path, "short_term") == 4
+
+
+@pytest.mark.asyncio
+async def test_background_extraction_task_is_held_until_done() -> None:
+    """The agent keeps a strong reference to fire-and-forget extraction tasks."""
+    from core.agent import AgentCore
+
+    agent = object.__new__(AgentCore)
+    agent._background_tasks = set()
+    release = asyncio.Event()
+
+    task = agent._spawn_background(release.wait(), name="memory-extract-u1")
+    assert agent._background_tasks == {task}
+
+    release.set()
+    await task
+    await asyncio.sleep(0)  # let the done-callback run
+    assert agent._background_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_drain_background_waits_then_cancels_stragglers() -> None:
+    from core.agent import AgentCore
+
+    agent = object.__new__(AgentCore)
+    agent._background_tasks = set()
+    finished = []
+
+    async def _quick():
+        await asyncio.sleep(0.01)
+        finished.append("quick")
+
+    stuck = agent._spawn_background(asyncio.sleep(60), name="task-reflect-u1")
+    agent._spawn_background(_quick(), name="memory-extract-u1")
+
+    await agent.drain_background(timeout=0.2)
+
+    assert finished == ["quick"]
+    assert stuck.cancelled()
+    assert agent._background_tasks == set()
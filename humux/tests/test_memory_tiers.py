@@ -4,8 +4,10 @@ system, plus the in-place schema migration (issue #5)."""
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+import sqlite3
 import zlib
 
 import aiosqlite
@@ -13,7 +15,7 @@ import numpy as np
 import pytest
 
 from core.embeddings import cosine_similarity, cosine_to_matrix, pack_vector, unpack_vector
-from core.memory import MemoryStore
+from core.memory import _SQL_ACTIVE_SHORT_TERM, MemoryStore, _data_version
 
 
 class _HashEmbedder:
@@ -63,7 +65,7 @@ class _StubLLM:
         self._response = response
         self.calls = 0
 
-    async def generate_text(self, *, model, prompt, max_tokens=1024) -> str:
+    async def generate_text(self, *, model, prompt, max_tokens=1024, cached_prefix="") -> str:
         self.calls += 1
         return self._response
 
@@ -189,6 +191,107 @@ class TestEmbeddingWritePath:
         assert "lives in zurich" in block
 
 
+async def _no_row_reads(*_args):
+    raise AssertionError("cached section was re-read")
+
+
+class TestPromptCache:
+    async def test_recency_block_cached_until_a_write(self, store, monkeypatch):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        first = await store.format_for_prompt()
+
+        monkeypatch.setattr(store, "_get_both_tiers", _no_row_reads)
+        assert await store.format_for_prompt() == first
+        monkeypatch.undo()
+
+        await store._insert_long_term("fact", "matteo", "drinks oat milk")
+        assert "oat milk" in await store.format_for_prompt()
+
+    async def test_extraction_dedup_block_cached_until_a_write(self, store, monkeypatch):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        first = await store._existing_memories_block("")
+        assert "- [LT] matteo: lives in zurich" in first
+
+        monkeypatch.setattr(store, "_get_both_tiers", _no_row_reads)
+        assert await store._existing_memories_block("") == first
+        monkeypatch.undo()
+
+        await store._store_short_term({"content": "at the gym", "ttl_hours": 2})
+        assert "- [ST] at the gym" in await store._existing_memories_block("")
+
+    async def test_out_of_process_write_shows_on_next_prompt(self, store):
+        """A commit from another connection (the sqlite3 CLI skill) misses the
+        cache via PRAGMA data_version, without waiting out the TTL."""
+        assert await store.format_for_prompt() == ""
+        raw = sqlite3.connect(store.db_path)
+        with raw:
+            raw.execute(
+                "INSERT INTO long_term (category, subject, content) "
+                "VALUES ('fact', 'matteo', 'plays chess')"
+            )
+        raw.close()
+        assert "plays chess" in await store.format_for_prompt()
+
+    async def test_ttl_still_bounds_a_cached_section(self, store, monkeypatch):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        first = await store.format_for_prompt()
+        store._PROMPT_CACHE_TTL = 0.0
+        monkeypatch.setattr(store, "_get_both_tiers", _no_row_reads)
+        with pytest.raises(AssertionError, match="re-read"):
+            await store.format_for_prompt()
+        assert first
+
+    async def test_both_tiers_read_in_one_worker_call(self, store, monkeypatch):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        await store._store_short_term({"content": "at the gym", "ttl_hours": 2})
+        real_read = store._read
+        calls = []
+
+        async def _counting_read(fn):
+            calls.append(fn)
+            return await real_read(fn)
+
+        monkeypatch.setattr(store, "_read", _counting_read)
+        block = await store.format_for_prompt()
+
+        assert "lives in zurich" in block and "at the gym" in block
+        assert [fn for fn in calls if fn is not _data_version] == calls[1:]  # cache check
+        assert len(calls) == 2
+
+    async def test_prompt_reads_keep_sqlite_rows(self, store):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        await store._store_short_term({"content": "at the gym", "context": "", "ttl_hours": 2})
+        long_term, short_term = await store._get_both_tiers()
+        assert [type(r) for r in long_term + short_term] == [sqlite3.Row, sqlite3.Row]
+        assert await store.format_for_prompt() == (
+            "## Long-term memories\n- [fact] matteo: lives in zurich\n\n"
+            "## Current context (short-term)\n- at the gym"
+        )
+
+    async def test_short_term_capped_to_newest(self, store):
+        store.short_term_limit = 2
+
+        def _seed(db):
+            with db:
+                db.executemany(
+                    "INSERT INTO short_term (content, expires_at, created_at) "
+                    "VALUES (?, '2999-01-01 00:00:00', ?)",
+                    [(f"note {i}", f"2026-01-0{i} 00:00:00") for i in range(1, 5)],
+                )
+
+        await store._run(_seed)
+        assert [m["content"] for m in await store.get_short_term()] == ["note 4", "note 3"]
+        block = await store.format_for_prompt()
+        assert "note 4" in block and "note 2" not in block
+
+    async def test_relevance_block_is_not_cached(self, embed_store):
+        await embed_store._insert_long_term("fact", "matteo", "lives in zurich")
+        await embed_store.format_for_prompt(query="where does matteo live")
+        await _insert(embed_store, "matteo", "commutes to zurich by train")
+        block = await embed_store.format_for_prompt(query="matteo zurich commute")
+        assert "commutes" in block
+
+
 # -- recall_memory: deliberate full-store semantic lookup (issue #47) --
 
 
@@ -445,6 +548,69 @@ class TestMigration:
         assert any(r["content"] == "old" for r in rows)
 
 
+class TestConnection:
+    async def test_one_wal_connection_reused_until_closed(self, store):
+        conn = store._conn
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        await store.get_short_term()
+        assert store._conn is conn
+        mode = await store._run(lambda db: db.execute("PRAGMA journal_mode").fetchone()[0])
+        assert mode == "wal"
+        cache = await store._run(lambda db: db.execute("PRAGMA cache_size").fetchone()[0])
+        assert cache == -20000
+
+        await store.close()
+        assert store._conn is None
+        assert [r["content"] for r in await store.get_long_term()] == ["lives in zurich"]
+        await store.close()
+
+    async def test_close_waits_for_a_cancelled_write(self, store):
+        """Cancelling a call doesn't stop its worker thread; close() waits for it."""
+        import threading
+        import time
+
+        await store._ensure_schema()
+        started, finished = threading.Event(), []
+
+        def _slow_write(db):
+            started.set()
+            time.sleep(0.2)
+            with db:
+                db.execute(
+                    "INSERT INTO long_term (category, subject, content) VALUES ('f', 's', 'c')"
+                )
+            finished.append(True)
+
+        task = asyncio.create_task(store._run(_slow_write))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        await asyncio.wait([task])
+        await store.close()  # would close the connection mid-write without the lock
+        assert finished == [True]
+        assert [r["content"] for r in await store.get_long_term()] == ["c"]
+        await store.close()
+
+    async def test_reads_do_not_wait_for_the_writer(self, store):
+        await store._insert_long_term("fact", "matteo", "lives in zurich")
+        with store._db_lock:  # a write in flight on the writer connection
+            rows = await asyncio.wait_for(store.get_long_term(), timeout=2)
+        assert [r["content"] for r in rows] == ["lives in zurich"]
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await store._read(lambda db: db.execute("DELETE FROM long_term"))
+
+        await store.close()
+        assert store._read_conn is None
+
+    async def test_active_short_term_read_walks_created_index(self, store):
+        sql = _SQL_ACTIVE_SHORT_TERM.format(scope="")
+        plan = await store._run(
+            lambda db: db.execute(f"EXPLAIN QUERY PLAN {sql}", ("x", 10)).fetchall()
+        )
+        details = [row[3] for row in plan]
+        assert any("idx_st_created" in d for d in details)
+        assert not any("TEMP B-TREE" in d for d in details)  # no sort of every row
+
+
 async def _row_all(store: MemoryStore) -> list[dict]:
     async with aiosqlite.connect(store.db_path) as db:
         db.row_factory = aiosqlite.Row
@@ -19,6 +19,13 @@ from core.scheduler import (
 )
 
 
+def _stub_agent(channels: dict, **attrs) -> SimpleNamespace:
+    """Agent stub whose outbound channel lookup reads ``channels``."""
+    return SimpleNamespace(
+        channels=channels, get_channel=AsyncMock(side_effect=channels.get), **attrs
+    )
+
+
 def _make_scheduler(job_store) -> AgentScheduler:
     """Build an AgentScheduler with a stub agent (UTC tz) and the given job store."""
     agent = SimpleNamespace(config=SimpleNamespace(agent=SimpleNamespace(timezone="UTC")))
@@ -93,8 +100,8 @@ async def test_run_agent_task_sends_to_owner() -> None:
     # allowlist (#133); the owner is its first allowed user.
     channel = AsyncMock()
     channel.config = SimpleNamespace(allowed_user_ids=[123])
-    agent = SimpleNamespace(
-        channels={"telegram": channel},
+    agent = _stub_agent(
+        {"telegram": channel},
         process=AsyncMock(return_value=SimpleNamespace(text="done")),
         config=SimpleNamespace(),
         job_store=None,
@@ -114,8 +121,8 @@ async def test_run_agent_task_agent_job_generates_as_agent() -> None:
     # bot to its own owner (the bot's allowlist, not the global one).
     channel = AsyncMock()
     channel.config = SimpleNamespace(allowed_user_ids=[99])
-    agent = SimpleNamespace(
-        channels={"telegram:coach": channel},
+    agent = _stub_agent(
+        {"telegram:coach": channel},
         process=AsyncMock(return_value=SimpleNamespace(text="done")),
         config=SimpleNamespace(
             channels=SimpleNamespace(telegram=SimpleNamespace(allowed_user_ids=[1]))
@@ -137,8 +144,8 @@ async def test_run_agent_task_runs_as_origin_agent_and_chat() -> None:
     # Issue #71: a job carrying an origin agent + chat runs AS that agent and
     # is delivered back to that chat — not the default identity in the owner DM.
     channel = AsyncMock()
-    agent = SimpleNamespace(
-        channels={"telegram": channel},
+    agent = _stub_agent(
+        {"telegram": channel},
         process=AsyncMock(return_value=SimpleNamespace(text="done")),
         config=SimpleNamespace(
             channels=SimpleNamespace(telegram=SimpleNamespace(allowed_user_ids=[123]))
@@ -166,8 +173,8 @@ async def test_run_agent_task_marks_oneshot_done() -> None:
     )
     job_store.update_status = AsyncMock()
 
-    agent = SimpleNamespace(
-        channels={"telegram": channel},
+    agent = _stub_agent(
+        {"telegram": channel},
         process=AsyncMock(return_value=SimpleNamespace(text="result")),
         config=SimpleNamespace(
             channels=SimpleNamespace(telegram=SimpleNamespace(allowed_user_ids=[42]))
@@ -185,8 +192,8 @@ async def test_run_agent_task_marks_oneshot_done() -> None:
 async def test_run_agent_task_silent_no_updates() -> None:
     """Silent agent tasks with no meaningful response should not send a message."""
     channel = AsyncMock()
-    agent = SimpleNamespace(
-        channels={"telegram": channel},
+    agent = _stub_agent(
+        {"telegram": channel},
         process=AsyncMock(return_value=SimpleNamespace(text="[NO_UPDATES]")),
         config=SimpleNamespace(
             channels=SimpleNamespace(telegram=SimpleNamespace(allowed_user_ids=[42]))
@@ -204,8 +211,8 @@ async def test_run_agent_task_silent_no_updates() -> None:
 @pytest.mark.asyncio
 async def test_run_agent_task_no_channel() -> None:
     """If the target channel is not registered, the response is dropped."""
-    agent = SimpleNamespace(
-        channels={},
+    agent = _stub_agent(
+        {},
         process=AsyncMock(return_value=SimpleNamespace(text="done")),
         config=SimpleNamespace(
             channels=SimpleNamespace(telegram=SimpleNamespace(allowed_user_ids=[42]))
@@ -259,7 +266,7 @@ async def test_retire_if_past_ignores_cron() -> None:
 async def test_load_jobs_retires_past_oneshot_and_skips_registration() -> None:
     """load_jobs marks a past one-shot done and does not register it in APScheduler."""
     job_store = AsyncMock()
-    job_store.list_jobs = AsyncMock(
+    job_store.list_active_for_scheduler = AsyncMock(
         return_value=[
             {
                 "id": "stale",
@@ -273,8 +280,8 @@ async def test_load_jobs_retires_past_oneshot_and_skips_registration() -> None:
         ]
     )
     sched = _make_scheduler(job_store)
-    await sched.load_jobs()
-    job_store.update_status.assert_awaited_once_with("stale", "done")
+    assert await sched.load_jobs() == 0
+    job_store.update_statuses.assert_awaited_once_with([("stale", "done")])
     assert sched.scheduler.get_job("stale") is None
 
 
@@ -282,7 +289,7 @@ async def test_load_jobs_retires_past_oneshot_and_skips_registration() -> None:
 async def test_load_jobs_registers_future_oneshot() -> None:
     """A future one-shot is registered, not retired."""
     job_store = AsyncMock()
-    job_store.list_jobs = AsyncMock(
+    job_store.list_active_for_scheduler = AsyncMock(
         return_value=[
             {
                 "id": "future",
@@ -296,6 +303,6 @@ async def test_load_jobs_registers_future_oneshot() -> None:
         ]
     )
     sched = _make_scheduler(job_store)
-    await sched.load_jobs()
-    job_store.update_status.assert_not_awaited()
+    assert await sched.load_jobs() == 1
+    job_store.update_statuses.assert_not_awaited()
     assert sched.scheduler.get_job("future") is not None
@@ -482,6 +482,7 @@ async def test_run_subagent_task_delivers_to_owner() -> None:
     channel.config = SimpleNamespace(allowed_user_ids=[7])
     agent = SimpleNamespace(
         channels={"telegram": channel},
+        get_channel=AsyncMock(return_value=channel),
         run_subagent=AsyncMock(return_value={"ok": True, "result": "scheduled out"}),
         config=SimpleNamespace(),
         job_store=None,
@@ -494,6 +495,35 @@ async def test_run_subagent_task_delivers_to_owner() -> None:
     channel.send.assert_awaited_once_with(7, "scheduled out")
 
 
+@pytest.mark.asyncio
+async def test_run_subagent_task_waits_for_a_connecting_bot() -> None:
+    """A job firing before its bot registered still resolves the owner once it has."""
+    from core.scheduler import run_subagent_task, set_agent_context
+
+    channel = AsyncMock()
+    channel.config = SimpleNamespace(allowed_user_ids=[7])
+    channels: dict = {}
+
+    async def _get_channel(name):
+        channels[name] = channel  # the bot finishes connecting
+        return channel
+
+    agent = SimpleNamespace(
+        channels=channels,
+        get_channel=_get_channel,
+        run_subagent=AsyncMock(return_value={"ok": True, "result": "scheduled out"}),
+        config=SimpleNamespace(),
+        job_store=None,
+    )
+    set_agent_context(agent)
+
+    await run_subagent_task(agent_name="analyst", task="weekly review", channel="telegram")
+
+    kwargs = agent.run_subagent.await_args.kwargs
+    assert (kwargs["origin_user_id"], kwargs["origin_chat_id"]) == ("7", "7")
+    channel.send.assert_awaited_once_with(7, "scheduled out")
+
+
 # ---------------------------------------------------------------------------
 # Caller-sized runs: max_steps / token_budget / thinking_effort + file handoff
 # ---------------------------------------------------------------------------
@@ -1002,6 +1002,40 @@ async def test_undeliverable_approval_fails_closed(agent) -> None:
     assert not agent.permissions._pending  # pending request dropped, no leak
 
 
+class _ApprovingChannel:
+    def __init__(self) -> None:
+        import asyncio
+
+        self.asked = asyncio.Event()
+
+    async def send_approval_request(self, user_id, request_id, description, image_path=None):
+        self.request_id = request_id
+        self.asked.set()
+
+
+@pytest.mark.asyncio
+async def test_approval_waits_for_a_connecting_bot_and_never_auto_approves(agent) -> None:
+    # Bots connect in the background after start: an approval asked in that
+    # window waits for the bot instead of treating it as "no channel".
+    import asyncio
+
+    ch = _ApprovingChannel()
+
+    async def _connect():
+        await asyncio.sleep(0.01)
+        agent.channels["telegram"] = ch
+
+    agent.channel_startup = asyncio.gather(_connect())
+    pending = asyncio.create_task(agent._await_approval("Run command: ls", "telegram", "u1"))
+    await asyncio.wait_for(ch.asked.wait(), timeout=2)
+    agent.permissions.resolve_approval(ch.request_id, False)
+    assert await pending == "denied"
+
+    # A bot that never connected fails closed rather than auto-approving.
+    agent.channels.pop("telegram")
+    assert await agent._await_approval("Run command: ls", "telegram:coach", "u1") == "skipped"
+
+
 # ---------------------------------------------------------------------------
 # Email tools build valid himalaya v1.2.0 commands
 # ---------------------------------------------------------------------------
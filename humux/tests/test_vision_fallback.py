@@ -20,6 +20,13 @@ def test_model_supports_vision_heuristic() -> None:
     assert model_supports_vision("google", "gemini-flash-latest")
 
 
+def test_attachment_base64_encoded_once() -> None:
+    att = Attachment(data=b"\x89PNG fake", mime_type="image/png")
+    encoded = att.base64_data
+    assert att.to_anthropic_block()["source"]["data"] is encoded
+    assert att.to_openai_block()["image_url"]["url"] == f"data:image/png;base64,{encoded}"
+
+
 class _FakeLLM:
     """Stand-in vision model: counts calls, returns a fixed caption."""
 